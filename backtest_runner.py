@@ -12,11 +12,15 @@ Usage:
     python backtest_runner.py --ticker AAPL --strategy all
     python backtest_runner.py --ticker AAPL --strategy TradingAgents
     python backtest_runner.py --all --start-date 2024-06-01 --end-date 2024-11-30
+    python backtest_runner.py --all --strategy all --jobs 8
 """
 
 import argparse
+import contextlib
+import io
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
@@ -27,7 +31,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from backtesting import (
     Backtester,
+    ConsoleReporter,
     DataLoader,
+    DecisionCache,
+    ResultsStore,
     BuyAndHoldStrategy,
     MACDStrategy,
     RSIStrategy,
@@ -92,21 +99,77 @@ def parse_args():
         help="Output directory for results (default: backtesting/results)",
     )
 
+    parser.add_argument(
+        "--results-db",
+        type=str,
+        default=None,
+        help="Also append results to this SQLite results store (e.g. backtesting/results/results.db)",
+    )
+
     parser.add_argument(
         "--tradingagents",
         action="store_true",
         help="Include TradingAgents strategy (requires API keys)",
     )
 
+    parser.add_argument(
+        "--mode",
+        type=str,
+        default="event",
+        choices=["event", "vectorized", "streaming"],
+        help="Simulation mode for benchmark strategies (default: event)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for benchmark (ticker, strategy) runs (default: 1)",
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Start TradingAgents runs over instead of resuming from their checkpoint",
+    )
+
+    parser.add_argument(
+        "--decision-cache-dir",
+        type=str,
+        default="backtesting/decision_cache",
+        help="Directory of cached TradingAgents decisions (default: backtesting/decision_cache)",
+    )
+
+    parser.add_argument(
+        "--decision-workers",
+        type=int,
+        default=1,
+        help="TradingAgents trading days to decide concurrently (default: 1)",
+    )
+
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Skip trade logs and daily lines; print progress at most every 10 seconds",
+    )
+
     return parser.parse_args()
 
 
+def make_observers(quiet: bool) -> list:
+    """Console observers for a Backtester."""
+    if quiet:
+        return [ConsoleReporter(min_interval=10.0, show_trades=False, show_days=False)]
+    return [ConsoleReporter()]
+
+
 def run_benchmark_backtests(
     backtester: Backtester,
     ticker: str,
     start_date: datetime,
     end_date: datetime,
     strategies: list,
+    mode: str = "event",
 ) -> list:
     """Run benchmark strategy backtests."""
     results = []
@@ -128,6 +191,7 @@ def run_benchmark_backtests(
                     start_date=start_date,
                     end_date=end_date,
                     strategy=strategy_map[strategy_name],
+                    mode=mode,
                 )
                 results.append(result)
             except Exception as e:
@@ -136,13 +200,109 @@ def run_benchmark_backtests(
     return results
 
 
+def _warm_data_cache(cell: tuple) -> str:
+    """
+    Load one ticker's data so its file cache exists before strategy runs.
+
+    Runs in a worker process; console output is captured and returned.
+    """
+    ticker, start_date, end_date = cell
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            DataLoader().load_data(ticker, start_date, end_date)
+        except Exception:
+            # Each strategy run retries the load and reports the error itself
+            pass
+    return buffer.getvalue()
+
+
+def _run_benchmark_cell(cell: tuple) -> tuple:
+    """
+    Run one (ticker, strategy) benchmark backtest with its own Backtester.
+
+    Runs in a worker process; console output is captured and returned with
+    the results so the parent can replay it in serial order.
+    """
+    ticker, strategy_name, start_date, end_date, initial_capital, mode, quiet = cell
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        backtester = Backtester(
+            initial_capital=initial_capital, observers=make_observers(quiet)
+        )
+        results = run_benchmark_backtests(
+            backtester, ticker, start_date, end_date, [strategy_name], mode=mode
+        )
+    return buffer.getvalue(), results
+
+
+def submit_benchmark_backtests(
+    executor: ProcessPoolExecutor,
+    tickers: list,
+    start_date: datetime,
+    end_date: datetime,
+    strategies: list,
+    initial_capital: float,
+    mode: str = "event",
+    quiet: bool = False,
+) -> dict:
+    """
+    Submit benchmark backtests for every (ticker, strategy) cell to a pool.
+
+    Data for each ticker is loaded once up front so workers share the file
+    cache instead of downloading the same ticker concurrently.
+
+    Returns:
+        Dict mapping ticker to (warm-up output, list of futures in strategy order)
+    """
+    warm_logs = executor.map(
+        _warm_data_cache, [(ticker, start_date, end_date) for ticker in tickers]
+    )
+    pending = {}
+    for ticker, warm_log in zip(tickers, warm_logs):
+        futures = [
+            executor.submit(
+                _run_benchmark_cell,
+                (ticker, name, start_date, end_date, initial_capital, mode, quiet),
+            )
+            for name in strategies
+        ]
+        pending[ticker] = (warm_log, futures)
+    return pending
+
+
+def collect_benchmark_backtests(
+    backtester: Backtester,
+    warm_log: str,
+    futures: list,
+) -> list:
+    """
+    Gather one ticker's pooled results, replaying worker output in order.
+
+    Results are also registered on the parent backtester, as in a serial run.
+    """
+    print(warm_log, end="")
+    results = []
+    for future in futures:
+        log, cell_results = future.result()
+        print(log, end="")
+        for result in cell_results:
+            backtester.results[f"{result['ticker']}_{result['strategy']}"] = result
+        results.extend(cell_results)
+    return results
+
+
 def run_tradingagents_backtest(
     backtester: Backtester,
     ticker: str,
     start_date: datetime,
     end_date: datetime,
+    output_dir: str = "backtesting/results",
+    resume: bool = True,
+    decision_cache_dir: str = "backtesting/decision_cache",
+    decision_workers: int = 1,
 ) -> dict:
-    """Run TradingAgents backtest."""
+    """Run TradingAgents backtest with a per-run checkpoint and decision cache."""
     load_dotenv()
     config = DEFAULT_CONFIG.copy()
 
@@ -172,12 +332,20 @@ def run_tradingagents_backtest(
         # Import TradingAgents
         from tradingagents.graph.trading_graph import TradingAgentsGraph
 
+        def make_graph():
+            return TradingAgentsGraph(
+                selected_analysts=["market", "social", "news", "fundamentals"],
+                debug=False,
+                config=config,
+                recursion_limit=150,
+            )
+
         print("\nInitializing TradingAgents...")
-        trading_graph = TradingAgentsGraph(
-            selected_analysts=["market", "social", "news", "fundamentals"],
-            debug=False,
-            config=config,
-            recursion_limit=150,
+        trading_graph = make_graph()
+
+        checkpoint_path = os.path.join(
+            output_dir,
+            f"{ticker}_TradingAgents_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}_checkpoint.jsonl",
         )
 
         result = backtester.run_tradingagents_backtest(
@@ -185,6 +353,11 @@ def run_tradingagents_backtest(
             start_date=start_date,
             end_date=end_date,
             trading_graph=trading_graph,
+            checkpoint_path=checkpoint_path,
+            resume=resume,
+            decision_cache=DecisionCache(decision_cache_dir),
+            max_workers=decision_workers,
+            graph_factory=make_graph,
         )
 
         return result
@@ -222,7 +395,9 @@ def main():
         strategies = [args.strategy]
 
     # Initialize backtester
-    backtester = Backtester(initial_capital=args.initial_capital)
+    backtester = Backtester(
+        initial_capital=args.initial_capital, observers=make_observers(args.quiet)
+    )
 
     print("=" * 80)
     print("TRADINGAGENTS BACKTESTING FRAMEWORK")
@@ -235,6 +410,30 @@ def main():
         print("Include TradingAgents: Yes")
     print("=" * 80)
 
+    run_benchmarks = args.strategy in ["all", "buyhold", "macd", "rsi", "sma", "kdj", "zmr"]
+
+    # Fetch every ticker's prices in grouped requests instead of one by one
+    if len(tickers) > 1:
+        backtester.data_loader.prefetch(tickers, start_date, end_date)
+
+    # Spread benchmark (ticker, strategy) cells over worker processes
+    executor = None
+    pending = {}
+    if run_benchmarks and args.jobs > 1:
+        executor = ProcessPoolExecutor(max_workers=args.jobs)
+        pending = submit_benchmark_backtests(
+            executor,
+            tickers,
+            start_date,
+            end_date,
+            strategies,
+            args.initial_capital,
+            mode=args.mode,
+            quiet=args.quiet,
+        )
+
+    store = ResultsStore(args.results_db) if args.results_db else None
+
     # Run backtests for each ticker
     all_results = {}
 
@@ -246,16 +445,29 @@ def main():
         ticker_results = []
 
         # Run benchmark strategies
-        if args.strategy in ["all", "buyhold", "macd", "rsi", "sma", "kdj", "zmr"]:
-            benchmark_results = run_benchmark_backtests(
-                backtester, ticker, start_date, end_date, strategies
-            )
+        if run_benchmarks:
+            if executor is not None:
+                benchmark_results = collect_benchmark_backtests(
+                    backtester, *pending[ticker]
+                )
+            else:
+                benchmark_results = run_benchmark_backtests(
+                    backtester, ticker, start_date, end_date, strategies,
+                    mode=args.mode,
+                )
             ticker_results.extend(benchmark_results)
 
         # Run TradingAgents if requested
         if args.tradingagents or args.strategy == "TradingAgents":
             ta_result = run_tradingagents_backtest(
-                backtester, ticker, start_date, end_date
+                backtester,
+                ticker,
+                start_date,
+                end_date,
+                output_dir=args.output_dir,
+                resume=not args.no_resume,
+                decision_cache_dir=args.decision_cache_dir,
+                decision_workers=args.decision_workers,
             )
             if ta_result:
                 ticker_results.append(ta_result)
@@ -271,9 +483,17 @@ def main():
                 f"{ticker}_{result['strategy']}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.json",
             )
             backtester.save_results(result, output_file)
+        if store is not None and ticker_results:
+            store.append_many(ticker_results)
 
         all_results[ticker] = ticker_results
 
+    if executor is not None:
+        executor.shutdown()
+    if store is not None:
+        print(f"Results appended to: {args.results_db}")
+        store.close()
+
     # Final summary
     print(f"\n\n{'=' * 80}")
     print("BACKTEST COMPLETE")
@@ -13,6 +13,7 @@ Based on the TradingAgents paper (arXiv:2412.20138):
 
 from .portfolio import Portfolio, Position
 from .metrics import MetricsCalculator
+from .bootstrap import BootstrapResult, bootstrap_metrics
 from .benchmarks import (
     BuyAndHoldStrategy,
     MACDStrategy,
@@ -22,12 +23,23 @@ from .benchmarks import (
     ZMRStrategy,
 )
 from .backtester import Backtester
-from .data_loader import DataLoader
+from .events import BacktestObserver, ConsoleReporter, EventDispatcher
+from .data_loader import DataLoader, PriceSeries
+from .sources import PriceSource, SyntheticSource, YFinanceSource
+from .streaming import Bar
+from .indicators import IndicatorCache
+from .sweep import ParameterSweep, SweepResult
+from .walk_forward import WalkForwardOptimizer, WalkForwardResult
+from .multi_asset import MultiAssetBacktester, PriceMatrix
+from .checkpoint import DecisionCache, DecisionCheckpoint, config_fingerprint
+from .results_store import ResultsStore
 
 __all__ = [
     "Portfolio",
     "Position",
     "MetricsCalculator",
+    "BootstrapResult",
+    "bootstrap_metrics",
     "BuyAndHoldStrategy",
     "MACDStrategy",
     "RSIStrategy",
@@ -35,5 +47,24 @@ __all__ = [
     "KDJStrategy",
     "ZMRStrategy",
     "Backtester",
+    "BacktestObserver",
+    "ConsoleReporter",
+    "EventDispatcher",
     "DataLoader",
+    "PriceSeries",
+    "PriceSource",
+    "SyntheticSource",
+    "YFinanceSource",
+    "Bar",
+    "IndicatorCache",
+    "ParameterSweep",
+    "SweepResult",
+    "WalkForwardOptimizer",
+    "WalkForwardResult",
+    "MultiAssetBacktester",
+    "PriceMatrix",
+    "DecisionCache",
+    "DecisionCheckpoint",
+    "config_fingerprint",
+    "ResultsStore",
 ]
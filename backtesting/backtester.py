@@ -4,14 +4,21 @@ Main backtesting engine.
 Simulates trading over historical periods and calculates performance metrics.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Callable, List, Any
+import numpy as np
 import pandas as pd
 
 from .portfolio import Portfolio
 from .metrics import MetricsCalculator, PerformanceMetrics
-from .data_loader import DataLoader
+from .data_loader import DataLoader, PriceSeries
 from .benchmarks import BaseStrategy
+from .streaming import Bar
+from .checkpoint import DecisionCache, DecisionCheckpoint, config_fingerprint
+from .events import BarEvent, ConsoleReporter, EventDispatcher, RunInfo, TradeEvent
+from .results_store import ResultsStore
 
 
 class Backtester:
@@ -30,6 +37,7 @@ class Backtester:
         self,
         initial_capital: float = 100000.0,
         data_loader: Optional[DataLoader] = None,
+        observers: Optional[List[Any]] = None,
     ):
         """
         Initialize backtester.
@@ -37,10 +45,17 @@ class Backtester:
         Args:
             initial_capital: Starting portfolio value
             data_loader: DataLoader instance (creates new one if None)
+            observers: Event observers (see backtesting.events); defaults to
+                a ConsoleReporter, pass [] to run silently
         """
         self.initial_capital = initial_capital
         self.data_loader = data_loader or DataLoader()
         self.results: Dict[str, Any] = {}
+        self.events = EventDispatcher(
+            [ConsoleReporter()] if observers is None else observers
+        )
+
+    MODES = ("event", "vectorized", "streaming")
 
     def run_backtest(
         self,
@@ -48,6 +63,7 @@ class Backtester:
         start_date: datetime,
         end_date: datetime,
         strategy: BaseStrategy,
+        mode: str = "event",
     ) -> Dict[str, Any]:
         """
         Run backtest for a single ticker with a strategy.
@@ -57,85 +73,71 @@ class Backtester:
             start_date: Start date for backtest
             end_date: End date for backtest
             strategy: Trading strategy to test
+            mode: Simulation mode:
+                - "event": call generate_signal() on the history up to
+                  each trading day
+                - "vectorized": generate the whole signal series in one
+                  pass and value the book with NumPy arrays
+                - "streaming": feed bars one at a time through on_bar(),
+                  so per-day cost does not grow with history length
 
         Returns:
             Dictionary with backtest results
         """
-        print(f"\n{'=' * 60}")
-        print(f"Running Backtest: {ticker}")
-        print(f"Strategy: {strategy.name}")
-        print(f"Period: {start_date.date()} to {end_date.date()}")
-        print(f"Initial Capital: ${self.initial_capital:,.2f}")
-        print(f"{'=' * 60}\n")
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode!r}, choose from {self.MODES}")
+        if mode == "vectorized" and not strategy.supports_vectorized:
+            raise ValueError(
+                f"Strategy {strategy.name} does not support vectorized backtesting"
+            )
+        if mode == "streaming" and not strategy.supports_streaming:
+            raise ValueError(
+                f"Strategy {strategy.name} does not support streaming backtesting"
+            )
 
-        # Load data
-        data = self.data_loader.load_data(ticker, start_date, end_date)
-
-        # Initialize portfolio
-        portfolio = Portfolio(self.initial_capital)
+        # Load data (read-only; strategies only slice it)
+        data = self.data_loader.load_data(ticker, start_date, end_date, copy=False)
+        series = PriceSeries(data)
+        data = series.data
 
         # Get trading days in range
-        trading_days = self.data_loader.get_trading_days(ticker, start_date, end_date)
+        trading_days = series.trading_days(start_date, end_date)
 
         if len(trading_days) == 0:
             raise ValueError(f"No trading days found for {ticker} in specified range")
 
-        print(f"Total trading days: {len(trading_days)}")
-
-        # Run simulation
-        for i, date in enumerate(trading_days):
-            # Get data up to current date
-            current_data = self.data_loader.get_data_up_to(data, date)
-
-            if len(current_data) < 2:
-                continue
-
-            # Get current price
-            current_price = current_data["Close"].iloc[-1]
-            prices = {ticker: current_price}
-
-            # Generate trading signal
-            signal = strategy.generate_signal(ticker, date, current_data)
-
-            # Execute trades
-            if signal == "BUY":
-                # Calculate position size (invest all cash)
-                cash = portfolio.cash
-                if cash > 0:
-                    shares = cash / current_price
-                    if portfolio.buy(ticker, shares, current_price, date):
-                        print(
-                            f"[{date.date()}] BUY {shares:.2f} shares @ ${current_price:.2f}"
-                        )
-
-            elif signal == "SELL":
-                # Sell all shares
-                position = portfolio.get_position(ticker)
-                shares_to_sell = position.shares
-                if shares_to_sell > 0:
-                    portfolio.sell(ticker, shares_to_sell, current_price, date)
-                    print(
-                        f"[{date.date()}] SELL {shares_to_sell:.2f} shares @ ${current_price:.2f}"
-                    )
-
-            # Record snapshot after trading
-            portfolio.record_snapshot(date, prices)
+        # Initialize portfolio
+        portfolio = Portfolio(self.initial_capital, capacity=len(trading_days))
+
+        self.events.start(
+            RunInfo(
+                kind="benchmark",
+                ticker=ticker,
+                strategy=strategy.name,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=self.initial_capital,
+                n_days=len(trading_days),
+            )
+        )
 
-            # Progress indicator
-            if (i + 1) % 20 == 0 or i == len(trading_days) - 1:
-                progress = (i + 1) / len(trading_days) * 100
-                print(f"Progress: {progress:.1f}% ({i + 1}/{len(trading_days)} days)")
+        if mode == "vectorized":
+            portfolio_df = self._simulate_vectorized(
+                ticker, data, start_date, end_date, strategy, portfolio
+            )
+        elif mode == "streaming":
+            portfolio_df = self._simulate_streaming(
+                ticker, data, start_date, end_date, strategy, portfolio
+            )
+        else:
+            portfolio_df = self._simulate_loop(
+                ticker, series, start_date, end_date, strategy, portfolio
+            )
 
         # Get final portfolio value
-        final_data = data[data.index <= end_date]
-        if len(final_data) > 0:
-            final_price = final_data["Close"].iloc[-1]
-            final_value = portfolio.get_total_value({ticker: final_price})
-        else:
-            final_value = portfolio.cash
+        final_value = self._final_value(portfolio, ticker, series, end_date)
 
         # Calculate metrics
-        portfolio_df = portfolio.get_history_df()
         trades_df = portfolio.get_trades_df()
 
         metrics = MetricsCalculator.calculate_all_metrics(
@@ -162,61 +164,369 @@ class Backtester:
         # Store results
         self.results[f"{ticker}_{strategy.name}"] = results
 
-        # Print summary
-        self._print_summary(results)
+        self.events.finish(results)
 
         return results
 
+    def _simulate_loop(
+        self,
+        ticker: str,
+        series: PriceSeries,
+        start_date: datetime,
+        end_date: datetime,
+        strategy: BaseStrategy,
+        portfolio: Portfolio,
+    ) -> pd.DataFrame:
+        """
+        Event-driven simulation: one generate_signal() call per trading day.
+
+        Each day's history is a positional view into the loaded frame, so
+        the loop itself does no per-day work proportional to history length.
+        """
+        first_day, stop = series.bounds(start_date, end_date)
+        trading_days = series.index[first_day:stop]
+        on_bar = self.events.bar_handler()
+
+        for i, date in enumerate(trading_days):
+            # Get data up to current date
+            end = first_day + i + 1
+            if end < 2:
+                continue
+            current_data = series.window(end)
+
+            # Get current price
+            current_price = series.close[end - 1]
+            prices = {ticker: current_price}
+
+            # Generate trading signal
+            signal = strategy.generate_signal(ticker, date, current_data)
+
+            # Execute trades
+            self._execute_signal(portfolio, ticker, signal, current_price, date)
+
+            # Record snapshot after trading
+            portfolio.record_snapshot(date, prices)
+
+            if on_bar is not None:
+                on_bar(
+                    BarEvent(
+                        ticker, date, i + 1, len(trading_days), current_price, signal, portfolio
+                    )
+                )
+
+        return portfolio.get_history_df()
+
+    def _simulate_streaming(
+        self,
+        ticker: str,
+        data: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+        strategy: BaseStrategy,
+        portfolio: Portfolio,
+    ) -> pd.DataFrame:
+        """
+        Streaming simulation: one O(1) on_bar() call per bar.
+
+        Warm-up bars before the backtest window only advance the strategy's
+        indicator state. Produces the same history and trades as
+        _simulate_loop().
+        """
+        index = data.index
+        first_day = index.searchsorted(pd.Timestamp(start_date), side="left")
+        stop = index.searchsorted(pd.Timestamp(end_date), side="right")
+        n_days = stop - first_day
+
+        columns = [
+            data[col].to_numpy() for col in ("Open", "High", "Low", "Close", "Volume")
+        ]
+        strategy.reset_stream()
+        on_bar = self.events.bar_handler()
+
+        for i, bar_values in enumerate(zip(index[:stop], *columns)):
+            bar = Bar(*bar_values)
+
+            if i < first_day:
+                strategy.update(bar)
+                continue
+
+            # Matches the event loop, which skips days with < 2 bars of history
+            if i < 1:
+                strategy.update(bar)
+                continue
+
+            signal = strategy.on_bar(bar)
+            self._execute_signal(portfolio, ticker, signal, bar.close, bar.date)
+            portfolio.record_snapshot(bar.date, {ticker: bar.close})
+
+            if on_bar is not None:
+                on_bar(
+                    BarEvent(
+                        ticker, bar.date, i - first_day + 1, n_days, bar.close, signal, portfolio
+                    )
+                )
+
+        return portfolio.get_history_df()
+
+    def _final_value(
+        self,
+        portfolio: Portfolio,
+        ticker: str,
+        series: PriceSeries,
+        end_date: datetime,
+    ) -> float:
+        """Value the portfolio at the last close on or before end_date."""
+        stop = series.position(end_date)
+        if stop == 0:
+            return portfolio.cash
+        return portfolio.get_total_value({ticker: series.close[stop - 1]})
+
+    def _execute_signal(
+        self,
+        portfolio: Portfolio,
+        ticker: str,
+        signal: str,
+        current_price: float,
+        date: datetime,
+    ) -> bool:
+        """
+        Execute an all-in/all-out trade for a signal.
+
+        Returns:
+            True if a trade was executed
+        """
+        if signal == "BUY":
+            # Calculate position size (invest all cash)
+            cash = portfolio.cash
+            if cash > 0:
+                shares = cash / current_price
+                if portfolio.buy(ticker, shares, current_price, date):
+                    if self.events.wants_trade:
+                        self.events.trade(
+                            TradeEvent(ticker, date, "BUY", shares, current_price)
+                        )
+                    return True
+
+        elif signal == "SELL":
+            # Sell all shares
+            position = portfolio.get_position(ticker)
+            shares_to_sell = position.shares
+            if shares_to_sell > 0:
+                portfolio.sell(ticker, shares_to_sell, current_price, date)
+                if self.events.wants_trade:
+                    self.events.trade(
+                        TradeEvent(ticker, date, "SELL", shares_to_sell, current_price)
+                    )
+                return True
+
+        return False
+
+    def _simulate_vectorized(
+        self,
+        ticker: str,
+        data: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+        strategy: BaseStrategy,
+        portfolio: Portfolio,
+    ) -> pd.DataFrame:
+        """
+        Vectorized simulation over the whole series.
+
+        The strategy emits every signal in one pass; only the (sparse) trade
+        days go through the Portfolio, and cash/shares between trades are
+        forward-filled to value the book with array operations. Produces the
+        same history and trades as _simulate_loop().
+        """
+        index = data.index
+        # Trading days are the bars in [start_date, end_date]; the loop skips
+        # bars with fewer than two rows of history.
+        start = max(index.searchsorted(pd.Timestamp(start_date), side="left"), 1)
+        stop = index.searchsorted(pd.Timestamp(end_date), side="right")
+        if stop <= start:
+            return pd.DataFrame()
+
+        signals = strategy.generate_signals(data, start, stop).to_numpy()
+        closes = data["Close"].to_numpy()[start:stop]
+        dates = index[start:stop]
+
+        # Execute trades only on days where the signal changes the book
+        change_idx: List[int] = []
+        cash_after: List[float] = []
+        shares_after: List[float] = []
+        for j in np.flatnonzero(signals != "HOLD"):
+            executed = self._execute_signal(
+                portfolio, ticker, signals[j], closes[j], dates[j]
+            )
+            if executed:
+                change_idx.append(j)
+                cash_after.append(portfolio.cash)
+                shares_after.append(portfolio.get_position(ticker).shares)
+
+        # Forward-fill book state from the last trade on or before each day
+        n_days = len(dates)
+        if change_idx:
+            last_change = np.searchsorted(change_idx, np.arange(n_days), side="right") - 1
+            before_first = last_change < 0
+            cash_path = np.asarray(cash_after)[last_change]
+            shares_path = np.asarray(shares_after)[last_change]
+            cash_path[before_first] = self.initial_capital
+            shares_path[before_first] = 0.0
+        else:
+            cash_path = np.full(n_days, portfolio.cash)
+            shares_path = np.zeros(n_days)
+
+        total_value = cash_path + shares_path * closes
+        df = pd.DataFrame(
+            {
+                "cash": cash_path,
+                "total_value": total_value,
+                "total_return": (total_value - self.initial_capital)
+                / self.initial_capital,
+            },
+            index=pd.Index(dates, name="date"),
+        )
+        return df
+
     def run_tradingagents_backtest(
         self,
         ticker: str,
         start_date: datetime,
         end_date: datetime,
         trading_graph: Any,  # TradingAgentsGraph instance
+        checkpoint_path: Optional[str] = None,
+        resume: bool = True,
+        decision_cache: Optional[DecisionCache] = None,
+        max_workers: int = 1,
+        graph_factory: Optional[Callable[[], Any]] = None,
     ) -> Dict[str, Any]:
         """
         Run backtest using the TradingAgents framework.
 
+        Each day's decision is appended to the checkpoint as soon as it is
+        made. Decisions are taken from, in order: the checkpoint (when
+        resuming), the decision cache, and finally trading_graph.propagate().
+
+        Without reflection a day's decision does not depend on the portfolio,
+        so with max_workers > 1 all missing decisions are first made
+        concurrently, then the portfolio is replayed in date order exactly
+        as in a serial run.
+
         Args:
             ticker: Stock symbol
             start_date: Start date
             end_date: End date
             trading_graph: Initialized TradingAgentsGraph instance
+            checkpoint_path: JSONL file to persist daily decisions to
+            resume: Replay decisions already in the checkpoint instead of
+                starting it over
+            decision_cache: Cache of decisions keyed by (ticker, date,
+                config fingerprint) shared across runs
+            max_workers: Number of days to decide concurrently
+            graph_factory: Callable returning a new TradingAgentsGraph; each
+                worker thread builds its own, since propagate() keeps per-call
+                state on the graph. Required when max_workers > 1.
 
         Returns:
             Dictionary with backtest results
         """
-        print(f"\n{'=' * 60}")
-        print(f"Running TradingAgents Backtest: {ticker}")
-        print(f"Period: {start_date.date()} to {end_date.date()}")
-        print(f"Initial Capital: ${self.initial_capital:,.2f}")
-        print(f"{'=' * 60}\n")
+        if max_workers > 1 and graph_factory is None:
+            raise ValueError("max_workers > 1 requires a graph_factory")
 
         # Load data
-        data = self.data_loader.load_data(ticker, start_date, end_date)
+        data = self.data_loader.load_data(ticker, start_date, end_date, copy=False)
+        series = PriceSeries(data)
+
+        # Get trading days
+        trading_days = series.trading_days(start_date, end_date)
 
         # Initialize portfolio
-        portfolio = Portfolio(self.initial_capital)
+        portfolio = Portfolio(self.initial_capital, capacity=len(trading_days))
+
+        self.events.start(
+            RunInfo(
+                kind="tradingagents",
+                ticker=ticker,
+                strategy="TradingAgents",
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=self.initial_capital,
+                n_days=len(trading_days),
+                progress_every=5,
+            )
+        )
 
-        # Get trading days
-        trading_days = self.data_loader.get_trading_days(ticker, start_date, end_date)
+        # Decisions depend on the config, not on capital or sizing
+        fingerprint = config_fingerprint(
+            getattr(trading_graph, "config", None) or {},
+            getattr(trading_graph, "selected_analysts", None),
+        )
+        completed = {}
+        checkpoint = None
+        if checkpoint_path:
+            checkpoint = DecisionCheckpoint(checkpoint_path)
+            completed = checkpoint.open(ticker, fingerprint, resume=resume)
+            if completed:
+                self.events.message(
+                    f"Resuming from checkpoint: {len(completed)} decisions replayed"
+                )
+
+        if max_workers > 1:
+            outcomes = self._decide_concurrently(
+                ticker,
+                trading_days,
+                series,
+                fingerprint,
+                completed,
+                decision_cache,
+                checkpoint,
+                max_workers,
+                graph_factory,
+            )
+
+            def decide(date_str: str, price: float) -> tuple:
+                """Look up a decision made by the worker pool."""
+                outcome = outcomes[date_str]
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
 
-        print(f"Total trading days: {len(trading_days)}")
+        else:
+
+            def decide(date_str: str, price: float) -> tuple:
+                """Make (or replay) one day's decision and checkpoint it."""
+                try:
+                    decision, source = self._tradingagents_decision(
+                        trading_graph,
+                        ticker,
+                        date_str,
+                        fingerprint,
+                        completed,
+                        decision_cache,
+                    )
+                except Exception as e:
+                    if checkpoint is not None:
+                        checkpoint.append_error(date_str, str(e), price)
+                    raise
+                if checkpoint is not None and source != "checkpoint":
+                    checkpoint.append_decision(date_str, decision, price)
+                return decision, source
 
         signals = []
+        on_bar = self.events.bar_handler()
 
         # Run simulation
         for i, date in enumerate(trading_days):
             date_str = date.strftime("%Y-%m-%d")
 
             # Get current price
-            current_price = self.data_loader.get_price(ticker, date, data)
+            current_price = series.price_at(date)
             prices = {ticker: current_price}
 
             # Get TradingAgents decision
             signal = "HOLD"
             try:
-                final_state, decision = trading_graph.propagate(ticker, date_str)
+                decision, source = decide(date_str, current_price)
 
                 # Parse decision (expecting "BUY", "SELL", or "HOLD")
                 if "buy" in decision.lower():
@@ -230,37 +540,15 @@ class Backtester:
                         "signal": signal,
                         "raw_decision": decision,
                         "price": current_price,
+                        "source": source,
                     }
                 )
 
                 # Execute trade
-                if signal == "BUY":
-                    cash = portfolio.cash
-                    if cash > 0:
-                        shares = cash / current_price
-                        if portfolio.buy(ticker, shares, current_price, date):
-                            pass  # Will print after portfolio value is updated
-
-                elif signal == "SELL":
-                    position = portfolio.get_position(ticker)
-                    shares_to_sell = position.shares
-                    if shares_to_sell > 0:
-                        if portfolio.sell(ticker, shares_to_sell, current_price, date):
-                            pass  # Will print after portfolio value is updated
+                self._execute_signal(portfolio, ticker, signal, current_price, date)
 
             except Exception as e:
-                print(f"Error on {date.date()}: {e}")
-                signals.append(
-                    {
-                        "date": date,
-                        "signal": "ERROR",
-                        "error": str(e),
-                        "price": current_price,
-                    }
-                )
-
-            except Exception as e:
-                print(f"Error on {date.date()}: {e}")
+                self.events.message(f"Error on {date.date()}: {e}")
                 signals.append(
                     {
                         "date": date,
@@ -273,29 +561,15 @@ class Backtester:
             # Record snapshot after trading
             portfolio.record_snapshot(date, prices)
 
-            # Get portfolio value for progress reporting
-            portfolio_value = portfolio.get_total_value(prices)
-            position = portfolio.get_position(ticker)
-            shares_held = position.shares if position else 0
-
-            # Daily progress report
-            print(
-                f"[{date.date()}] Signal: {signal:>4} | Price: ${current_price:>8.2f} | "
-                f"Shares: {shares_held:>7.2f} | Portfolio: ${portfolio_value:>12,.2f}"
-            )
-
-            # Progress indicator every 5 days
-            if (i + 1) % 5 == 0 or i == len(trading_days) - 1:
-                progress = (i + 1) / len(trading_days) * 100
-                print(f"Progress: {progress:.1f}% ({i + 1}/{len(trading_days)} days)")
+            if on_bar is not None:
+                on_bar(
+                    BarEvent(
+                        ticker, date, i + 1, len(trading_days), current_price, signal, portfolio
+                    )
+                )
 
         # Get final value
-        final_data = data[data.index <= end_date]
-        if len(final_data) > 0:
-            final_price = final_data["Close"].iloc[-1]
-            final_value = portfolio.get_total_value({ticker: final_price})
-        else:
-            final_value = portfolio.cash
+        final_value = self._final_value(portfolio, ticker, series, end_date)
 
         # Calculate metrics
         portfolio_df = portfolio.get_history_df()
@@ -324,38 +598,134 @@ class Backtester:
 
         self.results[f"{ticker}_TradingAgents"] = results
 
-        self._print_summary(results)
+        self.events.finish(results)
 
         return results
 
-    def _print_summary(self, results: Dict[str, Any]):
-        """Print backtest summary."""
-        print(f"\n{'=' * 60}")
-        print(f"BACKTEST SUMMARY: {results['ticker']} - {results['strategy']}")
-        print(f"{'=' * 60}")
-        print(f"Period: {results['start_date'].date()} to {results['end_date'].date()}")
-        print(f"Initial Capital: ${results['initial_capital']:,.2f}")
-        print(f"Final Value: ${results['final_value']:,.2f}")
-        print(f"Total Return: {results['total_return_pct']:.2f}%")
-        print(f"Number of Trades: {results['num_trades']}")
-        print(f"\nPerformance Metrics:")
-        print(
-            f"  Cumulative Return (CR%): {results['metrics'].cumulative_return_pct:.2f}%"
-        )
-        print(
-            f"  Annualized Return (ARR%): {results['metrics'].annualized_return_pct:.2f}%"
+    def _decide_concurrently(
+        self,
+        ticker: str,
+        trading_days: pd.DatetimeIndex,
+        series: PriceSeries,
+        fingerprint: str,
+        completed: Dict[str, Dict[str, Any]],
+        decision_cache: Optional[DecisionCache],
+        checkpoint: Optional[DecisionCheckpoint],
+        max_workers: int,
+        graph_factory: Callable[[], Any],
+    ) -> Dict[str, Any]:
+        """
+        Make all missing decisions with a bounded pool of worker threads.
+
+        Each worker thread lazily builds its own graph with graph_factory.
+        Cache hits are checkpointed up front; new decisions are checkpointed
+        and cached as they complete.
+
+        Returns:
+            Mapping of date string to (decision, source), or to the
+            exception raised for that day
+        """
+        outcomes: Dict[str, Any] = {}
+        pending = []
+        for date in trading_days:
+            date_str = date.strftime("%Y-%m-%d")
+            record = completed.get(date_str)
+            cached = (
+                decision_cache.get(ticker, date_str, fingerprint)
+                if decision_cache is not None and record is None
+                else None
+            )
+            if record is not None:
+                outcomes[date_str] = (record["decision"], "checkpoint")
+            elif cached is not None:
+                outcomes[date_str] = (cached, "cache")
+                # Like the serial path, so the checkpoint holds every
+                # decided day whatever the worker count
+                if checkpoint is not None:
+                    checkpoint.append_decision(date_str, cached, series.price_at(date))
+            else:
+                pending.append(date_str)
+
+        if not pending:
+            return outcomes
+
+        self.events.message(
+            f"Deciding {len(pending)} days with {min(max_workers, len(pending))} workers..."
         )
-        print(f"  Sharpe Ratio: {results['metrics'].sharpe_ratio:.2f}")
-        print(f"  Max Drawdown (MDD%): {results['metrics'].max_drawdown_pct:.2f}%")
-        print(f"  Volatility: {results['metrics'].volatility_pct:.2f}%")
-        if results["metrics"].win_rate_pct:
-            print(f"  Win Rate: {results['metrics'].win_rate_pct:.2f}%")
-        print(f"{'=' * 60}\n")
+        local = threading.local()
+
+        def propagate(date_str: str) -> str:
+            if not hasattr(local, "graph"):
+                local.graph = graph_factory()
+            _, decision = local.graph.propagate(ticker, date_str)
+            return decision
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {
+            executor.submit(propagate, date_str): date_str for date_str in pending
+        }
+        try:
+            for done, future in enumerate(as_completed(futures), start=1):
+                date_str = futures[future]
+                price = series.price_at(pd.Timestamp(date_str))
+                try:
+                    decision = future.result()
+                except Exception as e:
+                    outcomes[date_str] = e
+                    if checkpoint is not None:
+                        checkpoint.append_error(date_str, str(e), price)
+                else:
+                    outcomes[date_str] = (decision, "llm")
+                    if checkpoint is not None:
+                        checkpoint.append_decision(date_str, decision, price)
+                    if decision_cache is not None:
+                        decision_cache.put(ticker, date_str, fingerprint, decision)
+
+                if done % 5 == 0 or done == len(pending):
+                    self.events.message(f"Decisions: {done}/{len(pending)} days")
+        except BaseException:
+            # On Ctrl-C, stop queued days; finished ones are already checkpointed
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+        return outcomes
+
+    def _tradingagents_decision(
+        self,
+        trading_graph: Any,
+        ticker: str,
+        date_str: str,
+        fingerprint: str,
+        completed: Dict[str, Dict[str, Any]],
+        decision_cache: Optional[DecisionCache],
+    ) -> tuple:
+        """
+        Get one day's decision from the checkpoint, the cache, or the graph.
+
+        Returns:
+            Tuple of (decision, source) where source is 'checkpoint',
+            'cache' or 'llm'
+        """
+        record = completed.get(date_str)
+        if record is not None:
+            return record["decision"], "checkpoint"
+
+        if decision_cache is not None:
+            decision = decision_cache.get(ticker, date_str, fingerprint)
+            if decision is not None:
+                return decision, "cache"
+
+        _, decision = trading_graph.propagate(ticker, date_str)
+        if decision_cache is not None:
+            decision_cache.put(ticker, date_str, fingerprint, decision)
+        return decision, "llm"
 
     def compare_strategies(
         self,
         ticker: str,
-        results_list: List[Dict[str, Any]],
+        results_list: Optional[List[Dict[str, Any]]] = None,
+        store: Optional[ResultsStore] = None,
     ) -> str:
         """
         Compare multiple strategies for a ticker.
@@ -363,19 +733,28 @@ class Backtester:
         Args:
             ticker: Stock symbol
             results_list: List of backtest results
+            store: Results store to read the latest run of each strategy
+                from, used when results_list is None
 
         Returns:
             Formatted comparison table
         """
-        print(f"\n{'=' * 80}")
-        print(f"STRATEGY COMPARISON: {ticker}")
-        print(f"{'=' * 80}\n")
+        if results_list is None:
+            if store is None:
+                raise ValueError("Pass results_list or a results store")
+            runs = store.latest_runs(ticker)
+            metrics_list = [store.metrics(run_id).to_dict() for run_id in runs["run_id"]]
+            names = runs["strategy"].tolist()
+        else:
+            metrics_list = [r["metrics"].to_dict() for r in results_list]
+            names = [r["strategy"] for r in results_list]
 
-        metrics_list = [r["metrics"].to_dict() for r in results_list]
-        names = [r["strategy"] for r in results_list]
+        self.events.message(f"\n{'=' * 80}")
+        self.events.message(f"STRATEGY COMPARISON: {ticker}")
+        self.events.message(f"{'=' * 80}\n")
 
         comparison = MetricsCalculator.format_metrics_table(metrics_list, names)
-        print(comparison)
+        self.events.message(comparison)
 
         return comparison
 
@@ -420,4 +799,4 @@ class Backtester:
             signals_file = filepath.replace(".json", "_signals.csv")
             results["signals"].to_csv(signals_file)
 
-        print(f"Results saved to: {filepath.replace('.json', '*')}")
+        self.events.message(f"Results saved to: {filepath.replace('.json', '*')}")
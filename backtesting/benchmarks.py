@@ -11,11 +11,30 @@ Implements baseline strategies from the TradingAgents paper:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import pandas as pd
 import numpy as np
 
+from .indicators import IndicatorCache
+from .streaming import (
+    Bar,
+    EWMState,
+    RollingMeanState,
+    RollingVarState,
+    RollingExtremeState,
+    safe_div,
+)
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    """Shift an array one bar forward (previous-bar values), padding with NaN."""
+    shifted = np.empty(len(values), dtype=float)
+    if len(values) > 0:
+        shifted[0] = np.nan
+        shifted[1:] = values[:-1]
+    return shifted
+
 
 class BaseStrategy(ABC):
     """Abstract base class for trading strategies."""
@@ -23,6 +42,13 @@ class BaseStrategy(ABC):
     def __init__(self, name: str):
         self.name = name
         self.signals: List[Dict] = []
+        self.position = 0  # 0 = no position, 1 = long
+        self._bars_seen = 0
+
+    @property
+    def min_bars(self) -> int:
+        """Number of bars (including the current one) needed before trading."""
+        return 1
 
     @abstractmethod
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
@@ -49,6 +75,154 @@ class BaseStrategy(ABC):
             }
         )
 
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Compute raw entry/exit conditions for every bar in one pass.
+
+        Indicators are computed once over the full series. Because every
+        indicator used here is causal, the value at bar i equals the value
+        generate_signal() would compute on data up to bar i.
+
+        Args:
+            data: Full historical price data
+            indicators: Cache over the same data to share indicator series
+                with other strategy instances (created if None)
+
+        Returns:
+            Tuple of boolean arrays (entry, exit) aligned with data.index,
+            or None if the strategy has no vectorized implementation
+        """
+        return None
+
+    @property
+    def supports_vectorized(self) -> bool:
+        """Whether the strategy implements compute_entry_exit()."""
+        return type(self).compute_entry_exit is not BaseStrategy.compute_entry_exit
+
+    def generate_signals(
+        self,
+        data: pd.DataFrame,
+        start: int = 0,
+        stop: Optional[int] = None,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> pd.Series:
+        """
+        Generate signals for bars data.iloc[start:stop] in one pass.
+
+        Produces the same signals, recorded signals and final position as
+        calling generate_signal() once per bar on the growing history.
+
+        Args:
+            data: Full historical price data (sorted by date)
+            start: Position of the first bar to trade on
+            stop: Position after the last bar to trade on (default: end)
+            indicators: Shared indicator cache over the same data
+
+        Returns:
+            Series of 'BUY'/'SELL'/'HOLD' indexed by date
+        """
+        conditions = self.compute_entry_exit(data, indicators)
+        if conditions is None:
+            raise NotImplementedError(
+                f"{self.name} does not support vectorized signal generation"
+            )
+        entry, exit_ = conditions
+
+        stop = len(data) if stop is None else stop
+        signals = np.full(max(stop - start, 0), "HOLD", dtype=object)
+
+        # Bars before the warm-up threshold always return HOLD
+        first = max(start, self.min_bars - 1)
+        entry_idx = np.flatnonzero(entry[first:stop]) + first
+        exit_idx = np.flatnonzero(exit_[first:stop]) + first
+
+        # Walk the position state machine from one transition to the next
+        close = data["Close"].to_numpy()
+        position = self.position
+        i = first
+        while True:
+            candidates = exit_idx if position else entry_idx
+            k = np.searchsorted(candidates, i)
+            if k == len(candidates):
+                break
+            j = candidates[k]
+            action = "SELL" if position else "BUY"
+            signals[j - start] = action
+            self.record_signal(data.index[j], action, close[j])
+            position = 1 - position
+            i = j + 1
+
+        self.position = position
+        return pd.Series(signals, index=data.index[start:stop], name="signal")
+
+    def _stream_step(self, bar: Bar) -> Optional[Tuple[bool, bool]]:
+        """
+        Advance streaming indicator state by one bar.
+
+        Returns:
+            Tuple (entry, exit) for this bar, or None if the strategy has no
+            streaming implementation
+        """
+        return None
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the strategy implements the on_bar() streaming API."""
+        return type(self)._stream_step is not BaseStrategy._stream_step
+
+    def reset_stream(self):
+        """Clear streaming indicator state (position and signals are kept)."""
+        self._bars_seen = 0
+
+    def update(self, bar: Bar) -> Tuple[bool, bool]:
+        """
+        Feed a bar into the streaming indicators without trading on it.
+
+        Used for warm-up history before the backtest window.
+
+        Returns:
+            Tuple (entry, exit) of raw conditions for this bar
+        """
+        conditions = self._stream_step(bar)
+        if conditions is None:
+            raise NotImplementedError(
+                f"{self.name} does not support streaming signal generation"
+            )
+        self._bars_seen += 1
+        return conditions
+
+    def on_bar(self, bar: Bar) -> str:
+        """
+        Generate trading signal for the next bar in O(1).
+
+        Gives the same signal as generate_signal() called with all bars fed
+        so far (via update() or on_bar()) as its history.
+
+        Args:
+            bar: Next OHLCV bar, in date order
+
+        Returns:
+            Signal: 'BUY', 'SELL', or 'HOLD'
+        """
+        entry, exit_ = self.update(bar)
+        if self._bars_seen < self.min_bars:
+            return "HOLD"
+
+        if self.position == 0 and entry:
+            self.position = 1
+            self.record_signal(bar.date, "BUY", bar.close)
+            return "BUY"
+        elif self.position == 1 and exit_:
+            self.position = 0
+            self.record_signal(bar.date, "SELL", bar.close)
+            return "SELL"
+
+        return "HOLD"
+
 
 class BuyAndHoldStrategy(BaseStrategy):
     """
@@ -61,6 +235,7 @@ class BuyAndHoldStrategy(BaseStrategy):
     def __init__(self):
         super().__init__("Buy & Hold")
         self.has_bought = False
+        self.reset_stream()
 
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
         """Buy on first day, hold forever."""
@@ -72,6 +247,37 @@ class BuyAndHoldStrategy(BaseStrategy):
 
         return "HOLD"
 
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Enter on the first bar, never exit."""
+        return np.ones(len(data), dtype=bool), np.zeros(len(data), dtype=bool)
+
+    def generate_signals(
+        self,
+        data: pd.DataFrame,
+        start: int = 0,
+        stop: Optional[int] = None,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> pd.Series:
+        """Buy on the first bar of the range, hold forever."""
+        self.position = 1 if self.has_bought else 0
+        signals = super().generate_signals(data, start, stop, indicators)
+        self.has_bought = bool(self.position)
+        return signals
+
+    def _stream_step(self, bar: Bar) -> Tuple[bool, bool]:
+        return True, False
+
+    def on_bar(self, bar: Bar) -> str:
+        """Buy on the first bar, hold forever."""
+        self.position = 1 if self.has_bought else 0
+        signal = super().on_bar(bar)
+        self.has_bought = bool(self.position)
+        return signal
+
 
 class MACDStrategy(BaseStrategy):
     """
@@ -94,18 +300,64 @@ class MACDStrategy(BaseStrategy):
         self.fast_period = fast_period
         self.slow_period = slow_period
         self.signal_period = signal_period
-        self.position = 0  # 0 = no position, 1 = long
+        self.reset_stream()
+
+    @property
+    def min_bars(self) -> int:
+        return self.slow_period + self.signal_period
+
+    def reset_stream(self):
+        super().reset_stream()
+        self._fast_ema = EWMState.from_span(self.fast_period)
+        self._slow_ema = EWMState.from_span(self.slow_period)
+        self._signal_ema = EWMState.from_span(self.signal_period)
+        self._macd_prev = float("nan")
+        self._signal_prev = float("nan")
+
+    def _stream_step(self, bar: Bar) -> Tuple[bool, bool]:
+        """Update running EMAs and check for a crossover."""
+        macd = self._fast_ema.update(bar.close) - self._slow_ema.update(bar.close)
+        signal = self._signal_ema.update(macd)
+        macd_prev, signal_prev = self._macd_prev, self._signal_prev
+        self._macd_prev, self._signal_prev = macd, signal
+
+        entry = macd_prev <= signal_prev and macd > signal
+        exit_ = macd_prev >= signal_prev and macd < signal
+        return entry, exit_
+
+    def _macd_lines(self, prices: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Calculate MACD and Signal lines for price series."""
+        exp1 = prices.ewm(span=self.fast_period, adjust=False).mean()
+        exp2 = prices.ewm(span=self.slow_period, adjust=False).mean()
+        macd = exp1 - exp2
+        signal = macd.ewm(span=self.signal_period, adjust=False).mean()
+        return macd, signal
+
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """MACD/Signal crossovers for every bar."""
+        indicators = indicators or IndicatorCache(data)
+        macd = indicators.macd(self.fast_period, self.slow_period).to_numpy()
+        signal = indicators.macd_signal(
+            self.fast_period, self.slow_period, self.signal_period
+        ).to_numpy()
+        macd_prev = _shift(macd)
+        signal_prev = _shift(signal)
+
+        entry = (macd_prev <= signal_prev) & (macd > signal)
+        exit_ = (macd_prev >= signal_prev) & (macd < signal)
+        return entry, exit_
 
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
         """Generate MACD crossover signal."""
-        if len(data) < self.slow_period + self.signal_period:
+        if len(data) < self.min_bars:
             return "HOLD"  # Not enough data
 
         # Calculate MACD
-        exp1 = data["Close"].ewm(span=self.fast_period, adjust=False).mean()
-        exp2 = data["Close"].ewm(span=self.slow_period, adjust=False).mean()
-        macd = exp1 - exp2
-        signal = macd.ewm(span=self.signal_period, adjust=False).mean()
+        macd, signal = self._macd_lines(data["Close"])
 
         # Get current and previous values
         macd_current = macd.iloc[-1]
@@ -154,10 +406,33 @@ class RSIStrategy(BaseStrategy):
         self.period = period
         self.oversold = oversold
         self.overbought = overbought
-        self.position = 0
+        self.reset_stream()
 
-    def _calculate_rsi(self, prices: pd.Series) -> float:
-        """Calculate RSI for price series."""
+    @property
+    def min_bars(self) -> int:
+        return self.period + 1
+
+    def reset_stream(self):
+        super().reset_stream()
+        self._avg_gain = RollingMeanState(self.period)
+        self._avg_loss = RollingMeanState(self.period)
+        self._prev_close = float("nan")
+
+    def _stream_step(self, bar: Bar) -> Tuple[bool, bool]:
+        """Update rolling gain/loss sums and check thresholds."""
+        delta = bar.close - self._prev_close
+        self._prev_close = bar.close
+
+        # Same sign conventions as deltas.where(...) in _rsi_series
+        gain = delta if delta > 0 else 0.0
+        loss = -(delta if delta < 0 else 0.0)
+
+        rs = safe_div(self._avg_gain.update(gain), self._avg_loss.update(loss))
+        rsi = 100 - safe_div(100, 1 + rs)
+        return rsi < self.oversold, rsi > self.overbought
+
+    def _rsi_series(self, prices: pd.Series) -> pd.Series:
+        """Calculate RSI for every bar of price series."""
         deltas = prices.diff()
 
         # Separate gains and losses
@@ -172,11 +447,25 @@ class RSIStrategy(BaseStrategy):
         rs = avg_gains / avg_losses
         rsi = 100 - (100 / (1 + rs))
 
-        return rsi.iloc[-1]
+        return rsi
+
+    def _calculate_rsi(self, prices: pd.Series) -> float:
+        """Calculate RSI for price series."""
+        return self._rsi_series(prices).iloc[-1]
+
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Oversold entries and overbought exits for every bar."""
+        indicators = indicators or IndicatorCache(data)
+        rsi = indicators.rsi(self.period).to_numpy()
+        return rsi < self.oversold, rsi > self.overbought
 
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
         """Generate RSI signal."""
-        if len(data) < self.period + 1:
+        if len(data) < self.min_bars:
             return "HOLD"
 
         rsi = self._calculate_rsi(data["Close"])
@@ -216,11 +505,49 @@ class SMAStrategy(BaseStrategy):
         super().__init__(f"SMA({short_period},{long_period})")
         self.short_period = short_period
         self.long_period = long_period
-        self.position = 0
+        self.reset_stream()
+
+    @property
+    def min_bars(self) -> int:
+        return self.long_period
+
+    def reset_stream(self):
+        super().reset_stream()
+        self._short_sma = RollingMeanState(self.short_period)
+        self._long_sma = RollingMeanState(self.long_period)
+        self._short_prev = float("nan")
+        self._long_prev = float("nan")
+
+    def _stream_step(self, bar: Bar) -> Tuple[bool, bool]:
+        """Update ring-buffer SMAs and check for a crossover."""
+        short_sma = self._short_sma.update(bar.close)
+        long_sma = self._long_sma.update(bar.close)
+        short_prev, long_prev = self._short_prev, self._long_prev
+        self._short_prev, self._long_prev = short_sma, long_sma
+
+        entry = short_prev <= long_prev and short_sma > long_sma
+        exit_ = short_prev >= long_prev and short_sma < long_sma
+        return entry, exit_
+
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Short/Long SMA crossovers for every bar."""
+        indicators = indicators or IndicatorCache(data)
+        short_sma = indicators.sma(self.short_period).to_numpy()
+        long_sma = indicators.sma(self.long_period).to_numpy()
+        short_prev = _shift(short_sma)
+        long_prev = _shift(long_sma)
+
+        entry = (short_prev <= long_prev) & (short_sma > long_sma)
+        exit_ = (short_prev >= long_prev) & (short_sma < long_sma)
+        return entry, exit_
 
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
         """Generate SMA crossover signal."""
-        if len(data) < self.long_period:
+        if len(data) < self.min_bars:
             return "HOLD"
 
         # Calculate SMAs
@@ -273,10 +600,31 @@ class KDJStrategy(BaseStrategy):
         self.period = period
         self.smooth_k = smooth_k
         self.smooth_d = smooth_d
-        self.position = 0
-
-    def _calculate_kdj(self, data: pd.DataFrame) -> tuple:
-        """Calculate K, D, J values."""
+        self.reset_stream()
+
+    @property
+    def min_bars(self) -> int:
+        return self.period + max(self.smooth_k, self.smooth_d)
+
+    def reset_stream(self):
+        super().reset_stream()
+        self._low_min = RollingExtremeState(self.period, mode="min")
+        self._high_max = RollingExtremeState(self.period, mode="max")
+        self._k_ema = EWMState(com=self.smooth_k - 1)
+        self._d_ema = EWMState(com=self.smooth_d - 1)
+
+    def _stream_step(self, bar: Bar) -> Tuple[bool, bool]:
+        """Update rolling high/low deques and K/D smoothing."""
+        low_min = self._low_min.update(bar.low)
+        high_max = self._high_max.update(bar.high)
+
+        rsv = safe_div(100 * (bar.close - low_min), high_max - low_min)
+        k = self._k_ema.update(rsv)
+        d = self._d_ema.update(k)
+        return (k > d and k < 20), (k < d and k > 80)
+
+    def _kdj_series(self, data: pd.DataFrame) -> tuple:
+        """Calculate K, D, J lines for every bar."""
         # Calculate RSV (Raw Stochastic Value)
         low_min = data["Low"].rolling(window=self.period).min()
         high_max = data["High"].rolling(window=self.period).max()
@@ -292,11 +640,28 @@ class KDJStrategy(BaseStrategy):
         # Calculate J
         j = 3 * k - 2 * d
 
+        return k, d, j
+
+    def _calculate_kdj(self, data: pd.DataFrame) -> tuple:
+        """Calculate K, D, J values."""
+        k, d, j = self._kdj_series(data)
         return k.iloc[-1], d.iloc[-1], j.iloc[-1]
 
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """K/D positioning in oversold/overbought regions for every bar."""
+        indicators = indicators or IndicatorCache(data)
+        k, d = indicators.kdj(self.period, self.smooth_k, self.smooth_d)
+        k = k.to_numpy()
+        d = d.to_numpy()
+        return (k > d) & (k < 20), (k < d) & (k > 80)
+
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
         """Generate KDJ signal."""
-        if len(data) < self.period + max(self.smooth_k, self.smooth_d):
+        if len(data) < self.min_bars:
             return "HOLD"
 
         k, d, j = self._calculate_kdj(data)
@@ -338,11 +703,43 @@ class ZMRStrategy(BaseStrategy):
         self.period = period
         self.entry_threshold = entry_threshold
         self.exit_threshold = exit_threshold
-        self.position = 0
+        self.reset_stream()
+
+    @property
+    def min_bars(self) -> int:
+        return self.period
+
+    def reset_stream(self):
+        super().reset_stream()
+        self._ma = RollingMeanState(self.period)
+        self._var = RollingVarState(self.period)
+
+    def _stream_step(self, bar: Bar) -> Tuple[bool, bool]:
+        """Update rolling mean/variance and compute the Z-score."""
+        ma = self._ma.update(bar.close)
+        std = self._var.std(bar.close)
+        z_score = safe_div(bar.close - ma, std)
+
+        entry = z_score < -self.entry_threshold
+        exit_ = z_score > -self.exit_threshold or z_score > self.entry_threshold
+        return entry, exit_
+
+    def compute_entry_exit(
+        self,
+        data: pd.DataFrame,
+        indicators: Optional[IndicatorCache] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Z-score entries and reversion exits for every bar."""
+        indicators = indicators or IndicatorCache(data)
+        z_score = indicators.zscore(self.period).to_numpy()
+
+        entry = z_score < -self.entry_threshold
+        exit_ = (z_score > -self.exit_threshold) | (z_score > self.entry_threshold)
+        return entry, exit_
 
     def generate_signal(self, ticker: str, date: datetime, data: pd.DataFrame) -> str:
         """Generate ZMR signal."""
-        if len(data) < self.period:
+        if len(data) < self.min_bars:
             return "HOLD"
 
         # Calculate Z-score
@@ -0,0 +1,303 @@
+"""
+Bootstrap confidence intervals for backtest metrics.
+
+A single Sharpe ratio cannot separate skill from noise. This module
+resamples daily returns in blocks, which preserves short-range
+autocorrelation and volatility clustering, and recomputes Sharpe, ARR and
+MDD on every resample:
+- Stationary bootstrap (Politis & Romano): geometric block lengths
+- Moving block bootstrap: fixed block lengths
+- All runs share the same resampled days, so differences between
+  strategies are paired
+- Resamples are drawn in chunks with independent child seeds and can be
+  spread over worker processes; results do not depend on the worker count
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+from .metrics import MetricsCalculator
+
+METHODS = ("stationary", "block")
+
+# Metrics recomputed on every resample
+BOOTSTRAP_METRICS = ("sharpe_ratio", "annualized_return_pct", "max_drawdown_pct")
+
+
+@dataclass
+class BootstrapResult:
+    """
+    Bootstrap distributions of metrics for one or more runs.
+
+    samples[metric] is a (n_samples, n_runs) array; column j belongs to
+    runs[j] and row i of every run was computed from the same resampled days.
+    """
+
+    runs: pd.Index
+    point: pd.DataFrame  # metrics of the original curves, one row per run
+    samples: Dict[str, np.ndarray]
+    method: str
+    block_size: float
+
+    def confidence_intervals(self, level: float = 0.95) -> pd.DataFrame:
+        """
+        Percentile confidence intervals.
+
+        Args:
+            level: Confidence level, e.g. 0.95
+
+        Returns:
+            DataFrame indexed by (run, metric) with columns point, lower,
+            upper and std_error
+        """
+        lower_q, upper_q = _quantiles(level)
+        rows = []
+        for metric in BOOTSTRAP_METRICS:
+            draws = self.samples[metric]
+            lower = np.nanquantile(draws, lower_q, axis=0)
+            upper = np.nanquantile(draws, upper_q, axis=0)
+            std_error = np.nanstd(draws, axis=0, ddof=1)
+            for j, run in enumerate(self.runs):
+                rows.append(
+                    {
+                        "run": run,
+                        "metric": metric,
+                        "point": self.point.loc[run, metric],
+                        "lower": lower[j],
+                        "upper": upper[j],
+                        "std_error": std_error[j],
+                    }
+                )
+        return pd.DataFrame(rows).set_index(["run", "metric"]).sort_index()
+
+    def difference(
+        self,
+        metric: str,
+        run_a,
+        run_b,
+        level: float = 0.95,
+    ) -> Dict[str, float]:
+        """
+        Paired confidence interval of metric(run_a) - metric(run_b).
+
+        An interval that excludes zero indicates a difference beyond
+        resampling noise.
+
+        Args:
+            metric: One of BOOTSTRAP_METRICS
+            run_a: Label of the first run
+            run_b: Label of the second run
+            level: Confidence level
+
+        Returns:
+            Dictionary with point, lower, upper and p_value (two-sided share
+            of resamples on the other side of zero)
+        """
+        if metric not in self.samples:
+            raise ValueError(f"Unknown metric {metric!r}, choose from {list(self.samples)}")
+        a = self.runs.get_loc(run_a)
+        b = self.runs.get_loc(run_b)
+        diff = self.samples[metric][:, a] - self.samples[metric][:, b]
+        lower_q, upper_q = _quantiles(level)
+        p_one_sided = min(np.mean(diff <= 0), np.mean(diff >= 0))
+        return {
+            "point": self.point.loc[run_a, metric] - self.point.loc[run_b, metric],
+            "lower": float(np.nanquantile(diff, lower_q)),
+            "upper": float(np.nanquantile(diff, upper_q)),
+            "p_value": float(min(1.0, 2 * p_one_sided)),
+        }
+
+
+def _quantiles(level: float) -> tuple:
+    if not 0 < level < 1:
+        raise ValueError("level must be between 0 and 1")
+    alpha = (1 - level) / 2
+    return alpha, 1 - alpha
+
+
+def stationary_indices(
+    n_days: int,
+    n_samples: int,
+    mean_block: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Day indices of stationary-bootstrap resamples.
+
+    Each position starts a new block with probability 1 / mean_block,
+    otherwise it continues the previous block, wrapping around the end.
+
+    Returns:
+        (n_samples, n_days) int array
+    """
+    positions = np.arange(n_days)
+    new_block = rng.random((n_samples, n_days)) < 1.0 / mean_block
+    new_block[:, 0] = True
+    starts = rng.integers(0, n_days, size=(n_samples, n_days))
+
+    # Position where the current block began, and offset within it
+    block_begin = np.maximum.accumulate(np.where(new_block, positions, 0), axis=1)
+    block_start = np.take_along_axis(starts, block_begin, axis=1)
+    return (block_start + positions - block_begin) % n_days
+
+
+def block_indices(
+    n_days: int,
+    n_samples: int,
+    block_size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Day indices of moving-block-bootstrap resamples.
+
+    Blocks of block_size consecutive days are drawn with replacement and
+    concatenated, then trimmed to n_days.
+
+    Returns:
+        (n_samples, n_days) int array
+    """
+    block_size = min(int(block_size), n_days)
+    n_blocks = -(-n_days // block_size)
+    starts = rng.integers(0, n_days - block_size + 1, size=(n_samples, n_blocks))
+    indices = starts[:, :, None] + np.arange(block_size)
+    return indices.reshape(n_samples, -1)[:, :n_days]
+
+
+def _resample_metrics(
+    returns: np.ndarray,
+    n_samples: int,
+    method: str,
+    block_size: float,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    """
+    Draw one chunk of resamples and compute their metrics.
+
+    Runs in a worker process when parallelized.
+
+    Args:
+        returns: (n_runs, n_days) daily returns
+        n_samples: Resamples in this chunk
+        method: 'stationary' or 'block'
+        block_size: Mean (stationary) or fixed (block) block length
+        seed: Seed of this chunk
+
+    Returns:
+        Dictionary of metric to (n_samples, n_runs) array
+    """
+    rng = np.random.default_rng(seed)
+    n_runs, n_days = returns.shape
+    if method == "stationary":
+        indices = stationary_indices(n_days, n_samples, block_size, rng)
+    else:
+        indices = block_indices(n_days, n_samples, int(block_size), rng)
+
+    out = {metric: np.empty((n_samples, n_runs)) for metric in BOOTSTRAP_METRICS}
+    growth = np.empty((n_samples, n_days + 1))
+    growth[:, 0] = 1.0
+    running_max = np.empty_like(growth)
+    daily_rf = MetricsCalculator.RISK_FREE_RATE / 252
+    years = (n_days + 1) / 252
+
+    # Same formulas as MetricsCalculator.calculate_batch_metrics(), applied
+    # directly to the resampled returns of a curve starting at 1
+    for j in range(n_runs):
+        resampled = returns[j][indices]
+
+        mean = resampled.mean(axis=1)
+        centred = resampled - mean[:, None]
+        std = np.sqrt(np.einsum("ij,ij->i", centred, centred) / (n_days - 1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out["sharpe_ratio"][:, j] = np.where(
+                std != 0, (mean - daily_rf) / std * np.sqrt(252), 0.0
+            )
+
+        np.add(resampled, 1.0, out=resampled)
+        np.cumprod(resampled, axis=1, out=growth[:, 1:])
+        out["annualized_return_pct"][:, j] = (growth[:, -1] ** (1 / years) - 1) * 100
+
+        np.maximum.accumulate(growth, axis=1, out=running_max)
+        np.divide(growth, running_max, out=running_max)
+        out["max_drawdown_pct"][:, j] = (1 - running_max.min(axis=1)) * 100
+    return out
+
+
+def bootstrap_metrics(
+    equity: Union[pd.Series, pd.DataFrame, np.ndarray],
+    n_samples: int = 10000,
+    method: str = "stationary",
+    block_size: float = 20.0,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+    chunk_size: int = 500,
+) -> BootstrapResult:
+    """
+    Bootstrap Sharpe, ARR and MDD of one or more equity curves.
+
+    Example:
+        curves = pd.DataFrame({
+            r["strategy"]: r["portfolio_history"]["total_value"] for r in results
+        })
+        boot = bootstrap_metrics(curves, seed=42, n_jobs=4)
+        print(boot.confidence_intervals())
+        print(boot.difference("sharpe_ratio", "MACD", "Buy & Hold"))
+
+    Args:
+        equity: Portfolio values, a Series, a DataFrame with one column per
+            run, or an (n_days, n_runs) array, on a shared calendar
+        n_samples: Number of resamples
+        method: 'stationary' (geometric block lengths) or 'block' (fixed)
+        block_size: Mean or fixed block length in days
+        seed: Random seed; results are reproducible for a given seed and
+            chunk_size, whatever n_jobs is
+        n_jobs: Worker processes (1 runs in-process)
+        chunk_size: Resamples per chunk (and per task)
+
+    Returns:
+        BootstrapResult with per-resample metrics and the point estimates
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}, choose from {list(METHODS)}")
+    if n_samples < 1 or chunk_size < 1:
+        raise ValueError("n_samples and chunk_size must be at least 1")
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+
+    if isinstance(equity, pd.Series):
+        equity = equity.to_frame(name=equity.name if equity.name is not None else 0)
+    point = MetricsCalculator.calculate_batch_metrics(equity)
+    values, runs = MetricsCalculator.runs_by_row(equity)
+    if values.shape[1] < 3:
+        raise ValueError("Need at least 3 portfolio values to bootstrap")
+    if np.isnan(values).any() or (values[:, :-1] == 0).any():
+        raise ValueError("Equity curves must be complete and nonzero")
+    returns = values[:, 1:] / values[:, :-1] - 1
+
+    sizes = [chunk_size] * (n_samples // chunk_size)
+    if n_samples % chunk_size:
+        sizes.append(n_samples % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(returns, size, method, block_size, s) for size, s in zip(sizes, seeds)]
+
+    if n_jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as executor:
+            chunks: List[Dict[str, np.ndarray]] = list(
+                executor.map(_resample_metrics, *zip(*tasks))
+            )
+    else:
+        chunks = [_resample_metrics(*task) for task in tasks]
+
+    samples = {
+        metric: np.concatenate([chunk[metric] for chunk in chunks])
+        for metric in BOOTSTRAP_METRICS
+    }
+    return BootstrapResult(
+        runs=runs,
+        point=point[list(BOOTSTRAP_METRICS)],
+        samples=samples,
+        method=method,
+        block_size=block_size,
+    )
@@ -0,0 +1,236 @@
+"""
+Checkpointing and decision caching for TradingAgents backtests.
+
+TradingAgents decisions are expensive (many LLM calls per day), so:
+- DecisionCheckpoint appends each day's decision to a JSONL file as soon as
+  it is made, so an interrupted run can resume where it stopped
+- DecisionCache keeps decisions keyed by (ticker, date, config fingerprint)
+  across runs, so re-running with different sizing or capital replays them
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+# Config keys that do not affect decisions (local paths and cache tuning)
+FINGERPRINT_EXCLUDED_KEYS = (
+    "project_dir",
+    "results_dir",
+    "data_cache_dir",
+    "frame_store_max_mb",
+    "fundamentals_ttl_hours",
+)
+
+
+def config_fingerprint(
+    config: Dict[str, Any],
+    selected_analysts: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Hash the parts of a TradingAgents config that affect decisions.
+
+    Args:
+        config: TradingAgents config dictionary
+        selected_analysts: Analysts included in the graph
+
+    Returns:
+        Short hex digest, stable across processes and key order
+    """
+    payload = {
+        key: value
+        for key, value in config.items()
+        if key not in FINGERPRINT_EXCLUDED_KEYS
+    }
+    if selected_analysts is not None:
+        payload["selected_analysts"] = list(selected_analysts)
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def _append_jsonl(path: str, records: List[Dict[str, Any]]):
+    """Append records to a JSONL file and flush them to disk."""
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_jsonl(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a JSONL file written by _append_jsonl().
+
+    A partial last line (from a crash mid-write) is dropped and truncated
+    away so later appends start on a clean line.
+    """
+    if not os.path.exists(path):
+        return []
+
+    with open(path, "rb") as f:
+        content = f.read()
+
+    end = content.rfind(b"\n") + 1
+    if end < len(content):
+        with open(path, "r+b") as f:
+            f.truncate(end)
+
+    records = []
+    for line_no, line in enumerate(content[:end].splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Corrupt record at {path}:{line_no}: {e}") from e
+    return records
+
+
+class DecisionCheckpoint:
+    """
+    Append-only log of one TradingAgents backtest's daily decisions.
+
+    The first record is a header with the ticker and config fingerprint;
+    each following record is one day's decision or error.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize checkpoint.
+
+        Args:
+            path: JSONL file to write decisions to
+        """
+        self.path = path
+
+    def open(
+        self,
+        ticker: str,
+        fingerprint: str,
+        resume: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Start or resume a checkpoint.
+
+        Args:
+            ticker: Stock symbol of the run
+            fingerprint: Config fingerprint of the run
+            resume: Keep existing decisions; otherwise start a fresh file
+
+        Returns:
+            Completed decision records keyed by date string (errors excluded,
+            so those days are retried)
+
+        Raises:
+            ValueError: If the existing checkpoint is for another ticker or config
+        """
+        records = _read_jsonl(self.path) if resume else []
+
+        if not records:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8"):
+                pass
+            _append_jsonl(
+                self.path,
+                [{"type": "header", "ticker": ticker, "fingerprint": fingerprint}],
+            )
+            return {}
+
+        header = records[0]
+        if header.get("type") != "header":
+            raise ValueError(f"Checkpoint {self.path} has no header record")
+        if header.get("ticker") != ticker or header.get("fingerprint") != fingerprint:
+            raise ValueError(
+                f"Checkpoint {self.path} is for {header.get('ticker')} with config "
+                f"{header.get('fingerprint')}, not {ticker} with config {fingerprint}"
+            )
+
+        completed = {}
+        for record in records[1:]:
+            if record.get("type") == "decision":
+                completed[record["date"]] = record
+            else:
+                completed.pop(record.get("date"), None)
+        return completed
+
+    def append_decision(self, date: str, decision: str, price: float):
+        """Persist one day's decision."""
+        _append_jsonl(
+            self.path,
+            [{"type": "decision", "date": date, "decision": decision, "price": price}],
+        )
+
+    def append_error(self, date: str, error: str, price: float):
+        """Persist a failed day so it is retried on resume."""
+        _append_jsonl(
+            self.path,
+            [{"type": "error", "date": date, "error": error, "price": price}],
+        )
+
+
+class DecisionCache:
+    """
+    Persistent TradingAgents decisions keyed by (ticker, date, fingerprint).
+
+    Each fingerprint has its own append-only JSONL file in cache_dir, loaded
+    into memory on first use.
+    """
+
+    def __init__(self, cache_dir: str = "backtesting/decision_cache"):
+        """
+        Initialize decision cache.
+
+        Args:
+            cache_dir: Directory to store decision files in
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._decisions: Dict[str, Dict[tuple, str]] = {}
+
+    def _path(self, fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, f"{fingerprint}.jsonl")
+
+    def _load(self, fingerprint: str) -> Dict[tuple, str]:
+        decisions = self._decisions.get(fingerprint)
+        if decisions is None:
+            decisions = {
+                (record["ticker"], record["date"]): record["decision"]
+                for record in _read_jsonl(self._path(fingerprint))
+            }
+            self._decisions[fingerprint] = decisions
+        return decisions
+
+    def get(self, ticker: str, date: str, fingerprint: str) -> Optional[str]:
+        """
+        Look up a cached decision.
+
+        Args:
+            ticker: Stock symbol
+            date: Trade date (YYYY-MM-DD)
+            fingerprint: Config fingerprint
+
+        Returns:
+            Decision string, or None if not cached
+        """
+        return self._load(fingerprint).get((ticker, date))
+
+    def put(self, ticker: str, date: str, fingerprint: str, decision: str):
+        """
+        Store a decision.
+
+        Args:
+            ticker: Stock symbol
+            date: Trade date (YYYY-MM-DD)
+            fingerprint: Config fingerprint
+            decision: Decision string returned by the trading graph
+        """
+        decisions = self._load(fingerprint)
+        if decisions.get((ticker, date)) == decision:
+            return
+        decisions[(ticker, date)] = decision
+        _append_jsonl(
+            self._path(fingerprint),
+            [{"ticker": ticker, "date": date, "decision": decision}],
+        )
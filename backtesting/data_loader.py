@@ -4,31 +4,177 @@ Data loading utilities for backtesting.
 Handles downloading and caching of historical price data.
 """
 
+import json
 import os
+import tempfile
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+import numpy as np
 import pandas as pd
-import yfinance as yf
+
+from .sources import PriceSource, YFinanceSource
+
+# File extension of each supported cache format
+CACHE_FORMATS = {"npz": ".npz", "parquet": ".parquet", "csv": ".csv"}
+
+# Suffix of the per-ticker file recording the date range a store covers
+META_SUFFIX = ".meta.json"
+
+
+class PriceSeries:
+    """
+    Positional, zero-copy accessor over a date-sorted price DataFrame.
+
+    Dates are resolved with a binary search on the index and rows are
+    returned as positional ``iloc`` slices, which share memory with the
+    underlying frame. Per-day lookups therefore cost O(log n) and allocate
+    nothing proportional to the length of the history. Callers must treat
+    the returned frames as read-only.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize accessor.
+
+        Args:
+            data: Price data DataFrame with a DatetimeIndex
+        """
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+        self.data = data
+        self.index = data.index
+        self.close = data["Close"].to_numpy()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def position(self, date: datetime) -> int:
+        """
+        Number of rows dated on or before a date.
+
+        Args:
+            date: Cutoff date
+
+        Returns:
+            End position (exclusive) for slicing up to the date
+        """
+        return int(self.index.searchsorted(pd.Timestamp(date), side="right"))
+
+    def window(self, stop: int, start: int = 0) -> pd.DataFrame:
+        """
+        Rows in positions [start, stop) as a view.
+
+        Args:
+            stop: End position (exclusive)
+            start: Start position
+
+        Returns:
+            Sliced DataFrame sharing memory with the full frame
+        """
+        return self.data.iloc[start:stop]
+
+    def up_to(self, date: datetime) -> pd.DataFrame:
+        """
+        Rows up to and including a date as a view.
+
+        Args:
+            date: Cutoff date
+
+        Returns:
+            Sliced DataFrame sharing memory with the full frame
+        """
+        return self.window(self.position(date))
+
+    def price_at(self, date: datetime) -> float:
+        """
+        Closing price on a date, or on the nearest previous trading day.
+
+        Args:
+            date: Target date
+
+        Returns:
+            Closing price
+
+        Raises:
+            ValueError: If there is no row on or before the date
+        """
+        stop = self.position(date)
+        if stop == 0:
+            raise ValueError(f"No price data available on or before {date}")
+        return self.close[stop - 1]
+
+    def bounds(self, start_date: datetime, end_date: datetime) -> tuple:
+        """
+        Positional bounds of the rows in [start_date, end_date].
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            (start, stop) positions, stop exclusive
+        """
+        start = int(self.index.searchsorted(pd.Timestamp(start_date), side="left"))
+        return start, max(start, self.position(end_date))
+
+    def trading_days(self, start_date: datetime, end_date: datetime) -> pd.DatetimeIndex:
+        """
+        Dates in [start_date, end_date] as an index view.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            DatetimeIndex of trading days
+        """
+        start, stop = self.bounds(start_date, end_date)
+        return self.index[start:stop]
 
 
 class DataLoader:
     """
     Load and cache historical stock data for backtesting.
 
-    Uses yfinance as the data source and caches data locally
-    to avoid repeated API calls.
+    Uses a PriceSource (yfinance by default) for prices and caches data
+    locally to avoid repeated API calls. Each ticker has one canonical store
+    (a data file plus a metadata file with the date range it covers), so
+    overlapping or shifted windows reuse the days already downloaded.
+
+    Cache formats:
+    - npz (default): typed NumPy columns and a datetime64 index, no parsing
+    - parquet: typed columnar file (requires pyarrow or fastparquet)
+    - csv: human-readable text, parsed on every load
+
+    Stores of non-persistent sources (e.g. SyntheticSource) are kept in
+    memory only.
     """
 
-    def __init__(self, cache_dir: str = "backtesting/data_cache"):
+    def __init__(
+        self,
+        cache_dir: str = "backtesting/data_cache",
+        cache_format: str = "npz",
+        source: Optional[PriceSource] = None,
+    ):
         """
         Initialize data loader.
 
         Args:
             cache_dir: Directory to cache downloaded data
+            cache_format: File format of the cache ('npz', 'parquet' or 'csv')
+            source: Price source (YFinanceSource if None)
         """
+        if cache_format not in CACHE_FORMATS:
+            raise ValueError(
+                f"Unknown cache format {cache_format!r}, choose from {list(CACHE_FORMATS)}"
+            )
         self.cache_dir = cache_dir
-        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_format = cache_format
+        self.source = source or YFinanceSource()
+        if self.source.persistent:
+            os.makedirs(cache_dir, exist_ok=True)
         self._data_cache: Dict[str, pd.DataFrame] = {}
+        self._coverage: Dict[str, tuple] = {}
 
     def load_data(
         self,
@@ -36,68 +182,376 @@ class DataLoader:
         start_date: datetime,
         end_date: datetime,
         use_cache: bool = True,
+        copy: bool = True,
     ) -> pd.DataFrame:
         """
         Load historical price data for a ticker.
 
+        Data is served from one canonical per-ticker store: any range it
+        already covers is a slice, and only missing leading or trailing
+        days are downloaded and merged in.
+
         Args:
             ticker: Stock symbol (e.g., 'AAPL')
             start_date: Start date for data
             end_date: End date for data
             use_cache: Whether to use cached data if available
+            copy: Return a private copy. With False a view of the cached
+                store is returned and must not be modified.
 
         Returns:
-            DataFrame with OHLCV data
+            DataFrame with OHLCV data, sorted by date
         """
-        cache_key = (
-            f"{ticker}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}"
-        )
+        first, last = self._needed_range(start_date, end_date)
 
-        # Check memory cache
-        if use_cache and cache_key in self._data_cache:
-            return self._data_cache[cache_key].copy()
+        if not use_cache:
+            df = self._download(ticker, first, last)
+            if df.empty:
+                raise ValueError(f"No data found for {ticker}")
+            return df
 
-        # Check file cache
-        cache_file = os.path.join(
-            self.cache_dir,
-            f"{ticker}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv",
-        )
+        store = self._ensure_range(ticker, first, last)
+        lo = store.index.searchsorted(first, side="left")
+        hi = store.index.searchsorted(last + timedelta(days=1), side="left")
+        df = store.iloc[lo:hi]
 
-        if use_cache and os.path.exists(cache_file):
-            df = pd.read_csv(cache_file, parse_dates=["Date"], index_col="Date")
-            self._data_cache[cache_key] = df
-            return df.copy()
+        if df.empty:
+            raise ValueError(f"No data found for {ticker}")
 
-        # Download from yfinance
-        print(
-            f"Downloading data for {ticker} from {start_date.date()} to {end_date.date()}..."
-        )
+        return df.copy() if copy else df
 
-        ticker_obj = yf.Ticker(ticker.upper())
+    def prefetch(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        batch_size: int = 100,
+    ) -> List[str]:
+        """
+        Fill the cache for many tickers with grouped multi-symbol downloads.
 
-        # Add buffer days for indicator calculation
-        buffer_start = start_date - timedelta(days=365)  # 1 year buffer
+        Tickers missing the same date span are downloaded together, up to
+        batch_size symbols per request, and split into their own stores.
+        Ranges already cached are not downloaded again.
 
-        df = ticker_obj.history(
-            start=buffer_start.strftime("%Y-%m-%d"),
-            end=(end_date + timedelta(days=1)).strftime("%Y-%m-%d"),
-        )
+        Args:
+            tickers: Stock symbols
+            start_date: Start date for data
+            end_date: End date for data
+            batch_size: Maximum symbols per download request
 
-        if df.empty:
-            raise ValueError(f"No data found for {ticker}")
+        Returns:
+            Tickers for which no data could be downloaded
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        first, last = self._needed_range(start_date, end_date)
+
+        # Group tickers by the span each one is missing
+        pending = {}
+        groups: Dict[tuple, List[str]] = {}
+        for ticker in dict.fromkeys(tickers):
+            store, coverage = self._load_store(ticker)
+            spans = self._missing_spans(store, coverage, first, last)
+            if spans:
+                pending[ticker] = (store, coverage, spans)
+            for span in spans:
+                groups.setdefault(span, []).append(ticker)
+
+        downloaded: Dict[str, Dict[tuple, pd.DataFrame]] = {t: {} for t in pending}
+        failed = set()
+        for span, group in groups.items():
+            for i in range(0, len(group), batch_size):
+                batch = group[i : i + batch_size]
+                try:
+                    frames = self._download_many(batch, *span)
+                except Exception as e:
+                    print(f"Error downloading {', '.join(batch)}: {e}")
+                    failed.update(batch)
+                    continue
+                for ticker in batch:
+                    downloaded[ticker][span] = frames.get(ticker, pd.DataFrame())
+
+        for ticker, (store, coverage, spans) in pending.items():
+            if ticker in failed:
+                continue
+            downloads = [downloaded[ticker][span] for span in spans]
+            if self._extend(ticker, store, coverage, first, last, downloads).empty:
+                failed.add(ticker)
+
+        failed_tickers = [t for t in dict.fromkeys(tickers) if t in failed]
+        if failed_tickers:
+            print(f"No data downloaded for: {', '.join(failed_tickers)}")
+        return failed_tickers
+
+    @staticmethod
+    def _needed_range(start_date: datetime, end_date: datetime) -> tuple:
+        """Dates [first, last] to hold for a request, including the indicator buffer."""
+        first = pd.Timestamp(start_date).normalize() - timedelta(days=365)  # 1 year buffer
+        return first, pd.Timestamp(end_date).normalize()
+
+    def _ensure_range(
+        self, ticker: str, first: pd.Timestamp, last: pd.Timestamp
+    ) -> pd.DataFrame:
+        """Make the ticker's store cover [first, last] and return it."""
+        store, coverage = self._load_store(ticker)
+        spans = self._missing_spans(store, coverage, first, last)
+        if not spans:
+            return store
+        downloads = [self._download(ticker, *span) for span in spans]
+        return self._extend(ticker, store, coverage, first, last, downloads)
+
+    @staticmethod
+    def _missing_spans(
+        store: Optional[pd.DataFrame],
+        coverage: Optional[tuple],
+        first: pd.Timestamp,
+        last: pd.Timestamp,
+    ) -> List[tuple]:
+        """
+        Date spans to download so a store covers [first, last].
+
+        Edge spans reach the first or last stored bar, so each download
+        overlaps the store by at least one row.
+        """
+        if store is None:
+            return [(first, last)]
+        spans = []
+        if first < coverage[0]:
+            spans.append((first, store.index[0]))
+        if last > coverage[1]:
+            spans.append((store.index[-1], last))
+        return spans
+
+    def _extend(
+        self,
+        ticker: str,
+        store: Optional[pd.DataFrame],
+        coverage: Optional[tuple],
+        first: pd.Timestamp,
+        last: pd.Timestamp,
+        downloads: List[pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Merge the downloads for _missing_spans() into a store and save it.
+
+        If a download's overlapping Close differs from the store (the
+        provider re-adjusted history for a dividend or split), the whole
+        covered range is downloaded again so the store never mixes
+        adjustment bases.
+        """
+        if store is None:
+            store = downloads[0]
+            if store.empty:
+                return store
+            coverage = (first, last)
+        else:
+            merged = store
+            for new in downloads:
+                merged = self._merge(merged, new)
+                if merged is None:
+                    break
+
+            coverage = (min(first, coverage[0]), max(last, coverage[1]))
+            if merged is None:
+                print(f"Adjusted prices for {ticker} changed, refreshing cached history...")
+                merged = self._download(ticker, *coverage)
+            store = merged
+
+        # Today's bar may still be incomplete, so never mark it as covered or
+        # keep it: the next load fetches it again from the last complete bar
+        # instead of finding it changed and refreshing the whole history
+        today = pd.Timestamp.today().normalize()
+        coverage = (coverage[0], min(coverage[1], today - timedelta(days=1)))
+        complete = store.index.searchsorted(coverage[1] + timedelta(days=1), side="left")
+        self._save_store(ticker, store.iloc[:complete], coverage)
+        return store
+
+    @staticmethod
+    def _merge(store: pd.DataFrame, new: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Merge downloaded rows into a store.
 
+        Returns:
+            Merged, sorted frame, or None if the rows overlapping the store
+            disagree on Close
+        """
+        if new.empty:
+            return store
+        if store.empty:
+            return new
+
+        overlap = new.index.intersection(store.index)
+        if len(overlap) and not np.allclose(
+            new.loc[overlap, "Close"].to_numpy(),
+            store.loc[overlap, "Close"].to_numpy(),
+            rtol=1e-9,
+            atol=0.0,
+            equal_nan=True,
+        ):
+            return None
+
+        merged = pd.concat([store, new[~new.index.isin(store.index)]])
+        if not merged.index.is_monotonic_increasing:
+            merged = merged.sort_index()
+        return merged
+
+    def _download(
+        self, ticker: str, first: pd.Timestamp, last: pd.Timestamp
+    ) -> pd.DataFrame:
+        """
+        Fetch daily bars in [first, last] from the source.
+
+        Returns:
+            Cleaned DataFrame (possibly empty)
+        """
+        return self._clean_history(self.source.fetch(ticker, first, last))
+
+    def _download_many(
+        self, tickers: List[str], first: pd.Timestamp, last: pd.Timestamp
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily bars in [first, last] for several tickers at once.
+
+        Returns:
+            Cleaned DataFrame per ticker; tickers without data are omitted
+        """
+        frames = self.source.fetch_many(tickers, first, last)
+        return {ticker: self._clean_history(df) for ticker, df in frames.items()}
+
+    @staticmethod
+    def _clean_history(df: pd.DataFrame) -> pd.DataFrame:
+        """Give downloaded bars a naive, sorted 'Date' index."""
         # Clean up index
         if df.index.tz is not None:
             df.index = df.index.tz_localize(None)
 
         df.index.name = "Date"
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        return df
+
+    def _load_store(self, ticker: str) -> tuple:
+        """
+        Get a ticker's store and covered date range from memory or disk.
+
+        Returns:
+            (store, (first, last)) or (None, None) if nothing is cached
+        """
+        if ticker in self._data_cache:
+            return self._data_cache[ticker], self._coverage[ticker]
+        if not self.source.persistent:
+            return None, None
+
+        store_file = self._cache_path(ticker)
+        meta_file = self._meta_path(ticker)
+        if not (os.path.exists(store_file) and os.path.exists(meta_file)):
+            return None, None
+
+        with open(meta_file, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        coverage = (pd.Timestamp(meta["start"]), pd.Timestamp(meta["end"]))
+
+        store = self._read_cache(store_file, self.cache_format)
+        if not store.index.is_monotonic_increasing:
+            store = store.sort_index()
+
+        self._data_cache[ticker] = store
+        self._coverage[ticker] = coverage
+        return store, coverage
+
+    def _save_store(self, ticker: str, store: pd.DataFrame, coverage: tuple):
+        """
+        Persist a ticker's store and covered date range.
 
-        # Cache the data
-        if use_cache:
-            df.to_csv(cache_file)
-            self._data_cache[cache_key] = df
+        The data file is replaced before its metadata, so a crash in between
+        leaves metadata that under-reports coverage, never over-reports it.
+        """
+        if not self.source.persistent:
+            self._data_cache[ticker] = store
+            self._coverage[ticker] = coverage
+            return
+
+        self._write_cache(store, self._cache_path(ticker), self.cache_format)
+
+        meta = {
+            "start": coverage[0].strftime("%Y-%m-%d"),
+            "end": coverage[1].strftime("%Y-%m-%d"),
+        }
+        meta_file = self._meta_path(ticker)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_path, meta_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        self._data_cache[ticker] = store
+        self._coverage[ticker] = coverage
+
+    def _cache_path(self, cache_key: str, cache_format: Optional[str] = None) -> str:
+        """Path of the cache file for a key in a format (default: own format)."""
+        extension = CACHE_FORMATS[cache_format or self.cache_format]
+        return os.path.join(self.cache_dir, f"{cache_key}{extension}")
+
+    def _meta_path(self, ticker: str) -> str:
+        """Path of the coverage metadata file of a ticker's store."""
+        return os.path.join(self.cache_dir, f"{ticker}{META_SUFFIX}")
+
+    @staticmethod
+    def _read_cache(path: str, cache_format: str) -> pd.DataFrame:
+        """Read a cached price DataFrame."""
+        if cache_format == "npz":
+            with np.load(path, allow_pickle=False) as archive:
+                columns = archive["columns"].tolist()
+                return pd.DataFrame(
+                    {name: archive[f"col_{i}"] for i, name in enumerate(columns)},
+                    index=pd.DatetimeIndex(archive["index"], name="Date"),
+                )
+        if cache_format == "parquet":
+            return pd.read_parquet(path)
+        # round_trip parsing so cached prices match the downloaded floats
+        return pd.read_csv(
+            path,
+            parse_dates=["Date"],
+            index_col="Date",
+            float_precision="round_trip",
+        )
+
+    @staticmethod
+    def _write_cache(df: pd.DataFrame, path: str, cache_format: str):
+        """
+        Write a price DataFrame to the cache.
 
-        return df.copy()
+        Writes to a temporary file and renames it into place, so concurrent
+        readers never see a partial file.
+        """
+        directory = os.path.dirname(path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if cache_format == "npz":
+                    arrays = {
+                        f"col_{i}": df[name].to_numpy()
+                        for i, name in enumerate(df.columns)
+                    }
+                    np.savez(
+                        f,
+                        index=df.index.to_numpy(),
+                        columns=np.array([str(c) for c in df.columns]),
+                        **arrays,
+                    )
+                elif cache_format == "parquet":
+                    df.to_parquet(f)
+                else:
+                    df.to_csv(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
 
     def get_price(self, ticker: str, date: datetime, data: pd.DataFrame) -> float:
         """
@@ -115,6 +569,14 @@ class DataLoader:
         """
         date_key = pd.Timestamp(date)
 
+        if data.index.is_monotonic_increasing:
+            stop = data.index.searchsorted(date_key, side="right")
+            if stop == 0:
+                raise ValueError(
+                    f"No price data available for {ticker} on or before {date}"
+                )
+            return data["Close"].iloc[stop - 1]
+
         # Try exact date
         if date_key in data.index:
             return data.loc[date_key, "Close"]
@@ -138,8 +600,11 @@ class DataLoader:
             date: Cutoff date
 
         Returns:
-            Filtered DataFrame
+            Filtered DataFrame (a positional view when the index is sorted)
         """
+        if data.index.is_monotonic_increasing:
+            stop = data.index.searchsorted(pd.Timestamp(date), side="right")
+            return data.iloc[:stop]
         return data[data.index <= pd.Timestamp(date)]
 
     def get_trading_days(
@@ -147,6 +612,7 @@ class DataLoader:
         ticker: str,
         start_date: datetime,
         end_date: datetime,
+        data: Optional[pd.DataFrame] = None,
     ) -> list:
         """
         Get list of trading days for a ticker in date range.
@@ -155,11 +621,16 @@ class DataLoader:
             ticker: Stock symbol
             start_date: Start date
             end_date: End date
+            data: Already-loaded price data; loaded (without copying) if None
 
         Returns:
             List of trading days (datetime objects)
         """
-        data = self.load_data(ticker, start_date, end_date)
+        if data is None:
+            data = self.load_data(ticker, start_date, end_date, copy=False)
+
+        if data.index.is_monotonic_increasing:
+            return PriceSeries(data).trading_days(start_date, end_date).tolist()
 
         # Filter to requested date range
         mask = (data.index >= start_date) & (data.index <= end_date)
@@ -170,8 +641,13 @@ class DataLoader:
     def clear_cache(self):
         """Clear all cached data."""
         self._data_cache.clear()
+        self._coverage.clear()
+
+        if not os.path.isdir(self.cache_dir):
+            return
 
-        # Clear file cache
+        # Clear file cache (all formats and coverage metadata)
+        extensions = tuple(CACHE_FORMATS.values()) + (META_SUFFIX,)
         for file in os.listdir(self.cache_dir):
-            if file.endswith(".csv"):
+            if file.endswith(extensions):
                 os.remove(os.path.join(self.cache_dir, file))
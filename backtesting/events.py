@@ -0,0 +1,260 @@
+"""
+Event hooks for backtest progress reporting.
+
+The Backtester reports what it is doing through observers instead of
+printing directly:
+- on_start: a run begins (ticker, strategy, period, number of days)
+- on_bar: a trading day has been simulated
+- on_trade: a trade was executed
+- on_finish: a run completed, with its results dictionary
+- on_message: any other status line (resume notices, errors, ...)
+
+Only hooks an observer overrides are dispatched, and per-bar events are
+not even constructed when nobody handles on_bar, so a run with no
+observers (silent mode) does no reporting work at all.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+HOOKS = ("on_start", "on_bar", "on_trade", "on_finish", "on_message")
+
+
+@dataclass
+class RunInfo:
+    """Description of a run, passed to on_start."""
+
+    kind: str  # 'benchmark', 'tradingagents' or 'portfolio'
+    ticker: str
+    strategy: str
+    start_date: datetime
+    end_date: datetime
+    initial_capital: float
+    n_days: int
+    progress_every: int = 20  # suggested bars between progress lines
+
+
+@dataclass
+class BarEvent:
+    """One simulated trading day, passed to on_bar."""
+
+    ticker: str
+    date: datetime
+    step: int  # 1-based day number within the run
+    total: int
+    price: float
+    signal: Optional[str]
+    portfolio: Any  # Portfolio after the day's trades; read-only
+
+
+@dataclass
+class TradeEvent:
+    """One executed trade, passed to on_trade."""
+
+    ticker: str
+    date: datetime
+    action: str  # 'BUY' or 'SELL'
+    shares: float
+    price: float
+
+
+class BacktestObserver:
+    """
+    Base class for backtest observers.
+
+    Override any subset of the hooks; the rest are never called.
+    """
+
+    def on_start(self, info: RunInfo):
+        pass
+
+    def on_bar(self, event: BarEvent):
+        pass
+
+    def on_trade(self, event: TradeEvent):
+        pass
+
+    def on_finish(self, results: Dict[str, Any]):
+        pass
+
+    def on_message(self, message: str):
+        pass
+
+
+def _overrides(observer: Any, hook: str) -> bool:
+    """Whether an observer implements a hook (beyond the no-op default)."""
+    method = getattr(type(observer), hook, None)
+    if method is None:
+        return False
+    return method is not getattr(BacktestObserver, hook)
+
+
+class EventDispatcher:
+    """
+    Fan events out to the observers that handle them.
+
+    Attributes wants_bar and wants_trade let hot loops skip building
+    events nobody will receive.
+    """
+
+    def __init__(self, observers: Iterable[Any] = ()):
+        """
+        Initialize dispatcher.
+
+        Args:
+            observers: Observers to notify, in order
+        """
+        self.observers: List[Any] = list(observers)
+        self._refresh()
+
+    def subscribe(self, observer: Any):
+        """Add an observer."""
+        self.observers.append(observer)
+        self._refresh()
+
+    def unsubscribe(self, observer: Any):
+        """Remove an observer."""
+        self.observers.remove(observer)
+        self._refresh()
+
+    def _refresh(self):
+        self._handlers: Dict[str, List[Callable]] = {
+            hook: [getattr(o, hook) for o in self.observers if _overrides(o, hook)]
+            for hook in HOOKS
+        }
+        self.wants_bar = bool(self._handlers["on_bar"])
+        self.wants_trade = bool(self._handlers["on_trade"])
+
+    def bar_handler(self) -> Optional[Callable[[BarEvent], None]]:
+        """The on_bar dispatch function, or None if nobody handles bars."""
+        return self.bar if self.wants_bar else None
+
+    def start(self, info: RunInfo):
+        for handler in self._handlers["on_start"]:
+            handler(info)
+
+    def bar(self, event: BarEvent):
+        for handler in self._handlers["on_bar"]:
+            handler(event)
+
+    def trade(self, event: TradeEvent):
+        for handler in self._handlers["on_trade"]:
+            handler(event)
+
+    def finish(self, results: Dict[str, Any]):
+        for handler in self._handlers["on_finish"]:
+            handler(results)
+
+    def message(self, message: str):
+        for handler in self._handlers["on_message"]:
+            handler(message)
+
+
+class ConsoleReporter(BacktestObserver):
+    """
+    Print run headers, trades, throttled progress and summaries.
+
+    Progress lines are printed every progress_every bars (default: the
+    run's suggestion) and at most once per min_interval seconds; the last
+    bar always reports.
+    """
+
+    TITLES = {
+        "benchmark": "Running Backtest",
+        "tradingagents": "Running TradingAgents Backtest",
+        "portfolio": "Running Portfolio Backtest",
+    }
+
+    def __init__(
+        self,
+        progress_every: Optional[int] = None,
+        min_interval: float = 0.0,
+        show_trades: bool = True,
+        show_days: Optional[bool] = None,
+    ):
+        """
+        Initialize reporter.
+
+        Args:
+            progress_every: Bars between progress lines (None: per run)
+            min_interval: Minimum seconds between progress lines
+            show_trades: Print every executed trade
+            show_days: Print a status line for every day (None: only for
+                TradingAgents runs, whose days are slow)
+        """
+        self.progress_every = progress_every
+        self.min_interval = min_interval
+        self.show_trades = show_trades
+        self.show_days = show_days
+        self._every = 20
+        self._days = False
+        self._last_report = 0.0
+
+    def on_start(self, info: RunInfo):
+        print(f"\n{'=' * 60}")
+        print(f"{self.TITLES.get(info.kind, 'Running Backtest')}: {info.ticker}")
+        if info.kind != "tradingagents":
+            print(f"Strategy: {info.strategy}")
+        print(f"Period: {info.start_date.date()} to {info.end_date.date()}")
+        print(f"Initial Capital: ${info.initial_capital:,.2f}")
+        print(f"{'=' * 60}\n")
+        print(f"Total trading days: {info.n_days}")
+
+        self._every = self.progress_every or info.progress_every
+        self._days = (
+            self.show_days if self.show_days is not None else info.kind == "tradingagents"
+        )
+        self._last_report = float("-inf")
+
+    def on_bar(self, event: BarEvent):
+        if self._days:
+            position = event.portfolio.get_position(event.ticker)
+            shares = position.shares if position else 0
+            value = event.portfolio.get_total_value({event.ticker: event.price})
+            print(
+                f"[{event.date.date()}] Signal: {event.signal:>4} | Price: ${event.price:>8.2f} | "
+                f"Shares: {shares:>7.2f} | Portfolio: ${value:>12,.2f}"
+            )
+
+        last = event.step == event.total
+        if event.step % self._every and not last:
+            return
+        now = time.monotonic()
+        if not last and now - self._last_report < self.min_interval:
+            return
+        self._last_report = now
+        progress = event.step / event.total * 100
+        print(f"Progress: {progress:.1f}% ({event.step}/{event.total} days)")
+
+    def on_trade(self, event: TradeEvent):
+        # Daily status lines already show the position after each trade
+        if self.show_trades and not self._days:
+            print(
+                f"[{event.date.date()}] {event.action} {event.shares:.2f} shares "
+                f"@ ${event.price:.2f}"
+            )
+
+    def on_finish(self, results: Dict[str, Any]):
+        metrics = results["metrics"]
+        print(f"\n{'=' * 60}")
+        print(f"BACKTEST SUMMARY: {results['ticker']} - {results['strategy']}")
+        print(f"{'=' * 60}")
+        print(f"Period: {results['start_date'].date()} to {results['end_date'].date()}")
+        print(f"Initial Capital: ${results['initial_capital']:,.2f}")
+        print(f"Final Value: ${results['final_value']:,.2f}")
+        print(f"Total Return: {results['total_return_pct']:.2f}%")
+        print(f"Number of Trades: {results['num_trades']}")
+        print(f"\nPerformance Metrics:")
+        print(f"  Cumulative Return (CR%): {metrics.cumulative_return_pct:.2f}%")
+        print(f"  Annualized Return (ARR%): {metrics.annualized_return_pct:.2f}%")
+        print(f"  Sharpe Ratio: {metrics.sharpe_ratio:.2f}")
+        print(f"  Max Drawdown (MDD%): {metrics.max_drawdown_pct:.2f}%")
+        print(f"  Volatility: {metrics.volatility_pct:.2f}%")
+        if metrics.win_rate_pct:
+            print(f"  Win Rate: {metrics.win_rate_pct:.2f}%")
+        print(f"{'=' * 60}\n")
+
+    def on_message(self, message: str):
+        print(message)
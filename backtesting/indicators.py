@@ -0,0 +1,138 @@
+"""
+Memoized indicator series for benchmark strategies.
+
+An IndicatorCache wraps one price DataFrame and computes each distinct
+(indicator, window) pair at most once, so many strategy instances, for
+example every point of a parameter grid, can share the same series.
+Results use the same pandas operations as the strategies' own helpers and
+are therefore bitwise identical to them.
+"""
+
+from typing import Callable, Dict, Hashable
+import pandas as pd
+
+
+class IndicatorCache:
+    """
+    Per-frame cache of indicator series keyed by indicator and window.
+
+    Returned series are shared between callers and must not be modified.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize cache.
+
+        Args:
+            data: Full historical price data (sorted by date)
+        """
+        self.data = data
+        self._series: Dict[Hashable, pd.Series] = {}
+
+    def _get(self, key: Hashable, compute: Callable[[], pd.Series]) -> pd.Series:
+        """Return the cached series for key, computing it on first use."""
+        series = self._series.get(key)
+        if series is None:
+            series = compute()
+            self._series[key] = series
+        return series
+
+    def ema(self, span: int, column: str = "Close") -> pd.Series:
+        """Exponential moving average (adjust=False)."""
+        return self._get(
+            ("ema", column, span),
+            lambda: self.data[column].ewm(span=span, adjust=False).mean(),
+        )
+
+    def sma(self, window: int, column: str = "Close") -> pd.Series:
+        """Simple moving average."""
+        return self._get(
+            ("sma", column, window),
+            lambda: self.data[column].rolling(window=window).mean(),
+        )
+
+    def rolling_std(self, window: int, column: str = "Close") -> pd.Series:
+        """Rolling sample standard deviation."""
+        return self._get(
+            ("std", column, window),
+            lambda: self.data[column].rolling(window=window).std(),
+        )
+
+    def rolling_min(self, window: int, column: str = "Low") -> pd.Series:
+        """Rolling minimum."""
+        return self._get(
+            ("min", column, window),
+            lambda: self.data[column].rolling(window=window).min(),
+        )
+
+    def rolling_max(self, window: int, column: str = "High") -> pd.Series:
+        """Rolling maximum."""
+        return self._get(
+            ("max", column, window),
+            lambda: self.data[column].rolling(window=window).max(),
+        )
+
+    def macd(self, fast: int, slow: int) -> pd.Series:
+        """MACD line: fast EMA minus slow EMA."""
+        return self._get(
+            ("macd", fast, slow), lambda: self.ema(fast) - self.ema(slow)
+        )
+
+    def macd_signal(self, fast: int, slow: int, signal: int) -> pd.Series:
+        """Signal line: EMA of the MACD line."""
+        return self._get(
+            ("macd_signal", fast, slow, signal),
+            lambda: self.macd(fast, slow).ewm(span=signal, adjust=False).mean(),
+        )
+
+    def rsi(self, period: int) -> pd.Series:
+        """Relative Strength Index from rolling mean gains and losses."""
+
+        def compute() -> pd.Series:
+            avg_gains = self._gains().rolling(window=period).mean()
+            avg_losses = self._losses().rolling(window=period).mean()
+            rs = avg_gains / avg_losses
+            return 100 - (100 / (1 + rs))
+
+        return self._get(("rsi", period), compute)
+
+    def _gains(self) -> pd.Series:
+        def compute() -> pd.Series:
+            deltas = self.data["Close"].diff()
+            return deltas.where(deltas > 0, 0)
+
+        return self._get(("gains",), compute)
+
+    def _losses(self) -> pd.Series:
+        def compute() -> pd.Series:
+            deltas = self.data["Close"].diff()
+            return -deltas.where(deltas < 0, 0)
+
+        return self._get(("losses",), compute)
+
+    def zscore(self, window: int) -> pd.Series:
+        """Z-score of Close against its rolling mean and standard deviation."""
+        return self._get(
+            ("zscore", window),
+            lambda: (self.data["Close"] - self.sma(window)) / self.rolling_std(window),
+        )
+
+    def kdj(self, period: int, smooth_k: int, smooth_d: int) -> tuple:
+        """K and D lines of the KDJ oscillator."""
+
+        def rsv() -> pd.Series:
+            low_min = self.rolling_min(period)
+            high_max = self.rolling_max(period)
+            return 100 * (self.data["Close"] - low_min) / (high_max - low_min)
+
+        k = self._get(
+            ("kdj_k", period, smooth_k),
+            lambda: self._get(("rsv", period), rsv)
+            .ewm(com=smooth_k - 1, adjust=False)
+            .mean(),
+        )
+        d = self._get(
+            ("kdj_d", period, smooth_k, smooth_d),
+            lambda: k.ewm(com=smooth_d - 1, adjust=False).mean(),
+        )
+        return k, d
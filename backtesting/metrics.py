@@ -6,11 +6,16 @@ Calculates key trading performance metrics:
 - ARR%: Annualized Rate of Return
 - SR: Sharpe Ratio
 - MDD%: Maximum Drawdown
+
+Metrics are available per equity curve (calculate_all_metrics), for many
+curves at once (calculate_batch_metrics) and over rolling windows
+(rolling_sharpe, rolling_volatility, rolling_drawdown).
 """
 
 import numpy as np
 import pandas as pd
-from typing import List, Dict, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Dict, Optional, Union
 from dataclasses import dataclass
 
 
@@ -277,6 +282,240 @@ class MetricsCalculator:
 
         return gross_profit / gross_loss
 
+    @classmethod
+    def calculate_batch_metrics(
+        cls,
+        equity: Union[np.ndarray, pd.DataFrame],
+        risk_free_rate: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """
+        Calculate return and risk metrics for many equity curves at once.
+
+        Uses the same formulas as the single-series helpers, applied to all
+        curves in one vectorized pass.
+
+        Args:
+            equity: Portfolio values, shape (n_days, n_runs), or a DataFrame
+                with one column per run
+            risk_free_rate: Annual risk-free rate for the Sharpe ratio
+
+        Returns:
+            DataFrame with one row per run and columns cumulative_return_pct,
+            annualized_return_pct, sharpe_ratio, max_drawdown_pct,
+            volatility_pct and daily_win_rate_pct (share of positive days
+            among days with a nonzero return; NaN if there are none)
+        """
+        values, labels = cls.runs_by_row(equity)
+        n_runs, n_days = values.shape
+        columns = [
+            "cumulative_return_pct",
+            "annualized_return_pct",
+            "sharpe_ratio",
+            "max_drawdown_pct",
+            "volatility_pct",
+            "daily_win_rate_pct",
+        ]
+        if n_days < 2:
+            metrics = pd.DataFrame(0.0, index=labels, columns=columns)
+            metrics["daily_win_rate_pct"] = np.nan
+            return metrics
+
+        rf = risk_free_rate if risk_free_rate is not None else cls.RISK_FREE_RATE
+        initial, final = values[:, 0], values[:, -1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            total_return = final / initial
+            cr = np.where(initial == 0, 0.0, (total_return - 1) * 100)
+            years = n_days / 252
+            arr = np.where(initial == 0, 0.0, (total_return ** (1 / years) - 1) * 100)
+
+            # Daily returns, as pct_change(); 0/0 days are dropped via nan-reductions
+            returns = values[:, 1:] / values[:, :-1] - 1
+            count = np.sum(~np.isnan(returns), axis=1)
+            mean = np.nanmean(returns, axis=1)
+            std = np.nanstd(returns, axis=1, ddof=1)
+
+            valid = (count >= 2) & (std != 0)
+            sharpe = np.where(valid, (mean - rf / 252) / std * np.sqrt(252), 0.0)
+            vol = np.where(count >= 2, std * np.sqrt(252) * 100, 0.0)
+
+            running_max = np.maximum.accumulate(values, axis=1)
+            drawdown = (values - running_max) / running_max
+            mdd = np.abs(drawdown.min(axis=1)) * 100
+
+            nonzero = np.sum((returns != 0) & ~np.isnan(returns), axis=1)
+            wins = np.sum(returns > 0, axis=1)
+            win_rate = np.where(nonzero > 0, wins / nonzero * 100, np.nan)
+
+        return pd.DataFrame(
+            {
+                "cumulative_return_pct": cr,
+                "annualized_return_pct": arr,
+                "sharpe_ratio": sharpe,
+                "max_drawdown_pct": mdd,
+                "volatility_pct": vol,
+                "daily_win_rate_pct": win_rate,
+            },
+            index=labels,
+        )
+
+    @classmethod
+    def rolling_sharpe(
+        cls,
+        equity: Union[np.ndarray, pd.DataFrame],
+        window: int,
+        risk_free_rate: Optional[float] = None,
+    ) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Annualized Sharpe ratio over a trailing window of daily returns.
+
+        Args:
+            equity: Portfolio values, shape (n_days, n_runs), or a DataFrame
+                with one column per run
+            window: Number of daily returns per window (at least 2)
+            risk_free_rate: Annual risk-free rate
+
+        Returns:
+            Same shape and type as equity; the first window rows are NaN
+        """
+        rf = risk_free_rate if risk_free_rate is not None else cls.RISK_FREE_RATE
+        mean, std = cls._rolling_moments(equity, window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0, (mean - rf / 252) / std * np.sqrt(252), 0.0)
+        sharpe[np.isnan(mean)] = np.nan
+        return cls._like(equity, sharpe)
+
+    @classmethod
+    def rolling_volatility(
+        cls,
+        equity: Union[np.ndarray, pd.DataFrame],
+        window: int,
+    ) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Annualized volatility (%) over a trailing window of daily returns.
+
+        Args:
+            equity: Portfolio values, shape (n_days, n_runs), or a DataFrame
+                with one column per run
+            window: Number of daily returns per window (at least 2)
+
+        Returns:
+            Same shape and type as equity; the first window rows are NaN
+        """
+        _, std = cls._rolling_moments(equity, window)
+        return cls._like(equity, std * np.sqrt(252) * 100)
+
+    @classmethod
+    def rolling_drawdown(
+        cls,
+        equity: Union[np.ndarray, pd.DataFrame],
+        window: int,
+    ) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Drawdown (%) from the highest value of a trailing window.
+
+        Args:
+            equity: Portfolio values, shape (n_days, n_runs), or a DataFrame
+                with one column per run
+            window: Number of days per window, including the current one
+
+        Returns:
+            Same shape and type as equity, as positive percentages; the
+            first window - 1 rows are NaN
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        values, _ = cls.runs_by_row(equity)
+        drawdown = np.full(values.shape, np.nan)
+        if values.shape[1] >= window:
+            peak = sliding_window_view(values, window, axis=1).max(axis=-1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drawdown[:, window - 1 :] = (1 - values[:, window - 1 :] / peak) * 100
+        return cls._like(equity, drawdown)
+
+    @staticmethod
+    def runs_by_row(equity: Union[np.ndarray, pd.DataFrame]) -> tuple:
+        """
+        Lay equity curves out as a C-contiguous (n_runs, n_days) float array.
+
+        Reducing along contiguous rows gives the same rounding as the
+        single-series helpers, so batch consumers (calculate_batch_metrics,
+        bootstrap) should read curves through this.
+
+        Args:
+            equity: (n_days, n_runs) array or DataFrame, or a 1-D curve
+
+        Returns:
+            (values, run labels)
+        """
+        if isinstance(equity, pd.DataFrame):
+            labels = equity.columns
+            values = equity.to_numpy(dtype=float)
+        else:
+            values = np.asarray(equity, dtype=float)
+            if values.ndim == 1:
+                values = values[:, None]
+            if values.ndim != 2:
+                raise ValueError("equity must be 1-D or 2-D (n_days, n_runs)")
+            labels = pd.RangeIndex(values.shape[1])
+        return np.ascontiguousarray(values.T), labels
+
+    @classmethod
+    def _rolling_moments(
+        cls, equity: Union[np.ndarray, pd.DataFrame], window: int
+    ) -> tuple:
+        """
+        Rolling mean and sample std of daily returns from cumulative sums.
+
+        Returns are centred on each run's overall mean before summing to
+        limit cancellation in the variance.
+
+        Returns:
+            (mean, std) arrays of shape (n_runs, n_days), NaN where the
+            window is incomplete
+        """
+        if window < 2:
+            raise ValueError("window must be at least 2")
+        values, _ = cls.runs_by_row(equity)
+        n_runs, n_days = values.shape
+        mean = np.full((n_runs, n_days), np.nan)
+        std = np.full((n_runs, n_days), np.nan)
+        if n_days <= window:
+            return mean, std
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = values[:, 1:] / values[:, :-1] - 1
+        centre = returns.mean(axis=1, keepdims=True)
+        centred = returns - centre
+
+        zeros = np.zeros((n_runs, 1))
+        s1 = np.concatenate([zeros, np.cumsum(centred, axis=1)], axis=1)
+        s2 = np.concatenate([zeros, np.cumsum(centred**2, axis=1)], axis=1)
+        sum1 = s1[:, window:] - s1[:, :-window]
+        sum2 = s2[:, window:] - s2[:, :-window]
+
+        # Row t covers the returns ending on day t
+        mean[:, window:] = sum1 / window + centre
+        var = (sum2 - sum1**2 / window) / (window - 1)
+        # Differences of running sums carry rounding error proportional to
+        # the running total; treat anything below it as zero variance
+        noise = 64 * np.finfo(float).eps * s2[:, window:] / (window - 1)
+        var[var <= noise] = 0.0
+        std[:, window:] = np.sqrt(var)
+        return mean, std
+
+    @staticmethod
+    def _like(
+        equity: Union[np.ndarray, pd.DataFrame], by_row: np.ndarray
+    ) -> Union[np.ndarray, pd.DataFrame]:
+        """Return a (n_runs, n_days) result in the layout of the input."""
+        result = by_row.T
+        if isinstance(equity, pd.DataFrame):
+            return pd.DataFrame(result, index=equity.index, columns=equity.columns)
+        if np.ndim(equity) == 1:
+            return result[:, 0]
+        return result
+
     @staticmethod
     def format_metrics_table(metrics_list: List[Dict], names: List[str]) -> str:
         """
@@ -0,0 +1,421 @@
+"""
+Multi-asset portfolio backtesting.
+
+Aligns the OHLCV data of several tickers into one date x ticker matrix and
+simulates a single book over all of them:
+- Targets are given as per-ticker signals or as target weights
+- The book is rebalanced to its targets on a schedule and whenever they change
+- Holdings are forward-filled between rebalances and valued with matrix
+  operations instead of per-day dict loops
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+
+from .backtester import Backtester
+from .benchmarks import BaseStrategy
+from .data_loader import PriceSeries
+from .events import RunInfo
+from .metrics import MetricsCalculator
+
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+# Calendar rebalance schedules: first trading day of each period
+SCHEDULES = {"weekly": "W", "monthly": "M", "quarterly": "Q"}
+
+
+@dataclass
+class PriceMatrix:
+    """
+    OHLCV data for several tickers on a shared calendar.
+
+    Each field is a (n_days, n_tickers) float array. Prices are
+    forward-filled across days a ticker did not trade and are NaN before
+    its first bar.
+    """
+
+    dates: pd.DatetimeIndex
+    tickers: List[str]
+    fields: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> "PriceMatrix":
+        """
+        Align per-ticker OHLCV DataFrames on the union of their dates.
+
+        Args:
+            frames: Mapping of ticker to its price data
+
+        Returns:
+            PriceMatrix with one column per ticker, in mapping order
+        """
+        tickers = list(frames)
+        dates = pd.DatetimeIndex([])
+        for frame in frames.values():
+            dates = dates.union(frame.index)
+        dates.name = "Date"
+
+        fields = {}
+        for field in FIELDS:
+            columns = {}
+            for ticker, frame in frames.items():
+                column = frame[field].reindex(dates)
+                # Volume is zero, not carried over, on days without a bar
+                columns[ticker] = column.fillna(0) if field == "Volume" else column.ffill()
+            fields[field] = pd.DataFrame(columns, index=dates).to_numpy(dtype=float)
+        return cls(dates=dates, tickers=tickers, fields=fields)
+
+    @property
+    def close(self) -> np.ndarray:
+        """Close price matrix."""
+        return self.fields["Close"]
+
+    def to_frame(self, field: str = "Close") -> pd.DataFrame:
+        """Get one field as a date x ticker DataFrame."""
+        return pd.DataFrame(self.fields[field], index=self.dates, columns=self.tickers)
+
+
+class MultiAssetBacktester(Backtester):
+    """
+    Backtest one book over several tickers.
+
+    Targets come from one of:
+    - weights: date x ticker DataFrame of target portfolio weights
+    - signals: date x ticker DataFrame of 'BUY'/'SELL'/'HOLD' per ticker;
+      each held ticker gets an equal 1/N slot of the book
+    - strategy: factory returning a fresh strategy per ticker; its signals
+      are generated on each ticker's own history, as in run_backtest()
+    """
+
+    def load_matrix(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> tuple:
+        """
+        Load tickers and align them into a price matrix.
+
+        Args:
+            tickers: Stock symbols
+            start_date: Start date for backtest
+            end_date: End date for backtest
+
+        Returns:
+            Tuple of (PriceMatrix, dict of per-ticker DataFrames)
+        """
+        frames = {
+            ticker: PriceSeries(
+                self.data_loader.load_data(ticker, start_date, end_date, copy=False)
+            ).data
+            for ticker in tickers
+        }
+        return PriceMatrix.from_frames(frames), frames
+
+    @staticmethod
+    def strategy_signals(
+        frames: Dict[str, pd.DataFrame],
+        strategy_factory: Callable[[], BaseStrategy],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pd.DataFrame:
+        """
+        Generate per-ticker signals with a fresh strategy for each ticker.
+
+        Args:
+            frames: Mapping of ticker to its price data
+            strategy_factory: Callable returning a new strategy instance
+            start_date: Start date for backtest
+            end_date: End date for backtest
+
+        Returns:
+            DataFrame of signals indexed by date with one column per ticker
+        """
+        columns = {}
+        for ticker, frame in frames.items():
+            strategy = strategy_factory()
+            series = PriceSeries(frame)
+            start, stop = series.bounds(start_date, end_date)
+            columns[ticker] = strategy.generate_signals(
+                series.data, max(start, 1), stop
+            )
+        return pd.DataFrame(columns).fillna("HOLD")
+
+    @staticmethod
+    def signals_to_weights(signals: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert per-ticker BUY/SELL/HOLD signals to equal-slot target weights.
+
+        A ticker is held from a BUY until the next SELL, and each held
+        ticker targets 1/N of the book for N tickers.
+
+        Args:
+            signals: Date x ticker DataFrame of signals
+
+        Returns:
+            Date x ticker DataFrame of target weights
+        """
+        positions = signals.replace({"BUY": 1.0, "SELL": 0.0, "HOLD": np.nan})
+        positions = positions.astype(float).ffill().fillna(0.0)
+        return positions / len(signals.columns)
+
+    @staticmethod
+    def rebalance_days(
+        dates: pd.DatetimeIndex,
+        schedule: Optional[Union[str, int]],
+    ) -> np.ndarray:
+        """
+        Get scheduled rebalance days.
+
+        Args:
+            dates: Trading days of the backtest
+            schedule: None (only when targets change), 'daily', 'weekly',
+                'monthly', 'quarterly', or an interval in trading days
+
+        Returns:
+            Boolean mask over dates; the first day is always included
+        """
+        mask = np.zeros(len(dates), dtype=bool)
+        if schedule is None:
+            pass
+        elif schedule == "daily":
+            mask[:] = True
+        elif isinstance(schedule, int) and not isinstance(schedule, bool):
+            if schedule < 1:
+                raise ValueError(f"Rebalance interval must be >= 1, got {schedule}")
+            mask[::schedule] = True
+        elif schedule in SCHEDULES:
+            periods = dates.to_period(SCHEDULES[schedule]).asi8
+            mask[1:] = periods[1:] != periods[:-1]
+        else:
+            raise ValueError(
+                f"Unknown rebalance schedule {schedule!r}, choose from "
+                f"None, 'daily', {', '.join(repr(s) for s in SCHEDULES)} or an int"
+            )
+        if len(mask):
+            mask[0] = True
+        return mask
+
+    def run_portfolio_backtest(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        weights: Optional[pd.DataFrame] = None,
+        signals: Optional[pd.DataFrame] = None,
+        strategy: Optional[Callable[[], BaseStrategy]] = None,
+        rebalance: Optional[Union[str, int]] = None,
+        name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a backtest of one book over several tickers.
+
+        Exactly one of weights, signals or strategy must be given. Targets
+        are forward-filled onto the aligned calendar; the book trades to
+        them on scheduled rebalance days and whenever they change.
+
+        Args:
+            tickers: Stock symbols
+            start_date: Start date for backtest
+            end_date: End date for backtest
+            weights: Date x ticker target weights (long-only, rows sum <= 1)
+            signals: Date x ticker BUY/SELL/HOLD signals
+            strategy: Factory returning a new strategy instance per ticker
+            rebalance: Rebalance schedule (see rebalance_days())
+            name: Label for the run in results and summaries
+
+        Returns:
+            Dictionary with backtest results
+        """
+        if sum(x is not None for x in (weights, signals, strategy)) != 1:
+            raise ValueError("Pass exactly one of weights, signals or strategy")
+
+        if name is None:
+            name = strategy().name if strategy is not None else "Portfolio"
+
+        matrix, frames = self.load_matrix(tickers, start_date, end_date)
+
+        start = matrix.dates.searchsorted(pd.Timestamp(start_date), side="left")
+        stop = matrix.dates.searchsorted(pd.Timestamp(end_date), side="right")
+        dates = matrix.dates[start:stop]
+        if len(dates) == 0:
+            raise ValueError("No trading days found in specified range")
+
+        self.events.start(
+            RunInfo(
+                kind="portfolio",
+                ticker=", ".join(tickers),
+                strategy=name,
+                start_date=start_date,
+                end_date=end_date,
+                initial_capital=self.initial_capital,
+                n_days=len(dates),
+            )
+        )
+
+        if strategy is not None:
+            signals = self.strategy_signals(frames, strategy, start_date, end_date)
+        if signals is not None:
+            weights = self.signals_to_weights(signals)
+
+        targets = self._align_weights(weights, matrix.tickers, dates)
+        closes = matrix.close[start:stop]
+
+        # Rebalance on schedule and whenever the targets change
+        changed = np.zeros(len(dates), dtype=bool)
+        changed[1:] = (targets[1:] != targets[:-1]).any(axis=1)
+        trade_days = np.flatnonzero(self.rebalance_days(dates, rebalance) | changed)
+
+        shares_path, cash_path, trades_df = self._rebalance(
+            dates, closes, targets, trade_days, matrix.tickers
+        )
+
+        # Value the book for every day with matrix operations
+        positions_value = np.where(shares_path != 0, shares_path * closes, 0.0)
+        total_value = cash_path + positions_value.sum(axis=1)
+        portfolio_df = pd.DataFrame(
+            {
+                "cash": cash_path,
+                "total_value": total_value,
+                "total_return": (total_value - self.initial_capital)
+                / self.initial_capital,
+            },
+            index=pd.Index(dates, name="date"),
+        )
+
+        metrics = MetricsCalculator.calculate_all_metrics(
+            portfolio_df["total_value"],
+            trades_df,
+        )
+
+        final_value = total_value[-1]
+        results = {
+            "ticker": ", ".join(tickers),
+            "tickers": list(tickers),
+            "strategy": name,
+            "start_date": start_date,
+            "end_date": end_date,
+            "initial_capital": self.initial_capital,
+            "final_value": final_value,
+            "total_return_pct": ((final_value / self.initial_capital) - 1) * 100,
+            "num_trades": len(trades_df),
+            "metrics": metrics,
+            "portfolio_history": portfolio_df,
+            "holdings": pd.DataFrame(shares_path, index=dates, columns=matrix.tickers),
+            "weights": pd.DataFrame(targets, index=dates, columns=matrix.tickers),
+            "trades": trades_df,
+            "signals": signals if signals is not None else pd.DataFrame(),
+        }
+
+        self.results[f"{'_'.join(tickers)}_{name}"] = results
+
+        self.events.finish(results)
+
+        return results
+
+    def _align_weights(
+        self,
+        weights: pd.DataFrame,
+        tickers: List[str],
+        dates: pd.DatetimeIndex,
+    ) -> np.ndarray:
+        """Forward-fill target weights onto the backtest calendar and validate."""
+        unknown = set(weights.columns) - set(tickers)
+        if unknown:
+            raise ValueError(f"Weights for unknown tickers: {sorted(unknown)}")
+
+        aligned = weights.reindex(columns=tickers).sort_index()
+        # Carry the latest target from before the window into its first day
+        aligned = aligned.reindex(aligned.index.union(dates)).ffill()
+        targets = aligned.reindex(dates).fillna(0.0).to_numpy(dtype=float)
+
+        if (targets < 0).any():
+            raise ValueError("Target weights must be non-negative (long-only)")
+        if (targets.sum(axis=1) > 1 + 1e-9).any():
+            raise ValueError("Target weights must sum to at most 1 on each day")
+        return targets
+
+    def _rebalance(
+        self,
+        dates: pd.DatetimeIndex,
+        closes: np.ndarray,
+        targets: np.ndarray,
+        trade_days: np.ndarray,
+        tickers: List[str],
+    ) -> tuple:
+        """
+        Trade to target weights on rebalance days and forward-fill holdings.
+
+        Tickers without a price yet are never bought. Only rebalance days are
+        visited; holdings and cash in between are filled by position.
+
+        Returns:
+            Tuple of (shares path, cash path, trades DataFrame)
+        """
+        n_days, n_tickers = closes.shape
+        shares = np.zeros(n_tickers)
+        avg_price = np.zeros(n_tickers)
+        cash = self.initial_capital
+
+        shares_after = np.empty((len(trade_days), n_tickers))
+        cash_after = np.empty(len(trade_days))
+        trades = []
+
+        for k, day in enumerate(trade_days):
+            prices = closes[day]
+            priced = ~np.isnan(prices)
+            value = cash + np.dot(shares[priced], prices[priced])
+
+            target_shares = shares.copy()
+            target_shares[priced] = targets[day, priced] * value / prices[priced]
+            delta = target_shares - shares
+
+            # Sells first so their proceeds fund the buys
+            for i in np.flatnonzero(delta < 0):
+                sold = -delta[i]
+                proceeds = sold * prices[i]
+                cash += proceeds
+                trades.append(
+                    {
+                        "date": dates[day],
+                        "ticker": tickers[i],
+                        "action": "SELL",
+                        "shares": sold,
+                        "price": prices[i],
+                        "value": proceeds,
+                        "realized_pnl": sold * (prices[i] - avg_price[i]),
+                    }
+                )
+            for i in np.flatnonzero(delta > 0):
+                bought = delta[i]
+                cost = bought * prices[i]
+                cash -= cost
+                avg_price[i] = (shares[i] * avg_price[i] + cost) / target_shares[i]
+                trades.append(
+                    {
+                        "date": dates[day],
+                        "ticker": tickers[i],
+                        "action": "BUY",
+                        "shares": bought,
+                        "price": prices[i],
+                        "value": cost,
+                    }
+                )
+
+            shares = target_shares
+            avg_price[shares == 0] = 0.0
+            shares_after[k] = shares
+            cash_after[k] = cash
+
+        # Holdings from the last rebalance on or before each day
+        last = np.searchsorted(trade_days, np.arange(n_days), side="right") - 1
+        shares_path = shares_after[last]
+        cash_path = cash_after[last]
+
+        trades_df = pd.DataFrame(trades)
+        if not trades_df.empty:
+            trades_df.set_index("date", inplace=True)
+        return shares_path, cash_path, trades_df
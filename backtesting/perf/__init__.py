@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the backtesting package.
+
+Benchmarks run on synthetic data and need no network access.
+"""
@@ -0,0 +1,154 @@
+"""
+Benchmark DataLoader cache formats.
+
+Writes synthetic daily OHLCV data for many tickers in each cache format and
+measures how long a fresh DataLoader takes to load all of them from disk.
+
+Usage:
+    python -m backtesting.perf.cache_benchmark
+    python -m backtesting.perf.cache_benchmark --tickers 50 --years 5 --formats csv npz
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+import pandas as pd
+
+from ..data_loader import CACHE_FORMATS, DataLoader
+from ..sources import PriceSource, SyntheticSource
+
+END_DATE = datetime(2024, 12, 31)
+
+
+class FrameSource(PriceSource):
+    """Serves pre-generated frames, so timed writes exclude generating them."""
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]):
+        self.frames = frames
+
+    def fetch(self, ticker: str, first: pd.Timestamp, last: pd.Timestamp) -> pd.DataFrame:
+        return self.frames[ticker].loc[first:last].copy()
+
+
+def available_formats() -> List[str]:
+    """Cache formats usable in this environment."""
+    formats = ["csv", "npz"]
+    try:
+        import pyarrow  # noqa: F401
+
+        formats.append("parquet")
+    except ImportError:
+        try:
+            import fastparquet  # noqa: F401
+
+            formats.append("parquet")
+        except ImportError:
+            pass
+    return formats
+
+
+def benchmark_format(
+    cache_format: str,
+    frames: Dict[str, pd.DataFrame],
+    cache_dir: str,
+    start_date: datetime,
+) -> Dict[str, float]:
+    """
+    Write every frame in one format, then time a cold load of all of them.
+
+    Args:
+        cache_format: Cache format to benchmark
+        frames: Bars per ticker, covering start_date minus DataLoader's
+            one-year indicator buffer through END_DATE
+        cache_dir: Empty directory for the cache
+        start_date: Start date passed to the loader
+
+    Returns:
+        Dictionary with write/load seconds and total size in MB
+    """
+    source = FrameSource(frames)
+    loader = DataLoader(cache_dir=cache_dir, cache_format=cache_format, source=source)
+
+    t0 = time.perf_counter()
+    loader.prefetch(list(frames), start_date, END_DATE)
+    write_s = time.perf_counter() - t0
+
+    size_mb = sum(
+        os.path.getsize(os.path.join(cache_dir, f))
+        for f in os.listdir(cache_dir)
+        if f.endswith(CACHE_FORMATS[cache_format])
+    ) / 1e6
+
+    # Fresh loader so nothing comes from the in-memory cache
+    loader = DataLoader(cache_dir=cache_dir, cache_format=cache_format, source=source)
+    t0 = time.perf_counter()
+    for ticker in frames:
+        loader.load_data(ticker, start_date, END_DATE, copy=False)
+    load_s = time.perf_counter() - t0
+
+    return {"write_s": write_s, "load_s": load_s, "size_mb": size_mb}
+
+
+def run_benchmark(n_tickers: int, years: int, formats: List[str]) -> pd.DataFrame:
+    """
+    Benchmark cache formats on synthetic data.
+
+    Args:
+        n_tickers: Number of tickers
+        years: Years of daily bars per ticker
+        formats: Cache formats to compare
+
+    Returns:
+        DataFrame of timings indexed by format
+    """
+    print(f"Generating {n_tickers} tickers x {years} years of synthetic data...")
+    source = SyntheticSource()
+    last = pd.Timestamp(END_DATE)
+    first = last - pd.DateOffset(years=years)
+    frames = {f"T{i:04d}": source.fetch(f"T{i:04d}", first, last) for i in range(n_tickers)}
+    # DataLoader holds a year before the start date as indicator buffer
+    start_date = (first + timedelta(days=365)).to_pydatetime()
+
+    rows = {}
+    for cache_format in formats:
+        cache_dir = tempfile.mkdtemp(prefix=f"cache_bench_{cache_format}_")
+        try:
+            print(f"Benchmarking {cache_format}...")
+            rows[cache_format] = benchmark_format(cache_format, frames, cache_dir, start_date)
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+    results = pd.DataFrame(rows).T
+    results["load_ms_per_ticker"] = results["load_s"] / n_tickers * 1000
+    if "csv" in results.index:
+        results["load_speedup_vs_csv"] = results.loc["csv", "load_s"] / results["load_s"]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DataLoader cache formats")
+    parser.add_argument("--tickers", type=int, default=500, help="Number of tickers (default: 500)")
+    parser.add_argument("--years", type=int, default=15, help="Years of daily data (default: 15)")
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        default=None,
+        choices=list(CACHE_FORMATS),
+        help="Cache formats to compare (default: all available)",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmark(args.tickers, args.years, args.formats or available_formats())
+
+    print(f"\n{'=' * 80}")
+    print(f"CACHE FORMAT BENCHMARK: {args.tickers} tickers x {args.years} years")
+    print(f"{'=' * 80}")
+    print(results.to_string(float_format=lambda x: f"{x:.3f}"))
+
+
+if __name__ == "__main__":
+    main()
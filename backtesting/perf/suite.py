@@ -0,0 +1,370 @@
+"""
+Performance benchmark suite for the backtesting package.
+
+Runs every benchmark strategy over synthetic price data and records, per
+case, the best wall time over several repeats, the peak traced memory of
+one run and the bars simulated per second:
+- single-ticker Backtester runs over series of 1k/10k/100k bars, in each
+  simulation mode
+- MultiAssetBacktester portfolios of 1/10/100 tickers
+
+Results can be saved as a JSON baseline; later runs are compared against
+it and the suite exits non-zero when a case got slower or used more memory
+than the baseline by more than a threshold. Prices come from a seeded
+SyntheticSource held in memory, so no network or disk access is needed.
+
+Usage:
+    python -m backtesting.perf.suite --save-baseline
+    python -m backtesting.perf.suite --threshold 0.25
+    python -m backtesting.perf.suite --quick --strategies macd sma
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+from ..backtester import Backtester
+from ..benchmarks import (
+    BuyAndHoldStrategy,
+    KDJStrategy,
+    MACDStrategy,
+    RSIStrategy,
+    SMAStrategy,
+    ZMRStrategy,
+)
+from ..data_loader import DataLoader
+from ..multi_asset import MultiAssetBacktester
+from ..sources import SyntheticSource
+
+STRATEGIES = {
+    "buyhold": BuyAndHoldStrategy,
+    "macd": MACDStrategy,
+    "rsi": RSIStrategy,
+    "sma": SMAStrategy,
+    "kdj": KDJStrategy,
+    "zmr": ZMRStrategy,
+}
+MODES = ("event", "streaming", "vectorized")
+
+DEFAULT_BARS = [1_000, 10_000, 100_000]
+DEFAULT_TICKERS = [1, 10, 100]
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Synthetic bars are on consecutive calendar days from ORIGIN, which fits
+# 100k-bar series in the datetime64[ns] range
+ORIGIN = "1740-01-01"
+
+# History ahead of the first simulated bar (DataLoader adds a 365-day
+# indicator buffer)
+WARMUP_BARS = 400
+
+# Timings this close to the baseline never count as regressions, whatever
+# the threshold, so tiny cases do not fail on timer noise
+TIME_SLACK_S = 0.005
+
+
+def synthetic_loader() -> DataLoader:
+    """DataLoader over in-memory synthetic prices on a daily calendar from ORIGIN."""
+    return DataLoader(source=SyntheticSource(origin=ORIGIN, freq="D"))
+
+
+def period(n_bars: int) -> tuple:
+    """Start and end dates of a backtest over n_bars synthetic bars."""
+    start = pd.Timestamp(ORIGIN) + pd.Timedelta(days=WARMUP_BARS)
+    end = start + pd.Timedelta(days=n_bars - 1)
+    return start.to_pydatetime(), end.to_pydatetime()
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time a callable and trace its peak memory.
+
+    The callable runs once untimed to warm caches, `repeat` times for the
+    best wall time, then once more under tracemalloc (which slows it down)
+    for the peak allocation.
+
+    Returns:
+        Dictionary with wall_s and peak_mb
+    """
+    run()
+    wall = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        run()
+        wall = min(wall, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"wall_s": wall, "peak_mb": peak / 1e6}
+
+
+def run_suite(
+    bars: List[int] = DEFAULT_BARS,
+    tickers: List[int] = DEFAULT_TICKERS,
+    strategies: Optional[List[str]] = None,
+    modes: Optional[List[str]] = None,
+    portfolio_bars: int = 1_000,
+    event_max_bars: int = 1_000,
+    repeat: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Run the benchmark cases.
+
+    Args:
+        bars: Series lengths for single-ticker cases
+        tickers: Ticker counts for portfolio cases
+        strategies: Keys of STRATEGIES to run (default: all)
+        modes: Backtester simulation modes (default: all)
+        portfolio_bars: Series length for portfolio cases
+        event_max_bars: Longest series to run in event mode, whose cost
+            grows with the square of the series length
+        repeat: Timed runs per case
+
+    Returns:
+        List of case dictionaries (name, kind, strategy, mode, bars,
+        tickers, wall_s, peak_mb, bars_per_s)
+    """
+    strategies = strategies or list(STRATEGIES)
+    modes = modes or list(MODES)
+    data_loader = synthetic_loader()
+    cases = []
+
+    def record(case: Dict[str, Any], run: Callable[[], Any]):
+        print(f"  {case['name']}...", end=" ", flush=True)
+        case.update(measure(run, repeat))
+        case["bars_per_s"] = case["bars"] * case["tickers"] / case["wall_s"]
+        print(f"{case['wall_s'] * 1000:.1f} ms, {case['peak_mb']:.1f} MB")
+        cases.append(case)
+
+    backtester = Backtester(data_loader=data_loader, observers=[])
+    ticker = "SYN"
+    for n_bars in bars:
+        start, end = period(n_bars)
+        print(f"Single ticker, {n_bars} bars:")
+        for key in strategies:
+            for mode in modes:
+                if mode == "event" and n_bars > event_max_bars:
+                    continue
+                record(
+                    {
+                        "name": f"backtest/{key}/{mode}/{n_bars}",
+                        "kind": "backtest",
+                        "strategy": key,
+                        "mode": mode,
+                        "bars": n_bars,
+                        "tickers": 1,
+                    },
+                    lambda: backtester.run_backtest(
+                        ticker, start, end, STRATEGIES[key](), mode=mode
+                    ),
+                )
+
+    portfolio = MultiAssetBacktester(data_loader=data_loader, observers=[])
+    for n_tickers in tickers:
+        symbols = [f"SYN{i:03d}" for i in range(n_tickers)]
+        start, end = period(portfolio_bars)
+        print(f"Portfolio, {n_tickers} tickers x {portfolio_bars} bars:")
+        for key in strategies:
+            record(
+                {
+                    "name": f"portfolio/{key}/{n_tickers}x{portfolio_bars}",
+                    "kind": "portfolio",
+                    "strategy": key,
+                    "mode": "vectorized",
+                    "bars": portfolio_bars,
+                    "tickers": n_tickers,
+                },
+                lambda: portfolio.run_portfolio_backtest(
+                    symbols, start, end, strategy=STRATEGIES[key]
+                ),
+            )
+
+    return cases
+
+
+def environment() -> Dict[str, str]:
+    """Versions and machine details stored alongside a baseline."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+    }
+
+
+def save_baseline(cases: List[Dict[str, Any]], path: str):
+    """Write cases to a JSON baseline file (atomically)."""
+    payload = {
+        "created": pd.Timestamp.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "cases": cases,
+    }
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """Read a JSON baseline file."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(
+    cases: List[Dict[str, Any]],
+    baseline: Dict[str, Any],
+    threshold: float = 0.25,
+) -> pd.DataFrame:
+    """
+    Compare cases with a baseline.
+
+    Args:
+        cases: Output of run_suite()
+        baseline: Output of load_baseline()
+        threshold: Allowed relative increase in wall time and peak memory
+
+    Returns:
+        DataFrame indexed by case name with current and baseline values,
+        their ratios and a 'regression' flag; cases missing from the
+        baseline are left out
+    """
+    previous = {case["name"]: case for case in baseline["cases"]}
+    rows = {}
+    for case in cases:
+        base = previous.get(case["name"])
+        if base is None:
+            continue
+        slower = case["wall_s"] > base["wall_s"] * (1 + threshold) + TIME_SLACK_S
+        larger = case["peak_mb"] > base["peak_mb"] * (1 + threshold)
+        rows[case["name"]] = {
+            "wall_s": case["wall_s"],
+            "baseline_wall_s": base["wall_s"],
+            "time_ratio": case["wall_s"] / base["wall_s"],
+            "peak_mb": case["peak_mb"],
+            "baseline_peak_mb": base["peak_mb"],
+            "memory_ratio": case["peak_mb"] / base["peak_mb"] if base["peak_mb"] else 1.0,
+            "regression": slower or larger,
+        }
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backtesting performance benchmark suite")
+    parser.add_argument(
+        "--bars", type=int, nargs="+", default=DEFAULT_BARS,
+        help="Series lengths for single-ticker cases (default: 1000 10000 100000)",
+    )
+    parser.add_argument(
+        "--tickers", type=int, nargs="+", default=DEFAULT_TICKERS,
+        help="Ticker counts for portfolio cases (default: 1 10 100)",
+    )
+    parser.add_argument(
+        "--portfolio-bars", type=int, default=1_000,
+        help="Series length for portfolio cases (default: 1000)",
+    )
+    parser.add_argument(
+        "--strategies", nargs="+", choices=list(STRATEGIES), default=None,
+        help="Strategies to run (default: all)",
+    )
+    parser.add_argument(
+        "--modes", nargs="+", choices=list(MODES), default=None,
+        help="Simulation modes for single-ticker cases (default: all)",
+    )
+    parser.add_argument(
+        "--event-max-bars", type=int, default=1_000,
+        help="Longest series to run in event mode (default: 1000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: 3)")
+    parser.add_argument(
+        "--quick", action="store_true",
+        help="Small sizes only: 1000 bars, 1 and 10 tickers",
+    )
+    parser.add_argument(
+        "--baseline", type=str, default=DEFAULT_BASELINE,
+        help="Baseline JSON file (default: backtesting/perf/baseline.json)",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Write this run to the baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.25,
+        help="Allowed relative slowdown / memory growth (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    if args.quick:
+        args.bars, args.tickers = [1_000], [1, 10]
+
+    cases = run_suite(
+        bars=args.bars,
+        tickers=args.tickers,
+        strategies=args.strategies,
+        modes=args.modes,
+        portfolio_bars=args.portfolio_bars,
+        event_max_bars=args.event_max_bars,
+        repeat=args.repeat,
+    )
+
+    results = pd.DataFrame(cases).set_index("name")
+    print(f"\n{'=' * 80}")
+    print("PERFORMANCE SUITE")
+    print(f"{'=' * 80}")
+    print(
+        results[["wall_s", "peak_mb", "bars_per_s"]].to_string(
+            float_format=lambda x: f"{x:.4f}"
+        )
+    )
+
+    if args.save_baseline:
+        save_baseline(cases, args.baseline)
+        print(f"\nBaseline saved to: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    comparison = compare(cases, load_baseline(args.baseline), args.threshold)
+    if comparison.empty:
+        print("\nNo cases in common with the baseline")
+        return 0
+
+    regressions = comparison[comparison["regression"]]
+    print(f"\nCompared {len(comparison)} cases with {args.baseline}")
+    if regressions.empty:
+        print(f"No regressions beyond {args.threshold:.0%}")
+        return 0
+
+    print(f"\n{len(regressions)} regressions beyond {args.threshold:.0%}:")
+    print(
+        regressions[
+            ["wall_s", "baseline_wall_s", "time_ratio", "peak_mb", "baseline_peak_mb", "memory_ratio"]
+        ].to_string(float_format=lambda x: f"{x:.4f}")
+    )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,23 @@ Tracks positions, cash, and portfolio value over time.
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+# Trade ledger record layout; ticker is an index into Portfolio.tickers
+TRADE_DTYPE = np.dtype(
+    [
+        ("date", "M8[ns]"),
+        ("ticker", "i4"),
+        ("action", "i1"),
+        ("shares", "f8"),
+        ("price", "f8"),
+        ("value", "f8"),
+        ("realized_pnl", "f8"),
+    ]
+)
+BUY, SELL = 1, -1
+
 
 @dataclass
 class Position:
@@ -82,21 +97,103 @@ class Portfolio:
     Portfolio tracker for backtesting.
 
     Tracks cash, positions, and portfolio value over time.
-    Maintains a history of daily snapshots for analysis.
+    Daily history is stored column-wise in preallocated NumPy arrays (cash,
+    total value, and per-ticker shares, average cost and prices) that grow
+    geometrically, and trades go into a structured-array ledger, so
+    recording a day allocates no per-row Python objects.
     """
 
-    def __init__(self, initial_capital: float = 100000.0):
+    def __init__(self, initial_capital: float = 100000.0, capacity: int = 256):
         """
         Initialize portfolio with initial capital.
 
         Args:
             initial_capital: Starting cash amount (default: $100,000)
+            capacity: Number of daily snapshots to preallocate room for
         """
         self.initial_capital = initial_capital
         self.cash = initial_capital
         self.positions: Dict[str, Position] = {}
-        self.history: List[PortfolioSnapshot] = []
-        self.trades: List[Dict] = []
+
+        # Column index of each ticker in the per-ticker history arrays
+        self.tickers: List[str] = []
+        self._ticker_ids: Dict[str, int] = {}
+
+        capacity = max(capacity, 1)
+        self._n_days = 0
+        self._dates = np.empty(capacity, dtype="M8[ns]")
+        self._cash = np.empty(capacity)
+        self._total_value = np.empty(capacity)
+        self._shares = np.zeros((capacity, 0))
+        self._avg_price = np.zeros((capacity, 0))
+        self._prices = np.full((capacity, 0), np.nan)
+
+        self._n_trades = 0
+        self._ledger = np.empty(16, dtype=TRADE_DTYPE)
+
+        # Resolution of the recorded dates, used for the DataFrame indexes
+        self._date_unit: Optional[str] = None
+
+    def _to_datetime64(self, date: datetime) -> np.datetime64:
+        """Convert a date for storage, remembering the caller's resolution."""
+        timestamp = pd.Timestamp(date)
+        if self._date_unit is None:
+            self._date_unit = timestamp.unit
+        return timestamp.to_datetime64()
+
+    def _date_index(self, dates: np.ndarray) -> pd.DatetimeIndex:
+        """Wrap stored dates as an index in the recorded resolution."""
+        return pd.DatetimeIndex(dates.astype(f"M8[{self._date_unit}]"), name="date")
+
+    def _ticker_id(self, ticker: str) -> int:
+        """Get the history column for a ticker, adding one if needed."""
+        ticker_id = self._ticker_ids.get(ticker)
+        if ticker_id is None:
+            ticker_id = len(self.tickers)
+            self._ticker_ids[ticker] = ticker_id
+            self.tickers.append(ticker)
+            rows = len(self._dates)
+            self._shares = np.hstack([self._shares, np.zeros((rows, 1))])
+            self._avg_price = np.hstack([self._avg_price, np.zeros((rows, 1))])
+            self._prices = np.hstack([self._prices, np.full((rows, 1), np.nan)])
+        return ticker_id
+
+    def _grow_history(self):
+        """Double the capacity of the history arrays."""
+        rows = len(self._dates)
+        self._dates = np.concatenate([self._dates, np.empty(rows, dtype="M8[ns]")])
+        self._cash = np.concatenate([self._cash, np.empty(rows)])
+        self._total_value = np.concatenate([self._total_value, np.empty(rows)])
+        cols = len(self.tickers)
+        self._shares = np.vstack([self._shares, np.zeros((rows, cols))])
+        self._avg_price = np.vstack([self._avg_price, np.zeros((rows, cols))])
+        self._prices = np.vstack([self._prices, np.full((rows, cols), np.nan)])
+
+    def _record_trade(
+        self,
+        date: datetime,
+        ticker: str,
+        action: int,
+        shares: float,
+        price: float,
+        value: float,
+        realized_pnl: float = np.nan,
+    ):
+        """Append a trade to the ledger."""
+        if self._n_trades == len(self._ledger):
+            self._ledger = np.concatenate(
+                [self._ledger, np.empty(len(self._ledger), dtype=TRADE_DTYPE)]
+            )
+        self._ledger[self._n_trades] = (
+            self._to_datetime64(date),
+            self._ticker_id(ticker),
+            action,
+            shares,
+            price,
+            value,
+            realized_pnl,
+        )
+        self._n_trades += 1
 
     def get_position(self, ticker: str) -> Position:
         """Get or create position for ticker."""
@@ -126,16 +223,7 @@ class Portfolio:
         position = self.get_position(ticker)
         position.buy(shares, price)
 
-        self.trades.append(
-            {
-                "date": date,
-                "ticker": ticker,
-                "action": "BUY",
-                "shares": shares,
-                "price": price,
-                "value": cost,
-            }
-        )
+        self._record_trade(date, ticker, BUY, shares, price, cost)
 
         return True
 
@@ -161,17 +249,7 @@ class Portfolio:
 
         self.cash += proceeds
 
-        self.trades.append(
-            {
-                "date": date,
-                "ticker": ticker,
-                "action": "SELL",
-                "shares": shares,
-                "price": price,
-                "value": proceeds,
-                "realized_pnl": realized_pnl,
-            }
-        )
+        self._record_trade(date, ticker, SELL, shares, price, proceeds, realized_pnl)
 
         return True
 
@@ -185,47 +263,125 @@ class Portfolio:
 
     def record_snapshot(self, date: datetime, prices: Dict[str, float]):
         """Record daily portfolio snapshot."""
-        snapshot = PortfolioSnapshot(
-            date=date,
-            cash=self.cash,
-            positions={
-                ticker: Position(ticker, pos.shares, pos.avg_price)
-                for ticker, pos in self.positions.items()
-            },
-            prices=prices.copy(),
-        )
-        self.history.append(snapshot)
+        if self._n_days == len(self._dates):
+            self._grow_history()
+        row = self._n_days
+
+        self._dates[row] = self._to_datetime64(date)
+        self._cash[row] = self.cash
+        self._total_value[row] = self.get_total_value(prices)
+        for ticker, pos in self.positions.items():
+            ticker_id = self._ticker_id(ticker)
+            self._shares[row, ticker_id] = pos.shares
+            self._avg_price[row, ticker_id] = pos.avg_price
+        for ticker, price in prices.items():
+            ticker_id = self._ticker_id(ticker)
+            self._prices[row, ticker_id] = price
+
+        self._n_days += 1
 
     def get_history_df(self) -> pd.DataFrame:
         """Get portfolio history as DataFrame."""
-        if not self.history:
+        if self._n_days == 0:
             return pd.DataFrame()
 
-        data = []
-        for snapshot in self.history:
-            data.append(
-                {
-                    "date": snapshot.date,
-                    "cash": snapshot.cash,
-                    "total_value": snapshot.total_value(),
-                    "total_return": snapshot.total_return(self.initial_capital),
-                }
-            )
+        n = self._n_days
+        total_value = self._total_value[:n]
+        if self.initial_capital == 0:
+            total_return = np.zeros(n)
+        else:
+            total_return = (total_value - self.initial_capital) / self.initial_capital
 
-        df = pd.DataFrame(data)
-        df.set_index("date", inplace=True)
-        return df
+        return pd.DataFrame(
+            {
+                "cash": self._cash[:n],
+                "total_value": total_value,
+                "total_return": total_return,
+            },
+            index=self._date_index(self._dates[:n]),
+        )
+
+    def get_holdings_df(self) -> pd.DataFrame:
+        """Get daily shares held per ticker as DataFrame."""
+        if self._n_days == 0:
+            return pd.DataFrame()
+
+        return pd.DataFrame(
+            self._shares[: self._n_days],
+            index=self._date_index(self._dates[: self._n_days]),
+            columns=self.tickers,
+        )
 
     def get_trades_df(self) -> pd.DataFrame:
         """Get trades as DataFrame."""
-        if not self.trades:
+        if self._n_trades == 0:
             return pd.DataFrame()
 
-        df = pd.DataFrame(self.trades)
-        if not df.empty:
-            df.set_index("date", inplace=True)
+        ledger = self._ledger[: self._n_trades]
+        is_sell = ledger["action"] == SELL
+        df = pd.DataFrame(
+            {
+                "date": self._date_index(ledger["date"]),
+                "ticker": np.asarray(self.tickers, dtype=object)[ledger["ticker"]],
+                "action": np.where(is_sell, "SELL", "BUY").astype(object),
+                "shares": ledger["shares"],
+                "price": ledger["price"],
+                "value": ledger["value"],
+            }
+        )
+        # Only sells realize P&L; the column exists once there is one
+        if is_sell.any():
+            df["realized_pnl"] = ledger["realized_pnl"]
+        df.set_index("date", inplace=True)
         return df
 
+    @property
+    def trades(self) -> List[Dict]:
+        """Trades as a list of dicts (materialized from the ledger)."""
+        trades = []
+        for record in self._ledger[: self._n_trades]:
+            trade = {
+                "date": pd.Timestamp(record["date"]),
+                "ticker": self.tickers[record["ticker"]],
+                "action": "SELL" if record["action"] == SELL else "BUY",
+                "shares": float(record["shares"]),
+                "price": float(record["price"]),
+                "value": float(record["value"]),
+            }
+            if record["action"] == SELL:
+                trade["realized_pnl"] = float(record["realized_pnl"])
+            trades.append(trade)
+        return trades
+
+    @property
+    def history(self) -> List[PortfolioSnapshot]:
+        """Daily snapshots (materialized from the history arrays)."""
+        snapshots = []
+        for row in range(self._n_days):
+            positions = {
+                ticker: Position(
+                    ticker,
+                    float(self._shares[row, i]),
+                    float(self._avg_price[row, i]),
+                )
+                for i, ticker in enumerate(self.tickers)
+                if self._shares[row, i] != 0
+            }
+            prices = {
+                ticker: float(self._prices[row, i])
+                for i, ticker in enumerate(self.tickers)
+                if not np.isnan(self._prices[row, i])
+            }
+            snapshots.append(
+                PortfolioSnapshot(
+                    date=pd.Timestamp(self._dates[row]),
+                    cash=float(self._cash[row]),
+                    positions=positions,
+                    prices=prices,
+                )
+            )
+        return snapshots
+
     def get_current_allocation(self, prices: Dict[str, float]) -> Dict[str, float]:
         """Get current portfolio allocation by ticker."""
         total = self.get_total_value(prices)
@@ -0,0 +1,501 @@
+"""
+Queryable store of backtest results.
+
+Keeps every run in one SQLite database instead of four loose files per run:
+- runs: one row per run with ticker, strategy, parameters and all metrics
+- equity: daily cash and total value per run
+- trades, signals: per-run ledgers
+
+Runs are appended in bulk inside a single transaction, and the common
+questions ("top Sharpe per ticker", "equity curves of these runs") are
+single indexed queries.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+from .metrics import PerformanceMetrics
+
+# Metric columns of the runs table, in PerformanceMetrics field order
+METRIC_COLUMNS = (
+    "cumulative_return_pct",
+    "annualized_return_pct",
+    "sharpe_ratio",
+    "max_drawdown_pct",
+    "volatility_pct",
+    "num_trades",
+    "win_rate_pct",
+    "profit_factor",
+)
+
+RUN_COLUMNS = (
+    "ticker",
+    "strategy",
+    "params",
+    "start_date",
+    "end_date",
+    "initial_capital",
+    "final_value",
+    "total_return_pct",
+) + METRIC_COLUMNS + ("created_at",)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    strategy TEXT NOT NULL,
+    params TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    initial_capital REAL,
+    final_value REAL,
+    total_return_pct REAL,
+    cumulative_return_pct REAL,
+    annualized_return_pct REAL,
+    sharpe_ratio REAL,
+    max_drawdown_pct REAL,
+    volatility_pct REAL,
+    num_trades INTEGER,
+    win_rate_pct REAL,
+    profit_factor REAL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_ticker_strategy ON runs (ticker, strategy);
+CREATE INDEX IF NOT EXISTS runs_ticker_sharpe ON runs (ticker, sharpe_ratio);
+CREATE TABLE IF NOT EXISTS equity (
+    run_id INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    cash REAL,
+    total_value REAL,
+    PRIMARY KEY (run_id, date)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trades (
+    run_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    ticker TEXT,
+    action TEXT,
+    shares REAL,
+    price REAL,
+    value REAL,
+    realized_pnl REAL,
+    PRIMARY KEY (run_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS signals (
+    run_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    signal TEXT,
+    price REAL,
+    source TEXT,
+    PRIMARY KEY (run_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+def _dates(index: Iterable) -> List[str]:
+    """Format dates as YYYY-MM-DD strings."""
+    return pd.DatetimeIndex(index).strftime("%Y-%m-%d").tolist()
+
+
+def _column(df: pd.DataFrame, name: str, n: int) -> list:
+    """Column as a list of Python scalars, or Nones if it is missing."""
+    if name not in df.columns:
+        return [None] * n
+    values = df[name]
+    if values.dtype.kind == "f":
+        return [None if np.isnan(v) else v for v in values.tolist()]
+    return values.tolist()
+
+
+class ResultsStore:
+    """
+    SQLite store of backtest runs, equity curves, trades and signals.
+
+    Example:
+        store = ResultsStore("backtesting/results/results.db")
+        store.append_many(results_list)
+        store.append_sweep("AAPL", sweep_result)
+        best = store.top_runs("sharpe_ratio", n=1)
+        curves = store.equity_curves(best["run_id"].tolist())
+    """
+
+    def __init__(self, path: str = "backtesting/results/results.db"):
+        """
+        Open or create a results store.
+
+        Args:
+            path: SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writing
+
+    def append(
+        self, results: Dict[str, Any], params: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Store one backtest.
+
+        Args:
+            results: Results dictionary from Backtester.run_backtest() or a
+                sibling method
+            params: Strategy parameters to record with the run
+
+        Returns:
+            run_id of the stored run
+        """
+        return self.append_many([results], [params])[0]
+
+    def append_many(
+        self,
+        results_list: Sequence[Dict[str, Any]],
+        params_list: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> List[int]:
+        """
+        Store many backtests in one transaction.
+
+        Args:
+            results_list: Results dictionaries
+            params_list: Strategy parameters per run (optional)
+
+        Returns:
+            run_ids in input order
+        """
+        if params_list is None:
+            params_list = [None] * len(results_list)
+        if len(params_list) != len(results_list):
+            raise ValueError("params_list must have one entry per result")
+
+        run_ids = []
+        with self._conn:
+            for results, params in zip(results_list, params_list):
+                metrics = results["metrics"]
+                run_id = self._insert_run(
+                    ticker=results["ticker"],
+                    strategy=results["strategy"],
+                    params=params or {},
+                    start_date=results["start_date"],
+                    end_date=results["end_date"],
+                    initial_capital=results["initial_capital"],
+                    final_value=results["final_value"],
+                    total_return_pct=results["total_return_pct"],
+                    metrics={name: getattr(metrics, name) for name in METRIC_COLUMNS},
+                )
+                self._insert_equity(run_id, results["portfolio_history"])
+                self._insert_trades(run_id, results["trades"])
+                self._insert_signals(run_id, results["signals"])
+                run_ids.append(run_id)
+        return run_ids
+
+    def append_sweep(self, ticker: str, sweep_result) -> List[int]:
+        """
+        Store every grid point of a ParameterSweep in one transaction.
+
+        Equity curves and signals are written straight from the sweep's
+        arrays; sweeps keep no trade ledger.
+
+        Args:
+            ticker: Stock symbol the sweep ran on
+            sweep_result: SweepResult from ParameterSweep
+
+        Returns:
+            run_ids in grid order
+        """
+        dates = _dates(sweep_result.dates)
+        run_ids = []
+        with self._conn:
+            for i, row in enumerate(sweep_result.metrics.to_dict("records")):
+                equity = sweep_result.equity[i]
+                initial = float(equity[0]) if len(equity) else None
+                final = float(equity[-1]) if len(equity) else None
+                run_id = self._insert_run(
+                    ticker=ticker,
+                    strategy=row["strategy"],
+                    params=sweep_result.params[i],
+                    start_date=sweep_result.dates[0],
+                    end_date=sweep_result.dates[-1],
+                    initial_capital=initial,
+                    final_value=final,
+                    total_return_pct=row["cumulative_return_pct"],
+                    metrics={name: row.get(name) for name in METRIC_COLUMNS},
+                )
+                self._conn.executemany(
+                    "INSERT INTO equity (run_id, date, cash, total_value) "
+                    "VALUES (?, ?, NULL, ?)",
+                    zip([run_id] * len(dates), dates, equity.tolist()),
+                )
+                signals = sweep_result.signals[i]
+                days = np.flatnonzero(signals)
+                self._conn.executemany(
+                    "INSERT INTO signals (run_id, seq, date, signal, price, source) "
+                    "VALUES (?, ?, ?, ?, NULL, NULL)",
+                    (
+                        (run_id, seq, dates[j], "BUY" if signals[j] > 0 else "SELL")
+                        for seq, j in enumerate(days.tolist())
+                    ),
+                )
+                run_ids.append(run_id)
+        return run_ids
+
+    def _insert_run(
+        self,
+        ticker: str,
+        strategy: str,
+        params: Dict[str, Any],
+        start_date,
+        end_date,
+        initial_capital,
+        final_value,
+        total_return_pct,
+        metrics: Dict[str, Any],
+    ) -> int:
+        values = {
+            "ticker": ticker,
+            "strategy": strategy,
+            "params": json.dumps(params, sort_keys=True, default=str),
+            "start_date": pd.Timestamp(start_date).strftime("%Y-%m-%d"),
+            "end_date": pd.Timestamp(end_date).strftime("%Y-%m-%d"),
+            "initial_capital": initial_capital,
+            "final_value": final_value,
+            "total_return_pct": total_return_pct,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        for name in METRIC_COLUMNS:
+            value = metrics.get(name)
+            if value is not None and not isinstance(value, str):
+                value = value.item() if hasattr(value, "item") else value
+                if isinstance(value, float) and np.isnan(value):
+                    value = None
+            values[name] = value
+
+        placeholders = ", ".join("?" for _ in RUN_COLUMNS)
+        cursor = self._conn.execute(
+            f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) VALUES ({placeholders})",
+            [values[name] for name in RUN_COLUMNS],
+        )
+        return cursor.lastrowid
+
+    def _insert_equity(self, run_id: int, history: pd.DataFrame):
+        if history is None or history.empty:
+            return
+        n = len(history)
+        self._conn.executemany(
+            "INSERT INTO equity (run_id, date, cash, total_value) VALUES (?, ?, ?, ?)",
+            zip(
+                [run_id] * n,
+                _dates(history.index),
+                _column(history, "cash", n),
+                _column(history, "total_value", n),
+            ),
+        )
+
+    def _insert_trades(self, run_id: int, trades: pd.DataFrame):
+        if trades is None or trades.empty:
+            return
+        n = len(trades)
+        dates = _dates(trades["date"] if "date" in trades.columns else trades.index)
+        self._conn.executemany(
+            "INSERT INTO trades (run_id, seq, date, ticker, action, shares, price, "
+            "value, realized_pnl) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            zip(
+                [run_id] * n,
+                range(n),
+                dates,
+                _column(trades, "ticker", n),
+                _column(trades, "action", n),
+                _column(trades, "shares", n),
+                _column(trades, "price", n),
+                _column(trades, "value", n),
+                _column(trades, "realized_pnl", n),
+            ),
+        )
+
+    def _insert_signals(self, run_id: int, signals: pd.DataFrame):
+        if signals is None or signals.empty or "date" not in signals.columns:
+            return
+        n = len(signals)
+        self._conn.executemany(
+            "INSERT INTO signals (run_id, seq, date, signal, price, source) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            zip(
+                [run_id] * n,
+                range(n),
+                _dates(signals["date"]),
+                _column(signals, "signal", n),
+                _column(signals, "price", n),
+                _column(signals, "source", n),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Querying
+
+    def runs(
+        self,
+        ticker: Optional[str] = None,
+        strategy: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        List stored runs.
+
+        Args:
+            ticker: Only runs on this ticker
+            strategy: Only runs of this strategy
+
+        Returns:
+            DataFrame of runs rows, params decoded to dicts
+        """
+        clauses, args = [], []
+        if ticker is not None:
+            clauses.append("ticker = ?")
+            args.append(ticker)
+        if strategy is not None:
+            clauses.append("strategy = ?")
+            args.append(strategy)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._runs_frame(f"SELECT * FROM runs{where} ORDER BY run_id", args)
+
+    def top_runs(
+        self,
+        metric: str = "sharpe_ratio",
+        n: int = 1,
+        per: str = "ticker",
+        ascending: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Best runs by a metric within each group.
+
+        Args:
+            metric: Metric column to rank by
+            n: Runs to keep per group
+            per: Grouping column ('ticker', 'strategy' or 'ticker, strategy')
+            ascending: Rank lower values first (e.g. for max_drawdown_pct)
+
+        Returns:
+            DataFrame of runs rows with a rank column
+        """
+        if metric not in METRIC_COLUMNS + ("total_return_pct", "final_value"):
+            raise ValueError(f"Unknown metric {metric!r}")
+        groups = [column.strip() for column in per.split(",")]
+        if not set(groups) <= {"ticker", "strategy"}:
+            raise ValueError("per must name ticker and/or strategy")
+
+        order = "ASC" if ascending else "DESC"
+        query = f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY {', '.join(groups)}
+                    ORDER BY {metric} IS NULL, {metric} {order}, run_id
+                ) AS rank
+                FROM runs
+            )
+            WHERE rank <= ?
+            ORDER BY {', '.join(groups)}, rank
+        """
+        return self._runs_frame(query, [n])
+
+    def latest_runs(self, ticker: str) -> pd.DataFrame:
+        """
+        Most recent run of each strategy on a ticker.
+
+        Args:
+            ticker: Stock symbol
+
+        Returns:
+            DataFrame of runs rows in storage order
+        """
+        query = """
+            SELECT * FROM runs WHERE run_id IN (
+                SELECT MAX(run_id) FROM runs WHERE ticker = ? GROUP BY strategy
+            )
+            ORDER BY run_id
+        """
+        return self._runs_frame(query, [ticker])
+
+    def equity_curves(self, run_ids: Sequence[int]) -> pd.DataFrame:
+        """
+        Total-value curves of several runs.
+
+        Args:
+            run_ids: Runs to fetch
+
+        Returns:
+            DataFrame indexed by date with one column per run_id
+        """
+        run_ids = [int(run_id) for run_id in run_ids]
+        if not run_ids:
+            return pd.DataFrame()
+        placeholders = ", ".join("?" for _ in run_ids)
+        long = pd.read_sql_query(
+            f"SELECT run_id, date, total_value FROM equity "
+            f"WHERE run_id IN ({placeholders}) ORDER BY run_id, date",
+            self._conn,
+            params=run_ids,
+            parse_dates=["date"],
+        )
+        curves = long.pivot(index="date", columns="run_id", values="total_value")
+        return curves.reindex(columns=[r for r in run_ids if r in curves.columns])
+
+    def trades(self, run_id: int) -> pd.DataFrame:
+        """Trade ledger of a run, indexed by date."""
+        return self._ledger("trades", run_id)
+
+    def signals(self, run_id: int) -> pd.DataFrame:
+        """Signals of a run."""
+        return self._ledger("signals", run_id).reset_index()
+
+    def metrics(self, run_id: int) -> PerformanceMetrics:
+        """
+        Metrics of a run.
+
+        Args:
+            run_id: Stored run
+
+        Returns:
+            PerformanceMetrics as computed when the run was stored
+        """
+        row = self._conn.execute(
+            f"SELECT {', '.join(METRIC_COLUMNS)} FROM runs WHERE run_id = ?",
+            [int(run_id)],
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"No run with run_id {run_id}")
+        return PerformanceMetrics(**dict(zip(METRIC_COLUMNS, row)))
+
+    def _ledger(self, table: str, run_id: int) -> pd.DataFrame:
+        df = pd.read_sql_query(
+            f"SELECT * FROM {table} WHERE run_id = ? ORDER BY seq",
+            self._conn,
+            params=[int(run_id)],
+            parse_dates=["date"],
+        )
+        return df.drop(columns=["run_id", "seq"]).set_index("date")
+
+    def _runs_frame(self, query: str, args: list) -> pd.DataFrame:
+        df = pd.read_sql_query(query, self._conn, params=args)
+        df["params"] = df["params"].map(json.loads)
+        return df
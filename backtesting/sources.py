@@ -0,0 +1,292 @@
+"""
+Price data sources for DataLoader.
+
+A source returns daily OHLCV bars for a ticker and date range; DataLoader
+handles caching, merging and slicing on top of it.
+- YFinanceSource: Yahoo Finance through yfinance (the default)
+- SyntheticSource: seeded random prices generated in memory, for offline,
+  deterministic and arbitrarily large backtests
+"""
+
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict, List, Sequence
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+# Column order of yfinance Ticker.history() daily bars
+HISTORY_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+
+
+class PriceSource(ABC):
+    """Abstract base class for daily price sources."""
+
+    # Whether DataLoader should keep fetched bars in its on-disk cache.
+    # Sources that are cheaper to regenerate than to read are kept in memory.
+    persistent = True
+
+    @abstractmethod
+    def fetch(self, ticker: str, first: pd.Timestamp, last: pd.Timestamp) -> pd.DataFrame:
+        """
+        Fetch daily bars dated in [first, last].
+
+        Args:
+            ticker: Stock symbol
+            first: First date
+            last: Last date (inclusive)
+
+        Returns:
+            DataFrame with HISTORY_COLUMNS indexed by date (possibly empty)
+        """
+        pass
+
+    def fetch_many(
+        self, tickers: List[str], first: pd.Timestamp, last: pd.Timestamp
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily bars in [first, last] for several tickers.
+
+        Returns:
+            DataFrame per ticker; tickers without data are omitted
+        """
+        frames = {}
+        for ticker in tickers:
+            df = self.fetch(ticker, first, last)
+            if not df.empty:
+                frames[ticker] = df
+        return frames
+
+
+class YFinanceSource(PriceSource):
+    """Split- and dividend-adjusted daily bars from Yahoo Finance."""
+
+    def fetch(self, ticker: str, first: pd.Timestamp, last: pd.Timestamp) -> pd.DataFrame:
+        print(f"Downloading data for {ticker} from {first.date()} to {last.date()}...")
+
+        ticker_obj = yf.Ticker(ticker.upper())
+        return ticker_obj.history(
+            start=first.strftime("%Y-%m-%d"),
+            end=(last + timedelta(days=1)).strftime("%Y-%m-%d"),
+        )
+
+    def fetch_many(
+        self, tickers: List[str], first: pd.Timestamp, last: pd.Timestamp
+    ) -> Dict[str, pd.DataFrame]:
+        """Download several tickers in one grouped yfinance request."""
+        print(
+            f"Downloading data for {len(tickers)} tickers "
+            f"from {first.date()} to {last.date()}..."
+        )
+
+        raw = yf.download(
+            [ticker.upper() for ticker in tickers],
+            start=first.strftime("%Y-%m-%d"),
+            end=(last + timedelta(days=1)).strftime("%Y-%m-%d"),
+            group_by="ticker",
+            actions=True,
+            auto_adjust=True,
+            progress=False,
+            multi_level_index=True,
+        )
+        if raw is None or raw.empty:
+            return {}
+
+        frames = {}
+        symbols = set(raw.columns.get_level_values(0))
+        for ticker in tickers:
+            if ticker.upper() not in symbols:
+                continue
+            # Rows are the union of all symbols' dates; keep this symbol's own
+            df = raw[ticker.upper()].dropna(subset=["Close"])
+            if df.empty:
+                continue
+
+            # Same column order and dtypes as Ticker.history()
+            columns = [c for c in HISTORY_COLUMNS if c in df.columns]
+            columns += [c for c in df.columns if c not in HISTORY_COLUMNS]
+            df = df[columns].copy()
+            df.columns.name = None
+            if "Volume" in df.columns and not df["Volume"].isna().any():
+                df["Volume"] = df["Volume"].astype(np.int64)
+            frames[ticker] = df
+        return frames
+
+
+@dataclass(frozen=True)
+class Regime:
+    """A market regime of SyntheticSource."""
+
+    drift: float  # annualized expected log return
+    volatility: float  # annualized volatility of daily returns
+    mean_days: float  # average length of a stay in the regime, in bars
+
+
+# Bar calendars of SyntheticSource: business days or every calendar day
+CALENDARS = ("B", "D")
+
+# A calm up-trending market with occasional shorter, volatile sell-offs
+DEFAULT_REGIMES = (
+    Regime(drift=0.10, volatility=0.15, mean_days=250),
+    Regime(drift=-0.20, volatility=0.35, mean_days=60),
+)
+
+
+class SyntheticSource(PriceSource):
+    """
+    Seeded geometric Brownian motion with Markov regime switching.
+
+    Every ticker gets its own price path on a fixed calendar that starts
+    at origin. The path is generated in blocks of BLOCK bars, each from a
+    random stream keyed by (seed, ticker, block) and continuing the level
+    and regime the previous block ended in, so any date range of a ticker
+    is the same whichever range was asked for first. Bars are internally
+    consistent: Low <= min(Open, Close) <= max(Open, Close) <= High, and
+    volume rises with the size of the day's move.
+
+    Example:
+        loader = DataLoader(source=SyntheticSource(seed=7))
+        data = loader.load_data("ANY", datetime(2020, 1, 1), datetime(2024, 12, 31))
+    """
+
+    BLOCK = 4096
+    persistent = False
+
+    def __init__(
+        self,
+        seed: int = 0,
+        origin: str = "1970-01-01",
+        freq: str = "B",
+        regimes: Sequence[Regime] = DEFAULT_REGIMES,
+    ):
+        """
+        Initialize synthetic source.
+
+        Args:
+            seed: Seed shared by all tickers
+            origin: Date of the first bar of every ticker
+            freq: Bar calendar ('B' business days; 'D' calendar days fits
+                longer histories in the datetime64[ns] range)
+            regimes: Market regimes to switch between
+        """
+        if not regimes:
+            raise ValueError("At least one regime is required")
+        if freq not in CALENDARS:
+            raise ValueError(f"Unknown calendar {freq!r}, choose from {list(CALENDARS)}")
+        self.seed = seed
+        self.origin = pd.Timestamp(origin)
+        self.freq = freq
+        self.regimes = tuple(regimes)
+        self._drift = np.array([r.drift for r in self.regimes])
+        self._volatility = np.array([r.volatility for r in self.regimes])
+
+    def fetch(self, ticker: str, first: pd.Timestamp, last: pd.Timestamp) -> pd.DataFrame:
+        calendar = self.calendar(last)
+        start = calendar.searchsorted(np.datetime64(pd.Timestamp(first), "D"), side="left")
+        if start >= len(calendar):
+            return pd.DataFrame(
+                columns=HISTORY_COLUMNS, index=pd.DatetimeIndex([], name="Date")
+            )
+
+        path = self.generate(ticker, len(calendar))
+        return pd.DataFrame(
+            {name: values[start:] for name, values in path.items()},
+            index=pd.DatetimeIndex(calendar[start:].astype("datetime64[ns]"), name="Date"),
+        )
+
+    def calendar(self, last: pd.Timestamp) -> np.ndarray:
+        """
+        Bar dates from origin through last.
+
+        Returns:
+            datetime64[D] array
+        """
+        days = np.arange(
+            np.datetime64(self.origin, "D"),
+            np.datetime64(pd.Timestamp(last), "D") + 1,
+            dtype="datetime64[D]",
+        )
+        if self.freq == "B":
+            days = days[np.is_busday(days)]
+        return days
+
+    def generate(self, ticker: str, n_bars: int) -> Dict[str, np.ndarray]:
+        """
+        Generate the first n_bars bars of a ticker's path.
+
+        Args:
+            ticker: Stock symbol (case-insensitive)
+            n_bars: Number of bars from origin
+
+        Returns:
+            Dictionary of HISTORY_COLUMNS arrays
+        """
+        key = zlib.crc32(ticker.upper().encode())
+        rng = np.random.default_rng([self.seed, key])
+        level = float(np.exp(rng.normal(np.log(50.0), 0.8)))
+        volume = float(10 ** rng.uniform(5.0, 7.0))
+        regime = int(rng.integers(len(self.regimes)))
+
+        blocks = []
+        for block in range(-(-n_bars // self.BLOCK)):
+            # Third word keeps block streams apart from the per-ticker stream
+            rng = np.random.default_rng([self.seed, key, 1, block])
+            bars, level, regime = self._block(rng, level, regime, volume)
+            blocks.append(bars)
+
+        if not blocks:
+            return {name: np.empty(0) for name in HISTORY_COLUMNS}
+        return {
+            name: np.concatenate([bars[name] for bars in blocks])[:n_bars]
+            for name in HISTORY_COLUMNS
+        }
+
+    def _block(
+        self, rng: np.random.Generator, level: float, regime: int, volume: float
+    ) -> tuple:
+        """
+        Generate one block of bars.
+
+        Returns:
+            (bars, last close, last regime)
+        """
+        n = self.BLOCK
+
+        # Regime of each bar: geometric stays, then a jump to another regime
+        states = np.empty(n, dtype=np.intp)
+        pos = 0
+        while pos < n:
+            stay = int(rng.geometric(1.0 / self.regimes[regime].mean_days))
+            states[pos : pos + stay] = regime
+            pos += stay
+            if pos < n and len(self.regimes) > 1:
+                regime = (regime + 1 + int(rng.integers(len(self.regimes) - 1))) % len(
+                    self.regimes
+                )
+
+        dt = 1.0 / 252
+        drift = self._drift[states]
+        volatility = self._volatility[states]
+        daily_vol = volatility * np.sqrt(dt)
+        z = rng.standard_normal((5, n))
+
+        log_returns = (drift - 0.5 * volatility**2) * dt + daily_vol * z[0]
+        close = level * np.exp(np.cumsum(log_returns))
+        previous = np.concatenate(([level], close[:-1]))
+        open_ = previous * np.exp(0.25 * daily_vol * z[1])
+        high = np.maximum(open_, close) * np.exp(0.5 * daily_vol * np.abs(z[2]))
+        low = np.minimum(open_, close) * np.exp(-0.5 * daily_vol * np.abs(z[3]))
+        shares = volume * np.exp(0.3 * z[4]) * (1.0 + np.abs(log_returns) / daily_vol)
+
+        bars = {
+            "Open": open_,
+            "High": high,
+            "Low": low,
+            "Close": close,
+            "Volume": shares.astype(np.int64),
+            "Dividends": np.zeros(n),
+            "Stock Splits": np.zeros(n),
+        }
+        return bars, float(close[-1]), int(states[-1])
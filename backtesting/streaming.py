@@ -0,0 +1,259 @@
+"""
+Incremental indicator state for event-driven strategies.
+
+Each class here advances one bar at a time in O(1) (amortized for the
+rolling min/max) and follows the update rules of the matching pandas
+window kernel, so a strategy driven bar by bar through on_bar() emits the
+same signals as recomputing over the full history.
+"""
+
+import math
+from collections import deque
+from typing import NamedTuple, Deque, Tuple
+from datetime import datetime
+
+
+class Bar(NamedTuple):
+    """A single OHLCV bar."""
+
+    date: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+def safe_div(numerator: float, denominator: float) -> float:
+    """Divide with IEEE semantics (inf/NaN) instead of raising on zero."""
+    if denominator == 0:
+        if numerator == 0 or numerator != numerator:
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+class EWMState:
+    """
+    Exponentially weighted mean with adjust=False.
+
+    Mirrors pandas' ewm(com=..., adjust=False).mean(), including how NaN
+    inputs decay the weight of the previous value.
+    """
+
+    def __init__(self, com: float):
+        self.alpha = 1.0 / (1.0 + com)
+        self.reset()
+
+    @classmethod
+    def from_span(cls, span: float) -> "EWMState":
+        return cls(com=(span - 1) / 2.0)
+
+    def reset(self):
+        self.value = math.nan
+        self._old_wt = 1.0
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current mean."""
+        weighted = self.value
+        is_observation = x == x
+        if weighted == weighted:
+            self._old_wt *= 1.0 - self.alpha
+            if is_observation and weighted != x:
+                weighted = self._old_wt * weighted + self.alpha * x
+                weighted /= self._old_wt + self.alpha
+            if is_observation:
+                self._old_wt = 1.0
+        elif is_observation:
+            weighted = x
+        self.value = weighted
+        return weighted
+
+
+class RollingMeanState:
+    """
+    Fixed-window rolling mean backed by a ring buffer.
+
+    Mirrors pandas' rolling(window).mean(): Kahan-compensated running sum
+    with separate compensation terms for additions and removals.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        self._buffer: Deque[float] = deque()
+        self._nobs = 0
+        self._sum = 0.0
+        self._neg_ct = 0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_count = 0
+        self._prev_value = math.nan
+
+    def _add(self, val: float):
+        if val == val:
+            self._nobs += 1
+            y = val - self._comp_add
+            t = self._sum + y
+            self._comp_add = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, val) < 0:
+                self._neg_ct += 1
+            if val == self._prev_value:
+                self._same_count += 1
+            else:
+                self._same_count = 1
+            self._prev_value = val
+
+    def _remove(self, val: float):
+        if val == val:
+            self._nobs -= 1
+            y = -val - self._comp_remove
+            t = self._sum + y
+            self._comp_remove = t - self._sum - y
+            self._sum = t
+            if math.copysign(1.0, val) < 0:
+                self._neg_ct -= 1
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current mean (NaN until full)."""
+        if not self._buffer:
+            self._prev_value = x
+        self._buffer.append(x)
+        if len(self._buffer) > self.window:
+            self._remove(self._buffer.popleft())
+        self._add(x)
+
+        if len(self._buffer) < self.window or self._nobs < self.window:
+            return math.nan
+        result = self._sum / self._nobs
+        if self._same_count >= self._nobs:
+            result = self._prev_value
+        elif self._neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self._neg_ct == self._nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class RollingVarState:
+    """
+    Fixed-window rolling variance (ddof=1) backed by a ring buffer.
+
+    Mirrors pandas' rolling(window).var(): Welford updates with Kahan
+    compensation, separate for additions and removals. For very short
+    windows results can differ from pandas in the last few ulps.
+    """
+
+    def __init__(self, window: int, ddof: int = 1):
+        self.window = window
+        self.ddof = ddof
+        self.reset()
+
+    def reset(self):
+        self._buffer: Deque[float] = deque()
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_count = 0
+        self._prev_value = math.nan
+
+    def _add(self, val: float):
+        if val != val:
+            return
+        self._nobs += 1
+        if val == self._prev_value:
+            self._same_count += 1
+        else:
+            self._same_count = 1
+        self._prev_value = val
+
+        prev_mean = self._mean - self._comp_add
+        y = val - self._comp_add
+        t = y - self._mean
+        self._comp_add = t + self._mean - y
+        self._mean = self._mean + t / self._nobs
+        self._ssqdm = self._ssqdm + (val - prev_mean) * (val - self._mean)
+
+    def _remove(self, val: float):
+        if val != val:
+            return
+        self._nobs -= 1
+        if self._nobs:
+            prev_mean = self._mean - self._comp_remove
+            y = val - self._comp_remove
+            t = y - self._mean
+            self._comp_remove = t + self._mean - y
+            self._mean = self._mean - t / self._nobs
+            self._ssqdm = self._ssqdm - (val - prev_mean) * (val - self._mean)
+        else:
+            self._mean = 0.0
+            self._ssqdm = 0.0
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current variance (NaN until full)."""
+        if not self._buffer:
+            self._prev_value = x
+        self._buffer.append(x)
+        if len(self._buffer) > self.window:
+            self._remove(self._buffer.popleft())
+        self._add(x)
+
+        if (
+            len(self._buffer) < self.window
+            or self._nobs < self.window
+            or self._nobs <= self.ddof
+        ):
+            return math.nan
+        if self._nobs == 1 or self._same_count >= self._nobs:
+            return 0.0
+        return self._ssqdm / (self._nobs - self.ddof)
+
+    def std(self, x: float) -> float:
+        """Add an observation and return the current standard deviation."""
+        var = self.update(x)
+        if var != var:
+            return var
+        return 0.0 if var < 0 else math.sqrt(var)
+
+
+class RollingExtremeState:
+    """
+    Fixed-window rolling min or max using a monotonic deque.
+
+    Each value is pushed and popped at most once, so updates are
+    amortized O(1) regardless of the window length.
+    """
+
+    def __init__(self, window: int, mode: str = "max"):
+        if mode not in ("min", "max"):
+            raise ValueError(f"mode must be 'min' or 'max', got {mode!r}")
+        self.window = window
+        self.mode = mode
+        self.reset()
+
+    def reset(self):
+        self._deque: Deque[Tuple[int, float]] = deque()
+        self._count = 0
+
+    def update(self, x: float) -> float:
+        """Add an observation and return the current extreme (NaN until full)."""
+        i = self._count
+        self._count += 1
+        if self.mode == "max":
+            while self._deque and self._deque[-1][1] <= x:
+                self._deque.pop()
+        else:
+            while self._deque and self._deque[-1][1] >= x:
+                self._deque.pop()
+        self._deque.append((i, x))
+        while self._deque[0][0] <= i - self.window:
+            self._deque.popleft()
+
+        if self._count < self.window:
+            return math.nan
+        return self._deque[0][1]
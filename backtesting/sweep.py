@@ -0,0 +1,319 @@
+"""
+Vectorized parameter-grid sweeps for benchmark strategies.
+
+Evaluates every point of a parameter grid in one pass instead of
+constructing a strategy and re-running the daily loop per point:
+- Indicators are computed once per distinct window via a shared IndicatorCache
+- Signals and equity curves are laid out as (params x days) arrays
+- The all-in/all-out book is simulated for all grid points at once
+
+Each grid point produces the same equity curve and trades as
+Backtester.run_backtest() with that strategy; metrics are computed for all
+points at once by MetricsCalculator.calculate_batch_metrics() and agree with
+the per-run metrics up to floating-point rounding.
+"""
+
+import itertools
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Type
+import numpy as np
+import pandas as pd
+
+from .benchmarks import BaseStrategy
+from .data_loader import DataLoader, PriceSeries
+from .indicators import IndicatorCache
+from .metrics import MetricsCalculator
+
+# Encoding of the signals array
+HOLD, BUY, SELL = 0, 1, -1
+
+
+@dataclass
+class SweepResult:
+    """
+    Output of a parameter sweep.
+
+    Row i of signals/equity corresponds to params[i] and metrics.iloc[i].
+    """
+
+    strategy: str
+    params: List[Dict[str, Any]]
+    dates: pd.DatetimeIndex
+    signals: np.ndarray  # int8 (n_params, n_days): BUY=1, SELL=-1, HOLD=0
+    equity: np.ndarray  # float (n_params, n_days): total portfolio value
+    metrics: pd.DataFrame  # one row per grid point
+
+    def best(self, metric: str = "sharpe_ratio", ascending: bool = False) -> pd.Series:
+        """
+        Get the metrics row of the best grid point.
+
+        Args:
+            metric: Metrics column to rank by
+            ascending: Rank lower values first (e.g. for max_drawdown_pct)
+
+        Returns:
+            Metrics row of the best grid point
+        """
+        ranked = self.metrics.sort_values(metric, ascending=ascending, kind="stable")
+        return ranked.iloc[0]
+
+    def best_params(
+        self, metric: str = "sharpe_ratio", ascending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get the parameters of the best grid point.
+
+        Args:
+            metric: Metrics column to rank by
+            ascending: Rank lower values first (e.g. for max_drawdown_pct)
+
+        Returns:
+            Keyword arguments of the best grid point
+        """
+        ranked = self.metrics.sort_values(metric, ascending=ascending, kind="stable")
+        return self.params[ranked.index[0]]
+
+
+class ParameterSweep:
+    """
+    Evaluate a strategy over a whole parameter grid at once.
+
+    Example:
+        sweep = ParameterSweep()
+        result = sweep.run(
+            "AAPL", start, end, MACDStrategy,
+            {"fast_period": [8, 12], "slow_period": [21, 26], "signal_period": [9]},
+        )
+        print(result.metrics)
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 100000.0,
+        data_loader: Optional[DataLoader] = None,
+    ):
+        """
+        Initialize parameter sweep.
+
+        Args:
+            initial_capital: Starting portfolio value for every grid point
+            data_loader: DataLoader instance (creates new one on first use
+                if None; sweeps over preloaded data never need one)
+        """
+        self.initial_capital = initial_capital
+        self._data_loader = data_loader
+
+    @property
+    def data_loader(self) -> DataLoader:
+        """Loader used by run()."""
+        if self._data_loader is None:
+            self._data_loader = DataLoader()
+        return self._data_loader
+
+    @staticmethod
+    def expand_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+        """
+        Expand a parameter grid into its cartesian product.
+
+        Args:
+            grid: Mapping of constructor argument to candidate values
+
+        Returns:
+            List of keyword-argument dicts, last parameter varying fastest
+        """
+        names = list(grid)
+        return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+    def run(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_cls: Type[BaseStrategy],
+        grid: Dict[str, Sequence[Any]],
+    ) -> SweepResult:
+        """
+        Load data for a ticker and sweep a parameter grid over it.
+
+        Args:
+            ticker: Stock symbol
+            start_date: Start date for backtest
+            end_date: End date for backtest
+            strategy_cls: Strategy class supporting vectorized signals
+            grid: Mapping of constructor argument to candidate values
+
+        Returns:
+            SweepResult with per-point signals, equity curves and metrics
+        """
+        data = self.data_loader.load_data(ticker, start_date, end_date, copy=False)
+        return self.run_on_data(data, start_date, end_date, strategy_cls, grid)
+
+    def run_on_data(
+        self,
+        data: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_cls: Type[BaseStrategy],
+        grid: Dict[str, Sequence[Any]],
+        indicators: Optional[IndicatorCache] = None,
+    ) -> SweepResult:
+        """
+        Sweep a parameter grid over already-loaded price data.
+
+        Args:
+            data: Full historical price data (sorted by date)
+            start_date: Start date for backtest
+            end_date: End date for backtest
+            strategy_cls: Strategy class supporting vectorized signals
+            grid: Mapping of constructor argument to candidate values
+            indicators: Indicator cache over data, to share across sweeps
+
+        Returns:
+            SweepResult with per-point signals, equity curves and metrics
+        """
+        params = self.expand_grid(grid)
+        if not params:
+            raise ValueError("Parameter grid is empty")
+        strategies = [strategy_cls(**p) for p in params]
+        if not strategies[0].supports_vectorized:
+            raise ValueError(
+                f"Strategy {strategy_cls.__name__} does not support vectorized backtesting"
+            )
+
+        series = PriceSeries(data)
+        data = series.data
+        if indicators is None:
+            indicators = IndicatorCache(data)
+
+        # Same trading days as the backtester: bars in [start_date, end_date]
+        # with at least two rows of history
+        start, stop = series.bounds(start_date, end_date)
+        start = max(start, 1)
+        if stop <= start:
+            raise ValueError("No trading days found in specified range")
+
+        n_params, n_days = len(strategies), stop - start
+        entry = np.empty((n_params, n_days), dtype=bool)
+        exit_ = np.empty((n_params, n_days), dtype=bool)
+        positions = np.arange(start, stop)
+        for i, strategy in enumerate(strategies):
+            entry_i, exit_i = strategy.compute_entry_exit(data, indicators)
+            # Bars before the warm-up threshold always HOLD
+            warm = positions >= strategy.min_bars - 1
+            entry[i] = entry_i[start:stop] & warm
+            exit_[i] = exit_i[start:stop] & warm
+
+        signals, equity, num_trades, realized = self._simulate(
+            entry, exit_, series.close[start:stop]
+        )
+
+        batch = MetricsCalculator.calculate_batch_metrics(equity.T)
+        rows = []
+        for i, strategy in enumerate(strategies):
+            metrics = batch.iloc[i]
+            win_rate, profit_factor = self._trade_stats(realized[i])
+            rows.append(
+                {
+                    "strategy": strategy.name,
+                    **params[i],
+                    "final_value": equity[i, -1],
+                    "cumulative_return_pct": metrics["cumulative_return_pct"],
+                    "annualized_return_pct": metrics["annualized_return_pct"],
+                    "sharpe_ratio": metrics["sharpe_ratio"],
+                    "max_drawdown_pct": metrics["max_drawdown_pct"],
+                    "volatility_pct": metrics["volatility_pct"],
+                    # calculate_all_metrics() reports no trades for < 2 days
+                    "num_trades": int(num_trades[i]) if n_days >= 2 else 0,
+                    "win_rate_pct": win_rate if n_days >= 2 else None,
+                    "profit_factor": profit_factor if n_days >= 2 else None,
+                }
+            )
+
+        return SweepResult(
+            strategy=strategy_cls.__name__,
+            params=params,
+            dates=series.index[start:stop],
+            signals=signals,
+            equity=equity,
+            metrics=pd.DataFrame(rows),
+        )
+
+    def _simulate(
+        self,
+        entry: np.ndarray,
+        exit_: np.ndarray,
+        closes: np.ndarray,
+    ) -> tuple:
+        """
+        Run the position state machine and all-in/all-out book for all rows.
+
+        Follows the same arithmetic as Portfolio.buy()/sell() so equity
+        curves match a Backtester run exactly.
+
+        Returns:
+            Tuple of (signals, equity, per-row trade counts, per-row lists
+            of realized P&L of sells)
+        """
+        n_params, n_days = entry.shape
+        signals = np.zeros((n_params, n_days), dtype=np.int8)
+        equity = np.empty((n_params, n_days))
+
+        holding = np.zeros(n_params, dtype=bool)
+        cash = np.full(n_params, self.initial_capital)
+        shares = np.zeros(n_params)
+        avg_price = np.zeros(n_params)
+        num_trades = np.zeros(n_params, dtype=np.int64)
+        realized: List[List[float]] = [[] for _ in range(n_params)]
+
+        for j in range(n_days):
+            price = closes[j]
+            buy = entry[:, j] & ~holding
+            sell = exit_[:, j] & holding
+
+            if buy.any():
+                signals[buy, j] = BUY
+                # Invest all cash, as Backtester._execute_signal() does
+                filled = np.flatnonzero(buy & (cash > 0))
+                shares[filled] = cash[filled] / price
+                cost = shares[filled] * price
+                cash[filled] -= cost
+                avg_price[filled] = cost / shares[filled]
+                num_trades[filled] += 1
+
+            if sell.any():
+                signals[sell, j] = SELL
+                filled = np.flatnonzero(sell & (shares > 0))
+                pnl = shares[filled] * (price - avg_price[filled])
+                cash[filled] += shares[filled] * price
+                shares[filled] = 0.0
+                avg_price[filled] = 0.0
+                num_trades[filled] += 1
+                for i, value in zip(filled, pnl):
+                    realized[i].append(value)
+
+            holding ^= buy | sell
+            equity[:, j] = cash + shares * price
+
+        return signals, equity, num_trades, realized
+
+    @staticmethod
+    def _trade_stats(realized: List[float]) -> tuple:
+        """
+        Win rate and profit factor of one row's sells.
+
+        Matches MetricsCalculator.calculate_win_rate() and
+        calculate_profit_factor() on the equivalent trades DataFrame.
+
+        Returns:
+            (win_rate_pct, profit_factor), both None without sells
+        """
+        if not realized:
+            return None, None
+        pnl = np.asarray(realized)
+        win_rate = (pnl > 0).sum() / len(pnl) * 100
+        gross_profit = pnl[pnl > 0].sum()
+        gross_loss = abs(pnl[pnl < 0].sum())
+        if gross_loss == 0:
+            return win_rate, float("inf") if gross_profit > 0 else 0.0
+        return win_rate, gross_profit / gross_loss
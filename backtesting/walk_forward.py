@@ -0,0 +1,370 @@
+"""
+Walk-forward optimization for benchmark strategies.
+
+Splits a backtest period into rolling in-sample / out-of-sample windows:
+- Parameters are tuned on each in-sample window with a ParameterSweep
+- The winning parameters are traded on the following out-of-sample window
+- Out-of-sample equity curves are compounded into one curve
+
+All windows slice the same price frame and share one IndicatorCache, so an
+indicator series is computed once for the whole history rather than once
+per window. Windows are independent and can run in worker processes; each
+worker receives the warmed cache once, through the pool initializer.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Type
+import pandas as pd
+
+from .benchmarks import BaseStrategy
+from .data_loader import DataLoader, PriceSeries
+from .events import ConsoleReporter, EventDispatcher
+from .indicators import IndicatorCache
+from .metrics import MetricsCalculator, PerformanceMetrics
+from .sweep import ParameterSweep
+
+
+@dataclass
+class WalkForwardWindow:
+    """One in-sample / out-of-sample step of a walk-forward run."""
+
+    in_sample_start: pd.Timestamp
+    in_sample_end: pd.Timestamp
+    out_of_sample_start: pd.Timestamp
+    out_of_sample_end: pd.Timestamp
+    params: Dict[str, Any]  # best in-sample parameters
+    in_sample_score: float
+    out_of_sample_metrics: Dict[str, Any]
+    equity: pd.Series  # out-of-sample equity, starting from initial capital
+
+
+@dataclass
+class WalkForwardResult:
+    """Output of a walk-forward run."""
+
+    strategy: str
+    metric: str
+    windows: List[WalkForwardWindow]
+    equity: pd.Series  # compounded out-of-sample equity
+    metrics: PerformanceMetrics  # of the compounded curve
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Tabulate the windows.
+
+        Returns:
+            DataFrame with one row per window: dates, chosen parameters,
+            in-sample score and out-of-sample return and Sharpe
+        """
+        rows = []
+        for w in self.windows:
+            rows.append(
+                {
+                    "in_sample_start": w.in_sample_start.date(),
+                    "in_sample_end": w.in_sample_end.date(),
+                    "out_of_sample_start": w.out_of_sample_start.date(),
+                    "out_of_sample_end": w.out_of_sample_end.date(),
+                    **w.params,
+                    f"in_sample_{self.metric}": w.in_sample_score,
+                    "oos_return_pct": w.out_of_sample_metrics["cumulative_return_pct"],
+                    "oos_sharpe_ratio": w.out_of_sample_metrics["sharpe_ratio"],
+                }
+            )
+        return pd.DataFrame(rows)
+
+
+# Per-process state set by _init_worker()
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(data: pd.DataFrame, indicators: IndicatorCache, initial_capital: float):
+    """Share the price frame and warmed indicator cache with a worker."""
+    _WORKER["data"] = data
+    _WORKER["indicators"] = indicators
+    # Windows run on the shared frame, so the sweep never loads data
+    _WORKER["sweep"] = ParameterSweep(initial_capital)
+
+
+def _run_window_in_worker(args: tuple) -> WalkForwardWindow:
+    return _run_window(
+        _WORKER["sweep"], _WORKER["data"], _WORKER["indicators"], *args
+    )
+
+
+def _run_window(
+    sweep: ParameterSweep,
+    data: pd.DataFrame,
+    indicators: IndicatorCache,
+    strategy_cls: Type[BaseStrategy],
+    grid: Dict[str, Sequence[Any]],
+    dates: tuple,
+    metric: str,
+    ascending: bool,
+) -> WalkForwardWindow:
+    """
+    Tune on one in-sample window and trade the winner out of sample.
+
+    Args:
+        sweep: Sweep used for both periods
+        data: Full historical price data
+        indicators: Indicator cache over data
+        strategy_cls: Strategy class supporting vectorized signals
+        grid: Parameter grid
+        dates: (in-sample start, in-sample end, out-of-sample start,
+            out-of-sample end)
+        metric: Metrics column to select parameters by
+        ascending: Select the lowest value instead of the highest
+
+    Returns:
+        WalkForwardWindow with the out-of-sample equity curve
+    """
+    is_start, is_end, oos_start, oos_end = dates
+
+    tuned = sweep.run_on_data(data, is_start, is_end, strategy_cls, grid, indicators)
+    params = tuned.best_params(metric, ascending=ascending)
+    score = tuned.best(metric, ascending=ascending)[metric]
+
+    traded = sweep.run_on_data(
+        data,
+        oos_start,
+        oos_end,
+        strategy_cls,
+        {name: [value] for name, value in params.items()},
+        indicators,
+    )
+    metrics = traded.metrics.iloc[0].to_dict()
+
+    return WalkForwardWindow(
+        in_sample_start=is_start,
+        in_sample_end=is_end,
+        out_of_sample_start=oos_start,
+        out_of_sample_end=oos_end,
+        params=params,
+        in_sample_score=score,
+        out_of_sample_metrics=metrics,
+        equity=pd.Series(traded.equity[0], index=traded.dates, name="total_value"),
+    )
+
+
+class WalkForwardOptimizer:
+    """
+    Rolling in-sample tuning and out-of-sample evaluation of a strategy.
+
+    Example:
+        wfo = WalkForwardOptimizer()
+        result = wfo.run(
+            "AAPL", datetime(2018, 1, 1), datetime(2024, 12, 31), SMAStrategy,
+            {"short_period": [10, 20, 50], "long_period": [100, 150, 200]},
+            in_sample_days=504, out_of_sample_days=126, n_jobs=4,
+        )
+        print(result.summary())
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 100000.0,
+        data_loader: Optional[DataLoader] = None,
+        observers: Optional[List[Any]] = None,
+    ):
+        """
+        Initialize walk-forward optimizer.
+
+        Args:
+            initial_capital: Starting portfolio value
+            data_loader: DataLoader instance (creates new one if None)
+            observers: Event observers (see backtesting.events); defaults to
+                a ConsoleReporter, pass [] to run silently
+        """
+        self.initial_capital = initial_capital
+        self.data_loader = data_loader or DataLoader()
+        self.sweep = ParameterSweep(initial_capital, self.data_loader)
+        self.events = EventDispatcher(
+            [ConsoleReporter()] if observers is None else observers
+        )
+
+    @staticmethod
+    def split(
+        trading_days: pd.DatetimeIndex,
+        in_sample_days: int,
+        out_of_sample_days: int,
+        step_days: Optional[int] = None,
+    ) -> List[tuple]:
+        """
+        Split trading days into rolling windows.
+
+        Out-of-sample windows never overlap; the last one may be shorter
+        than the others.
+
+        Args:
+            trading_days: Trading days of the whole period
+            in_sample_days: Trading days per in-sample window
+            out_of_sample_days: Trading days per out-of-sample window
+            step_days: Days to roll forward per window, at least
+                out_of_sample_days (default: equal, giving back-to-back
+                test periods)
+
+        Returns:
+            List of (in-sample start, in-sample end, out-of-sample start,
+            out-of-sample end) dates
+        """
+        step_days = step_days or out_of_sample_days
+        if in_sample_days < 2 or out_of_sample_days < 1:
+            raise ValueError("Window lengths must be positive (in-sample at least 2)")
+        if step_days < out_of_sample_days:
+            raise ValueError("step_days must be at least out_of_sample_days")
+
+        windows = []
+        n_days = len(trading_days)
+        begin = 0
+        while begin + in_sample_days < n_days:
+            oos_begin = begin + in_sample_days
+            oos_stop = min(oos_begin + out_of_sample_days, n_days)
+            windows.append(
+                (
+                    trading_days[begin],
+                    trading_days[oos_begin - 1],
+                    trading_days[oos_begin],
+                    trading_days[oos_stop - 1],
+                )
+            )
+            begin += step_days
+        return windows
+
+    def run(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_cls: Type[BaseStrategy],
+        grid: Dict[str, Sequence[Any]],
+        in_sample_days: int = 252,
+        out_of_sample_days: int = 63,
+        step_days: Optional[int] = None,
+        metric: str = "sharpe_ratio",
+        ascending: bool = False,
+        n_jobs: int = 1,
+    ) -> WalkForwardResult:
+        """
+        Load data for a ticker and run a walk-forward optimization.
+
+        Args:
+            ticker: Stock symbol
+            start_date: Start of the first in-sample window
+            end_date: End of the last out-of-sample window
+            strategy_cls: Strategy class supporting vectorized signals
+            grid: Mapping of constructor argument to candidate values
+            in_sample_days: Trading days per in-sample window
+            out_of_sample_days: Trading days per out-of-sample window
+            step_days: Days to roll forward per window
+            metric: Metrics column to select parameters by
+            ascending: Select the lowest value (e.g. for max_drawdown_pct)
+            n_jobs: Worker processes (1 runs in-process)
+
+        Returns:
+            WalkForwardResult with per-window choices and compounded equity
+        """
+        data = self.data_loader.load_data(ticker, start_date, end_date, copy=False)
+        return self.run_on_data(
+            data,
+            start_date,
+            end_date,
+            strategy_cls,
+            grid,
+            in_sample_days=in_sample_days,
+            out_of_sample_days=out_of_sample_days,
+            step_days=step_days,
+            metric=metric,
+            ascending=ascending,
+            n_jobs=n_jobs,
+        )
+
+    def run_on_data(
+        self,
+        data: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_cls: Type[BaseStrategy],
+        grid: Dict[str, Sequence[Any]],
+        in_sample_days: int = 252,
+        out_of_sample_days: int = 63,
+        step_days: Optional[int] = None,
+        metric: str = "sharpe_ratio",
+        ascending: bool = False,
+        n_jobs: int = 1,
+    ) -> WalkForwardResult:
+        """
+        Run a walk-forward optimization over already-loaded price data.
+
+        Args:
+            data: Full historical price data
+            (remaining arguments as for run())
+
+        Returns:
+            WalkForwardResult with per-window choices and compounded equity
+        """
+        series = PriceSeries(data)
+        data = series.data
+        windows = self.split(
+            series.trading_days(start_date, end_date),
+            in_sample_days,
+            out_of_sample_days,
+            step_days,
+        )
+        if not windows:
+            raise ValueError(
+                f"Period has too few trading days for a {in_sample_days}-day "
+                "in-sample window"
+            )
+
+        # Compute every indicator the grid needs once, over the full history
+        indicators = IndicatorCache(data)
+        for params in ParameterSweep.expand_grid(grid):
+            strategy_cls(**params).compute_entry_exit(data, indicators)
+
+        tasks = [(strategy_cls, grid, dates, metric, ascending) for dates in windows]
+        self.events.message(
+            f"Walk-forward: {len(windows)} windows of {in_sample_days} in-sample / "
+            f"{out_of_sample_days} out-of-sample days"
+        )
+
+        if n_jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(n_jobs, len(tasks)),
+                initializer=_init_worker,
+                initargs=(data, indicators, self.initial_capital),
+            ) as executor:
+                results = list(executor.map(_run_window_in_worker, tasks))
+        else:
+            results = [
+                _run_window(self.sweep, data, indicators, *task) for task in tasks
+            ]
+
+        equity = self._stitch(results)
+        metrics = replace(
+            MetricsCalculator.calculate_all_metrics(equity),
+            num_trades=sum(int(w.out_of_sample_metrics["num_trades"]) for w in results),
+        )
+        return WalkForwardResult(
+            strategy=strategy_cls.__name__,
+            metric=metric,
+            windows=results,
+            equity=equity,
+            metrics=metrics,
+        )
+
+    def _stitch(self, windows: List[WalkForwardWindow]) -> pd.Series:
+        """
+        Compound out-of-sample curves into one.
+
+        Each window starts from initial capital, so its curve is scaled by
+        the value the previous windows ended at.
+        """
+        parts = []
+        value = self.initial_capital
+        for w in windows:
+            scaled = w.equity * (value / self.initial_capital)
+            parts.append(scaled)
+            value = scaled.iloc[-1]
+        return pd.concat(parts)
@@ -0,0 +1,159 @@
+"""
+Process-wide store of parsed OHLCV frames.
+
+Dataflow functions that need a symbol's price history go through one
+shared least-recently-used store instead of re-reading and re-parsing its
+CSV on every call. Frames are keyed by symbol and data version (the cache
+file's identity), so a rewritten file is loaded again and replaces the
+stale frame. Total memory is capped; hit, miss and eviction counts are
+kept for monitoring.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+import pandas as pd
+
+from .config import get_config
+
+DEFAULT_MAX_MB = 256
+
+
+def file_version(path: str) -> tuple:
+    """Version of a data file: changes whenever the file is rewritten."""
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+class FrameStore:
+    """
+    Thread-safe LRU store of DataFrames with a memory cap.
+
+    Returned frames are shared between callers and must be treated as
+    read-only (stockstats.wrap() copies before adding columns).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        """
+        Initialize store.
+
+        Args:
+            max_bytes: Memory cap over all stored frames (deep size)
+        """
+        self.max_bytes = max_bytes
+        self._frames: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        self._sizes: Dict[tuple, int] = {}
+        self._versions: Dict[str, Hashable] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def get(self, symbol: str, version: Hashable) -> Optional[pd.DataFrame]:
+        """Stored frame of a symbol at a version, or None."""
+        key = (symbol, version)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._frames.move_to_end(key)
+            return frame
+
+    def get_or_load(
+        self,
+        symbol: str,
+        version: Hashable,
+        load: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Stored frame of a symbol at a version, loading it on a miss.
+
+        Args:
+            symbol: Ticker symbol
+            version: Data version, e.g. file_version() of its cache file
+            load: Called without arguments to load the frame on a miss
+
+        Returns:
+            Shared, read-only DataFrame
+        """
+        frame = self.get(symbol, version)
+        if frame is None:
+            frame = load()
+            self.put(symbol, version, frame)
+        return frame
+
+    def put(self, symbol: str, version: Hashable, frame: pd.DataFrame):
+        """
+        Store a frame, replacing other versions of the symbol.
+
+        Frames larger than the whole cap are not stored.
+        """
+        key = (symbol, version)
+        size = int(frame.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            previous = self._versions.get(symbol)
+            if previous is not None:
+                self._drop((symbol, previous))
+            self._drop(key)
+            if size > self.max_bytes:
+                return
+
+            self._frames[key] = frame
+            self._sizes[key] = size
+            self._versions[symbol] = version
+            self.bytes += size
+
+            while self.bytes > self.max_bytes:
+                oldest = next(iter(self._frames))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def _drop(self, key: tuple):
+        if key in self._frames:
+            del self._frames[key]
+            self.bytes -= self._sizes.pop(key)
+            if self._versions.get(key[0]) == key[1]:
+                del self._versions[key[0]]
+
+    def clear(self):
+        """Remove every frame (counters are kept)."""
+        with self._lock:
+            self._frames.clear()
+            self._sizes.clear()
+            self._versions.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and memory use."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._frames),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_store: Optional[FrameStore] = None
+_store_lock = threading.Lock()
+
+
+def get_frame_store() -> FrameStore:
+    """The process-wide store, sized by config["frame_store_max_mb"]."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            max_mb = get_config().get("frame_store_max_mb", DEFAULT_MAX_MB)
+            _store = FrameStore(int(max_mb * 1024 * 1024))
+        return _store
@@ -0,0 +1,229 @@
+"""
+Disk cache for yfinance fundamentals, statements and insider transactions.
+
+Company data changes at most quarterly, yet every fundamentals tool used
+to build its own yf.Ticker and fetch on every call. Datasets are now kept
+per symbol in {SYMBOL}-fundamentals.json under the data cache directory,
+each with the time it was fetched and a time-to-live. When a requested
+dataset is missing or expired, one fetch pass on a pooled Ticker refreshes
+every expired dataset of the symbol, so the fundamentals analyst's
+sequence of tools costs a single fetch, or none while the cache is warm.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Annotated, Any, Dict, Optional
+import yfinance as yf
+
+from .config import get_config
+from .ohlcv_cache import _write_atomic
+
+# Dataset name -> Ticker attribute
+DATASETS = {
+    "info": "info",
+    "balance_sheet": "balance_sheet",
+    "quarterly_balance_sheet": "quarterly_balance_sheet",
+    "cashflow": "cashflow",
+    "quarterly_cashflow": "quarterly_cashflow",
+    "income_statement": "income_stmt",
+    "quarterly_income_statement": "quarterly_income_stmt",
+    "insider_transactions": "insider_transactions",
+}
+
+# Hours a fetched dataset stays valid; overridable per dataset through
+# config["fundamentals_ttl_hours"]
+DEFAULT_TTL_HOURS = {
+    "info": 24,
+    "balance_sheet": 24 * 7,
+    "quarterly_balance_sheet": 24 * 7,
+    "cashflow": 24 * 7,
+    "quarterly_cashflow": 24 * 7,
+    "income_statement": 24 * 7,
+    "quarterly_income_statement": 24 * 7,
+    "insider_transactions": 24,
+}
+
+# Pooled Ticker objects, least recently used first
+TICKER_POOL_SIZE = 64
+_tickers: "OrderedDict[str, yf.Ticker]" = OrderedDict()
+_tickers_lock = threading.Lock()
+
+# Loaded cache files by symbol. A lock per symbol serializes its refreshes
+# without making other symbols wait on the network; _entries_lock only
+# guards the two dictionaries.
+_entries: Dict[str, Dict[str, Any]] = {}
+_symbol_locks: Dict[str, threading.Lock] = {}
+_entries_lock = threading.Lock()
+
+
+def get_ticker(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    fresh: bool = False,
+) -> yf.Ticker:
+    """
+    Pooled yf.Ticker for a symbol.
+
+    Args:
+        symbol: Ticker symbol (case-insensitive)
+        fresh: Replace the pooled object, dropping the data yfinance
+            memoizes on it
+
+    Returns:
+        Ticker shared with other callers
+    """
+    symbol = symbol.upper()
+    with _tickers_lock:
+        ticker = None if fresh else _tickers.get(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol)
+            _tickers[symbol] = ticker
+        _tickers.move_to_end(symbol)
+        while len(_tickers) > TICKER_POOL_SIZE:
+            _tickers.popitem(last=False)
+        return ticker
+
+
+def get_dataset(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    dataset: str,
+) -> tuple:
+    """
+    A cached fundamentals dataset, refreshing expired datasets if needed.
+
+    Args:
+        symbol: Ticker symbol (case-insensitive)
+        dataset: Name from DATASETS
+
+    Returns:
+        (data, fetched) where data is the info dict or a statement rendered
+        as CSV text ("" when yfinance had none), and fetched is the
+        datetime it was retrieved
+
+    Raises:
+        ValueError: If the dataset name is unknown
+        Exception: Whatever yfinance raised, if the dataset was never fetched
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset {dataset!r}, choose from {list(DATASETS)}")
+    symbol = symbol.upper()
+
+    with _symbol_lock(symbol):
+        with _entries_lock:
+            entries = _entries.get(symbol)
+        if entries is None:
+            entries = _read_entries(symbol)
+            with _entries_lock:
+                _entries[symbol] = entries
+
+        if _is_expired(entries.get(dataset), dataset):
+            stale = [name for name in DATASETS if _is_expired(entries.get(name), name)]
+            fetched, errors = _fetch(symbol, stale)
+            entries.update(fetched)
+            if fetched:
+                _write_entries(symbol, entries)
+            if dataset in errors:
+                if dataset not in entries:
+                    raise errors[dataset]
+                print(f"Using expired {dataset} for {symbol}: {errors[dataset]}")
+
+        entry = entries[dataset]
+        return entry["data"], datetime.fromisoformat(entry["fetched"])
+
+
+def clear_cache(symbol: Optional[str] = None):
+    """Forget cached datasets and pooled tickers (one symbol, or all)."""
+    if symbol is not None:
+        symbols = {symbol.upper()}
+    else:
+        with _entries_lock:
+            symbols = set(_entries)
+        cache_dir = _cache_dir()
+        if os.path.isdir(cache_dir):
+            symbols.update(
+                name[: -len("-fundamentals.json")]
+                for name in os.listdir(cache_dir)
+                if name.endswith("-fundamentals.json")
+            )
+
+    for name in symbols:
+        with _symbol_lock(name):
+            with _entries_lock:
+                _entries.pop(name, None)
+            with _tickers_lock:
+                _tickers.pop(name, None)
+            path = _cache_file(name)
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def _symbol_lock(symbol: str) -> threading.Lock:
+    with _entries_lock:
+        return _symbol_locks.setdefault(symbol, threading.Lock())
+
+
+def _fetch(symbol: str, datasets: list) -> tuple:
+    """
+    Fetch datasets in one pass on a fresh pooled Ticker.
+
+    Returns:
+        (entries by dataset, exceptions by dataset that failed)
+    """
+    print(f"Fetching fundamentals for {symbol}...")
+    ticker = get_ticker(symbol, fresh=True)
+    fetched_at = datetime.now().isoformat(timespec="seconds")
+
+    entries = {}
+    errors = {}
+    for name in datasets:
+        try:
+            value = getattr(ticker, DATASETS[name])
+        except Exception as e:
+            errors[name] = e
+            continue
+        if name == "info":
+            data = dict(value or {})
+        elif value is None or value.empty:
+            data = ""
+        else:
+            data = value.to_csv()
+        entries[name] = {"fetched": fetched_at, "data": data}
+    return entries, errors
+
+
+def _is_expired(entry: Optional[Dict[str, Any]], dataset: str) -> bool:
+    if entry is None:
+        return True
+    ttl_hours = get_config().get("fundamentals_ttl_hours", {}).get(
+        dataset, DEFAULT_TTL_HOURS[dataset]
+    )
+    age = datetime.now() - datetime.fromisoformat(entry["fetched"])
+    return age >= timedelta(hours=ttl_hours)
+
+
+def _cache_dir() -> str:
+    return get_config()["data_cache_dir"]
+
+
+def _cache_file(symbol: str) -> str:
+    return os.path.join(_cache_dir(), f"{symbol}-fundamentals.json")
+
+
+def _read_entries(symbol: str) -> Dict[str, Any]:
+    path = _cache_file(symbol)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable fundamentals cache {path}: {e}")
+        return {}
+    return {name: entry for name, entry in entries.items() if name in DATASETS}
+
+
+def _write_entries(symbol: str, entries: Dict[str, Any]):
+    os.makedirs(_cache_dir(), exist_ok=True)
+    _write_atomic(_cache_file(symbol), lambda f: json.dump(entries, f, default=str))
@@ -0,0 +1,214 @@
+"""
+Incremental per-symbol OHLCV cache for the stockstats indicator path.
+
+Each symbol has one CSV of daily bars, {symbol}-YFin-data.csv, plus a
+small metadata file recording the last date the history was checked up
+to. A stale store only downloads the bars since its last stored date; that
+request overlaps the store by one bar, and if the overlapping Close no
+longer matches (Yahoo re-adjusted history for a split or dividend) the
+whole history is downloaded again.
+
+Parsed stores are shared in memory through frame_store. Indicator code
+reads them through as_of(), a point-in-time view that ends at the
+analysis date, so bars after that date are never computed on.
+"""
+
+import json
+import os
+import tempfile
+from typing import Annotated, Optional
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .frame_store import file_version, get_frame_store
+
+# Years of history downloaded for a symbol seen for the first time
+HISTORY_YEARS = 15
+
+# Relative Close tolerance for overlapping bars. Loose enough for CSV
+# round-trips, far tighter than any split or dividend adjustment.
+OVERLAP_RTOL = 1e-6
+
+# Bars kept before the first requested date when computing indicators on
+# an as_of() view. Covers the longest window (200 SMA) exactly. For the
+# recursive ones the truncated history shifts values by a relative amount:
+# MACD lines and ATR stay within 1e-7 of the price level, RSI within 1e-6
+# points. Absolute differences grow with price.
+INDICATOR_WARMUP_BARS = 250
+
+
+def ensure_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    cache_dir: Optional[str] = None,
+    through: Optional[str] = None,
+) -> str:
+    """
+    Bring a symbol's cached daily bars up to date.
+
+    Args:
+        symbol: Ticker symbol
+        cache_dir: Cache directory (default: config["data_cache_dir"])
+        through: Only bars up to this date (YYYY-mm-dd) are needed; a store
+            already checked through it is used as is (default: up to today)
+
+    Returns:
+        Path of the symbol's CSV store
+
+    Raises:
+        ValueError: If no data could be downloaded for a new symbol
+    """
+    if cache_dir is None:
+        cache_dir = get_config()["data_cache_dir"]
+    os.makedirs(cache_dir, exist_ok=True)
+
+    data_file = os.path.join(cache_dir, f"{symbol}-YFin-data.csv")
+    meta_file = os.path.join(cache_dir, f"{symbol}-YFin-data.meta.json")
+
+    # yfinance's end date is exclusive, so a download up to today holds
+    # every bar through yesterday
+    today = pd.Timestamp.today().normalize()
+    checked_through = today - pd.Timedelta(days=1)
+
+    meta = None
+    if os.path.exists(data_file) and os.path.exists(meta_file):
+        with open(meta_file, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        needed = checked_through
+        if through is not None:
+            needed = min(needed, pd.Timestamp(through).normalize())
+        if pd.Timestamp(meta["end"]) >= needed:
+            return data_file
+
+    stored = read_history(data_file) if meta is not None else None
+
+    if stored is None or stored.empty:
+        data = _download(symbol, today - pd.DateOffset(years=HISTORY_YEARS), today)
+        if data.empty:
+            raise ValueError(f"No price data found for {symbol}")
+    else:
+        new = _download(symbol, stored["Date"].iloc[-1], today)
+        if new.empty:
+            # Leave the store stale so the next call tries again
+            return data_file
+        data = _merge(stored, new)
+        if data is None:
+            print(f"Adjusted prices for {symbol} changed, refreshing cached history...")
+            data = _download(symbol, stored["Date"].iloc[0], today)
+            if data.empty:
+                return data_file
+
+    _write_atomic(data_file, lambda f: data.to_csv(f, index=False))
+    meta = {
+        "start": data["Date"].iloc[0].strftime("%Y-%m-%d"),
+        "end": checked_through.strftime("%Y-%m-%d"),
+    }
+    _write_atomic(meta_file, lambda f: json.dump(meta, f))
+    return data_file
+
+
+def load_history(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    data_file: str,
+) -> pd.DataFrame:
+    """
+    Parsed bars of a CSV store, shared through the process-wide FrameStore.
+
+    Returns:
+        Read-only DataFrame with a 'Date' column
+    """
+    return get_frame_store().get_or_load(
+        symbol, file_version(data_file), lambda: read_history(data_file)
+    )
+
+
+def as_of(
+    data: pd.DataFrame,
+    curr_date: str,
+    start_date: Optional[str] = None,
+    warmup_bars: int = INDICATOR_WARMUP_BARS,
+) -> pd.DataFrame:
+    """
+    Point-in-time view of bars as they were known on curr_date.
+
+    Args:
+        data: Bars sorted by 'Date', e.g. from load_history()
+        curr_date: Last visible date, YYYY-mm-dd
+        start_date: First date the caller needs; earlier bars are dropped
+            except for warmup_bars of indicator warm-up (default: keep all)
+        warmup_bars: Bars kept before start_date
+
+    Returns:
+        Row slice of data sharing its memory; read-only like data itself
+    """
+    dates = data["Date"].to_numpy()
+    end = dates.searchsorted(np.datetime64(pd.Timestamp(curr_date)), side="right")
+    start = 0
+    if start_date is not None:
+        first = dates.searchsorted(np.datetime64(pd.Timestamp(start_date)), side="left")
+        start = max(0, min(first, end) - warmup_bars)
+    return data.iloc[start:end]
+
+
+def read_history(data_file: str) -> pd.DataFrame:
+    """Read a CSV store written by ensure_history() with parsed dates."""
+    data = pd.read_csv(data_file)
+    data["Date"] = pd.to_datetime(data["Date"])
+    return data
+
+
+def _download(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Download daily bars in [start, end) with a 'Date' column."""
+    data = yf.download(
+        symbol,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    if data is None or data.empty:
+        return pd.DataFrame()
+
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    data.index.name = "Date"
+    return data.reset_index()
+
+
+def _merge(stored: pd.DataFrame, new: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Append downloaded bars to a store.
+
+    Returns:
+        Merged frame, or None if the bars overlapping the store disagree
+        on Close
+    """
+    old = stored.set_index("Date")["Close"]
+    overlap = new[new["Date"].isin(old.index)]
+    if len(overlap) and not np.allclose(
+        overlap["Close"].to_numpy(dtype=float),
+        old.loc[overlap["Date"]].to_numpy(dtype=float),
+        rtol=OVERLAP_RTOL,
+        atol=0.0,
+        equal_nan=True,
+    ):
+        return None
+
+    appended = new[new["Date"] > stored["Date"].iloc[-1]]
+    if appended.empty:
+        return stored
+    return pd.concat([stored, appended], ignore_index=True)
+
+
+def _write_atomic(path: str, write):
+    """Write a file through a temporary file so readers never see it partial."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
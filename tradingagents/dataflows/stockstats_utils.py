@@ -1,9 +1,8 @@
 import pandas as pd
-import yfinance as yf
 from stockstats import wrap
 from typing import Annotated
-import os
 from .config import get_config
+from .ohlcv_cache import as_of, ensure_history, load_history
 
 
 class StockstatsUtils:
@@ -19,40 +18,15 @@ class StockstatsUtils:
     ):
         config = get_config()
 
-        today_date = pd.Timestamp.today()
         curr_date_dt = pd.to_datetime(curr_date)
 
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-
-        # Ensure cache directory exists
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
+        curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
 
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
+        data_file = ensure_history(symbol, config["data_cache_dir"], through=curr_date_str)
+        data = as_of(load_history(symbol, data_file), curr_date_str, curr_date_str)
 
         df = wrap(data)
         df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-        curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
 
         df[indicator]  # trigger stockstats to calculate the indicator
         matching_rows = df[df["Date"].str.startswith(curr_date_str)]
@@ -37,3 +37,46 @@ def get_next_weekday(date):
         return next_weekday
     else:
         return date
+
+
+def format_indicator_table(
+    symbol: str,
+    table: pd.DataFrame,
+    start: str,
+    end: str,
+    descriptions: dict,
+    notes: list = (),
+) -> str:
+    """
+    Render several technical indicators over a date window as one report.
+
+    Args:
+        symbol: Ticker symbol
+        table: Formatted values, one column per indicator, indexed by
+            YYYY-mm-dd date strings, newest first
+        start: First date of the window
+        end: Last date of the window
+        descriptions: Description per indicator name
+        notes: Lines about indicators that could not be retrieved
+
+    Returns:
+        Markdown header, CSV table and one description line per indicator
+    """
+    if table.empty:
+        body = "No data available for the specified date range."
+    else:
+        body = table.to_csv(index_label="Date").strip()
+
+    parts = [
+        f"## Technical indicators for {symbol} from {start} to {end} (trading days only):",
+        body,
+    ]
+    if notes:
+        parts.append("\n".join(f"Note: {note}" for note in notes))
+    parts.append(
+        "\n".join(
+            f"- {name}: {descriptions.get(name, 'No description available.')}"
+            for name in table.columns
+        )
+    )
+    return "\n\n".join(parts)
@@ -1,9 +1,97 @@
-from typing import Annotated
+from typing import Annotated, Dict, List
+from collections import OrderedDict
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import yfinance as yf
+import numpy as np
+import pandas as pd
 import os
+from stockstats import wrap
+from .frame_store import file_version
+from .fundamentals_cache import get_dataset, get_ticker
+from .ohlcv_cache import as_of, ensure_history, load_history
 from .stockstats_utils import StockstatsUtils
+from .utils import format_indicator_table
+
+NOT_TRADING_DAY = "N/A: Not a trading day (weekend or holiday)"
+
+# Formatted indicator columns keyed by (symbol, indicator, data version,
+# first date, as-of date), least recently used first
+_indicator_cache: "OrderedDict[tuple, pd.Series]" = OrderedDict()
+_INDICATOR_CACHE_SIZE = 256
+
+# Indicators supported by the stockstats tools and their descriptions
+INDICATOR_DESCRIPTIONS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -14,8 +102,8 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
+    # Pooled ticker object
+    ticker = get_ticker(symbol)
 
     # Fetch historical data for the specified date range
     data = ticker.history(start=start_date, end=end_date)
@@ -55,113 +143,29 @@ def get_stock_stats_indicators_window(
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in INDICATOR_DESCRIPTIONS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(INDICATOR_DESCRIPTIONS.keys())}"
         )
 
     end_date = curr_date
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Optimized: Get stock data once and calculate indicators for all dates
+    # Optimized: Compute the indicator column once and reindex it to the window
     try:
-        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+        indicator_data = _get_stock_stats_bulk(
+            symbol, indicator, curr_date, before.strftime("%Y-%m-%d")
+        )
+
+        # Every calendar day from curr_date back to before, newest first
+        days = pd.date_range(before.date(), curr_date_dt.date(), freq="D")[::-1]
+        days = days.strftime("%Y-%m-%d")
+        values = indicator_data.reindex(days, fill_value=NOT_TRADING_DAY)
+
+        lines = days.to_numpy(dtype=object) + ": " + values.to_numpy(dtype=object)
+        ind_string = "".join(line + "\n" for line in lines)
+
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
@@ -178,93 +182,139 @@ def get_stock_stats_indicators_window(
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + INDICATOR_DESCRIPTIONS.get(indicator, "No description available.")
     )
 
     return result_str
 
 
+def get_stock_stats_indicators_batch(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[List[str], "technical indicators to get the analysis and report of"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """
+    Several stockstats indicators over one window as a single table.
+    The as-of price history is wrapped once for all indicators, and rows
+    are limited to trading days, newest first.
+    """
+    indicators = list(dict.fromkeys(indicators))
+    unsupported = [ind for ind in indicators if ind not in INDICATOR_DESCRIPTIONS]
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(INDICATOR_DESCRIPTIONS.keys())}"
+        )
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+    start, end = before.strftime("%Y-%m-%d"), curr_date_dt.strftime("%Y-%m-%d")
+
+    try:
+        columns = _indicator_columns(symbol, indicators, curr_date, start)
+        table = pd.DataFrame({ind: columns[ind] for ind in indicators})
+    except Exception as e:
+        print(f"Error getting bulk stockstats data: {e}")
+        # Fallback to one report per indicator
+        return "\n\n".join(
+            get_stock_stats_indicators_window(symbol, ind, curr_date, look_back_days)
+            for ind in indicators
+        )
+
+    # ISO date strings sort and compare like dates
+    in_window = (table.index >= start) & (table.index <= end)
+    table = table[in_window].sort_index(ascending=False)
+    return format_indicator_table(
+        symbol, table, start, curr_date, INDICATOR_DESCRIPTIONS
+    )
+
+
 def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
-    curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+    curr_date: Annotated[str, "current date for reference"],
+    start_date: Annotated[str, "first date needed, YYYY-mm-dd"] = None,
+) -> pd.Series:
     """
     Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    Computes the indicator column once on the bars known at curr_date
+    (from start_date minus a warm-up, or the whole history before it) and
+    memoizes it in-process, so repeated calls only cost a cache lookup.
+    Returns a Series of formatted values ("N/A" for missing) indexed by
+    date string.
+    """
+    return _indicator_columns(symbol, [indicator], curr_date, start_date)[indicator]
+
+
+def _indicator_columns(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: List[str],
+    curr_date: str,
+    start_date: str = None,
+) -> Dict[str, pd.Series]:
     """
+    Formatted columns of several indicators, as returned by _get_stock_stats_bulk.
+    Memoized columns are reused and all missing ones are computed on a
+    single stockstats frame over the as_of() view of the history.
+    """
+    data_file = _stock_data_file(symbol, curr_date)
+    version = file_version(data_file)
+
+    columns = {}
+    missing = []
+    for indicator in indicators:
+        key = (symbol, indicator, version, start_date, curr_date)
+        cached = _indicator_cache.get(key)
+        if cached is not None:
+            _indicator_cache.move_to_end(key)
+            columns[indicator] = cached
+        else:
+            missing.append(indicator)
+    if not missing:
+        return columns
+
+    # Zero-copy view without bars after curr_date; wrap() copies only these rows
+    df = wrap(as_of(load_history(symbol, data_file), curr_date, start_date))
+    dates = pd.Index(pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d"), name="Date")
+    keep = ~dates.duplicated(keep="last")
+
+    for indicator in missing:
+        # Calculate the indicator for all rows at once and format it as a column
+        values = np.asarray(df[indicator], dtype=float)
+        formatted = np.where(np.isnan(values), "N/A", values.astype(str)).astype(object)
+        result = pd.Series(formatted, index=dates, name=indicator)[keep]
+
+        _indicator_cache[(symbol, indicator, version, start_date, curr_date)] = result
+        if len(_indicator_cache) > _INDICATOR_CACHE_SIZE:
+            _indicator_cache.popitem(last=False)
+        columns[indicator] = result
+    return columns
+
+
+def _stock_data_file(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    curr_date: Annotated[str, "last date needed, YYYY-mm-dd"] = None,
+) -> str:
+    """Path of the price file for a symbol, brought up to curr_date when online."""
     from .config import get_config
-    import pandas as pd
-    from stockstats import wrap
-    import os
-    
+
     config = get_config()
     online = config["data_vendors"]["technical_indicators"] != "local"
-    
+
     if not online:
         # Local data path
-        try:
-            data = pd.read_csv(
-                os.path.join(
-                    config.get("data_cache_dir", "data"),
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                )
-            )
-            df = wrap(data)
-        except FileNotFoundError:
-            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-    else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
         data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
+            config.get("data_cache_dir", "data"),
+            f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
         )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
-        
-        df = wrap(data)
-        df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-    
-    # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+        if not os.path.exists(data_file):
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+        return data_file
+
+    # Online data fetching with an incremental per-symbol cache
+    return ensure_history(symbol, config["data_cache_dir"], through=curr_date)
 
 
 def get_stockstats_indicator(
@@ -299,8 +349,7 @@ def get_fundamentals(
 ):
     """Get company fundamentals overview from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        info = ticker_obj.info
+        info, fetched = get_dataset(ticker, "info")
 
         if not info:
             return f"No fundamentals data found for symbol '{ticker}'"
@@ -342,7 +391,7 @@ def get_fundamentals(
                 lines.append(f"{label}: {value}")
 
         header = f"# Company Fundamentals for {ticker.upper()}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {fetched.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
 
         return header + "\n".join(lines)
 
@@ -357,22 +406,17 @@ def get_balance_sheet(
 ):
     """Get balance sheet data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
+        dataset = "balance_sheet"
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
-        else:
-            data = ticker_obj.balance_sheet
-            
-        if data.empty:
+            dataset = "quarterly_" + dataset
+        csv_string, fetched = get_dataset(ticker, dataset)
+
+        if not csv_string:
             return f"No balance sheet data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
+
         # Add header information
         header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {fetched.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
         
         return header + csv_string
         
@@ -387,22 +431,17 @@ def get_cashflow(
 ):
     """Get cash flow data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
+        dataset = "cashflow"
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
-        else:
-            data = ticker_obj.cashflow
-            
-        if data.empty:
+            dataset = "quarterly_" + dataset
+        csv_string, fetched = get_dataset(ticker, dataset)
+
+        if not csv_string:
             return f"No cash flow data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
+
         # Add header information
         header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {fetched.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
         
         return header + csv_string
         
@@ -417,22 +456,17 @@ def get_income_statement(
 ):
     """Get income statement data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
+        dataset = "income_statement"
         if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
-        else:
-            data = ticker_obj.income_stmt
-            
-        if data.empty:
+            dataset = "quarterly_" + dataset
+        csv_string, fetched = get_dataset(ticker, dataset)
+
+        if not csv_string:
             return f"No income statement data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
+
         # Add header information
         header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {fetched.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
         
         return header + csv_string
         
@@ -445,18 +479,14 @@ def get_insider_transactions(
 ):
     """Get insider transactions data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        data = ticker_obj.insider_transactions
-        
-        if data is None or data.empty:
+        csv_string, fetched = get_dataset(ticker, "insider_transactions")
+
+        if not csv_string:
             return f"No insider transactions data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
+
         # Add header information
         header = f"# Insider Transactions data for {ticker.upper()}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        header += f"# Data retrieved on: {fetched.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
         
         return header + csv_string
         
@@ -7,6 +7,11 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # Memory cap of the shared in-process store of parsed price frames
+    "frame_store_max_mb": 256,
+    # Per-dataset hours before cached yfinance fundamentals are refetched,
+    # e.g. {"info": 6}; unset datasets use fundamentals_cache.DEFAULT_TTL_HOURS
+    "fundamentals_ttl_hours": {},
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "gpt-5.2",
@@ -36,6 +36,7 @@ from tradingagents.dataflows.config import set_config
 from tradingagents.agents.utils.agent_utils import (
     get_stock_data,  # Fetch stock price/volume data
     get_indicators,  # Fetch technical indicators (MACD, RSI, etc.)
+    get_indicators_batch,  # Fetch several technical indicators in one call
     get_fundamentals,  # Fetch company fundamentals/profile
     get_balance_sheet,  # Fetch balance sheet data
     get_cashflow,  # Fetch cash flow statement
@@ -95,6 +96,7 @@ class TradingAgentsGraph:
         """
         # Store initialization parameters as instance attributes
         self.debug = debug
+        self.selected_analysts = list(selected_analysts)
         # Use provided config or fall back to default, ensuring we have a valid config dict
         self.config = config or DEFAULT_CONFIG
         # Store callbacks for LLM/tool tracking (can be None)
@@ -253,6 +255,7 @@ class TradingAgentsGraph:
                 [
                     get_stock_data,  # Fetch OHLCV price data
                     get_indicators,  # Calculate technical indicators
+                    get_indicators_batch,  # Calculate several indicators at once
                 ]
             ),
             # Social Media Analyst tools: news sentiment analysis